@@ -49,6 +49,7 @@ export default function SignInScreen() {
         style={{ borderWidth: 1, borderColor: colors.border, borderRadius: 10, padding: 10, color: colors.text, backgroundColor: colors.surface }}
       />
       <Pressable
+        accessibilityRole="button"
         disabled={busy}
         onPress={runEmailSignIn}
         style={{ backgroundColor: colors.buttonPrimaryBackground, padding: 12, borderRadius: 10, opacity: busy ? 0.7 : 1 }}
@@ -56,6 +57,7 @@ export default function SignInScreen() {
         <Text style={{ color: colors.buttonPrimaryText, textAlign: "center" }}>{label}</Text>
       </Pressable>
       <Pressable
+        accessibilityRole="button"
         disabled={busy}
         onPress={() => runOAuth("apple")}
         style={{ backgroundColor: colors.buttonPrimaryBackground, padding: 12, borderRadius: 10, opacity: busy ? 0.7 : 1 }}
@@ -63,6 +65,7 @@ export default function SignInScreen() {
         <Text style={{ color: colors.buttonPrimaryText, textAlign: "center" }}>Continue with Apple</Text>
       </Pressable>
       <Pressable
+        accessibilityRole="button"
         disabled={busy}
         onPress={() => runOAuth("google")}
         style={{ backgroundColor: colors.tint, padding: 12, borderRadius: 10, opacity: busy ? 0.7 : 1 }}
@@ -24,6 +24,8 @@ export default function HomeScreen() {
         {(["ready", "loading", "empty", "error"] as HomeState[]).map((value) => (
           <Pressable
             key={value}
+            accessibilityRole="button"
+            accessibilityState={{ selected: state === value }}
             onPress={() => setState(value)}
             style={{
               backgroundColor: state === value ? colors.buttonPrimaryBackground : colors.buttonSecondaryBackground,
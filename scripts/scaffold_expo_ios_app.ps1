@@ -402,6 +402,22 @@ module.exports = function (api) {
 '@
   Write-Utf8NoBom -Path (Join-Path $ProjectDir "babel.config.js") -Content $babelContent
 
+  $metroContent = @'
+const { getDefaultConfig } = require("expo/metro-config");
+
+const config = getDefaultConfig(__dirname);
+
+config.transformer.getTransformOptions = async () => ({
+  transform: {
+    experimentalImportSupport: false,
+    inlineRequires: true,
+  },
+});
+
+module.exports = config;
+'@
+  Write-Utf8NoBom -Path (Join-Path $ProjectDir "metro.config.js") -Content $metroContent
+
   $eslintContent = @'
 const { defineConfig } = require("eslint/config");
 const expoConfig = require("eslint-config-expo/flat");
@@ -4,12 +4,32 @@
 from __future__ import annotations
 
 import argparse
+import array
+import bisect
+import codecs
+import contextlib
+import gzip
+import hashlib
+import io
 import json
+import math
+import os
+import plistlib
 import re
+import sqlite3
+import struct
+import subprocess
 import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Sequence
+from xml.etree import ElementTree
 
 
 PRD_REQUIREMENT_PATTERN = re.compile(r"^(FR-[A-Z0-9-]+|NFR-[0-9]+)$", re.IGNORECASE)
@@ -24,6 +44,207 @@ PLACEHOLDER_SCAN_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"\bmock data\b", re.IGNORECASE),
     re.compile(r"\btodo\b", re.IGNORECASE),
 )
+# Inline global flags ("(?i)") and numbered backreferences ("\1") in a pack pattern.
+PLACEHOLDER_PACK_UNSUPPORTED_PATTERN = re.compile(r"\(\?[aiLmsux]+\)|(?<!\\)(?:\\\\)*\\[1-9]")
+PLACEHOLDER_SCAN_REGEX = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in PLACEHOLDER_SCAN_PATTERNS),
+    re.IGNORECASE,
+)
+PLACEHOLDER_BASELINE_FORMAT = "expo-ios-validator-placeholder-baseline"
+
+# Every rule starts at a literal keyword so the regex engine can skip ahead
+# quickly; assignment rules carry the value in "<rule>_value".
+SECRET_SCAN_RULES: tuple[tuple[str, str], ...] = (
+    (
+        "github_token",
+        r"(?<![A-Za-z0-9_])(?:gh[pousr]_[A-Za-z0-9]{36,255}|github_pat_[A-Za-z0-9_]{22,255})\b",
+    ),
+    ("private_key", r"-----BEGIN (?:EC |RSA |OPENSSH |ENCRYPTED )?PRIVATE KEY-----"),
+    (
+        "expo_token",
+        r"EXPO_(?:ACCESS_)?TOKEN\b[\"']?[ \t]*[:=][ \t]*[\"'`]?"
+        r"(?P<expo_token_value>[A-Za-z0-9_\-]{20,})",
+    ),
+    (
+        "secret_assignment",
+        r"(?i:(?:token|secret|password|passwd|api_?key|private_?key|access_?key)[a-z0-9_]*\b"
+        r"[\"']?[ \t]*(?:=>|=|:)[ \t]*[\"'`]?"
+        r"(?P<secret_assignment_value>[A-Za-z0-9+/=_\-.~]{20,}))",
+    ),
+)
+SECRET_SCAN_REGEX = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECRET_SCAN_RULES)
+)
+# Every rule match contains one of these (lowercased) near its start, so only
+# windows around a trigger are run through SECRET_SCAN_REGEX.
+SECRET_TRIGGER_TERMS: tuple[str, ...] = (
+    "ghp_",
+    "gho_",
+    "ghu_",
+    "ghs_",
+    "ghr_",
+    "github_pat_",
+    "private key-----",
+    "token",
+    "secret",
+    "password",
+    "passwd",
+    "apikey",
+    "api_key",
+    "privatekey",
+    "private_key",
+    "accesskey",
+    "access_key",
+)
+SECRET_TRIGGER_REGEX = re.compile("|".join(re.escape(term) for term in SECRET_TRIGGER_TERMS))
+SECRET_WINDOW_BEFORE = 32
+SECRET_WINDOW_AFTER = 1024
+SECRET_MIN_ENTROPY = 4.0
+SECRET_HEX_MIN_ENTROPY = 3.0
+SECRET_PUBLIC_NAME_PREFIXES: tuple[str, ...] = ("EXPO_PUBLIC_",)
+SECRET_SCAN_EXTENSIONS: tuple[str, ...] = PLACEHOLDER_SCAN_EXTENSIONS + (
+    ".json",
+    ".md",
+    ".p8",
+    ".pem",
+    ".plist",
+    ".yml",
+    ".yaml",
+)
+SECRET_HISTORY_SKIPPED_SUFFIXES: frozenset[str] = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".ttf", ".otf", ".woff",
+        ".woff2", ".mp3", ".mp4", ".mov", ".zip", ".gz", ".pdf", ".lock",
+    }
+)
+SECRET_HISTORY_CACHE_FILE_NAME = "secret-history.json"
+
+SOURCE_SCAN_ROOTS: tuple[str, ...] = ("app", "src", "__tests__")
+SOURCE_SCAN_PRUNED_DIRS: frozenset[str] = frozenset({"node_modules", ".git", ".expo"})
+MINIFIED_FILE_NAME_PATTERN = re.compile(r"[.-](min|bundle|chunk)\.[cm]?jsx?$", re.IGNORECASE)
+MINIFIED_MEAN_LINE_LENGTH = 300
+SNIPPET_WIDTH = 140
+STREAMED_HASH_BYTES = 1024 * 1024
+INPUT_FINGERPRINT_FILES: tuple[str, ...] = (
+    "package.json",
+    "package-lock.json",
+    "app.json",
+    "app.config.ts",
+    "app.config.js",
+    "eas.json",
+    "tsconfig.json",
+    "metro.config.js",
+    "metro.config.cjs",
+    ".gitignore",
+    "skill.modules.json",
+    ".github/workflows/eas-ios.yml",
+    "release/human-inputs.md",
+)
+INPUT_FINGERPRINT_ROOTS: tuple[str, ...] = SOURCE_SCAN_ROOTS + (
+    "docs",
+    "release",
+    ".github",
+    "assets",
+)
+# Expo SDK major -> new architecture support; SDKs from the required version on
+# ship only the new architecture, SDKs older than the matrix do not support it.
+EXPO_NEW_ARCHITECTURE_MATRIX: dict[int, str] = {
+    50: "experimental",
+    51: "optional",
+    52: "default",
+    53: "default",
+    54: "default",
+}
+EXPO_NEW_ARCHITECTURE_REQUIRED_SDK = 55
+METRO_CONFIG_FILES: tuple[str, ...] = ("metro.config.js", "metro.config.cjs")
+UPDATES_NON_BLOCKING_CHECKS: frozenset[str] = frozenset({"NEVER", "ON_ERROR_RECOVERY"})
+REACT_NATIVE_IMAGE_COMPONENTS: frozenset[str] = frozenset({"Image", "ImageBackground"})
+REACT_NATIVE_IMPORT_PATTERN = re.compile(
+    r"\bimport\s+(?!type\b)(?:[A-Za-z_$][\w$]*\s*,\s*)?"
+    r"(?:\{([^}]*)\}|\*\s+as\s+([A-Za-z_$][\w$]*))\s*from\s*[\"']react-native[\"']"
+)
+SECRET_SCAN_ROOTS: tuple[str, ...] = SOURCE_SCAN_ROOTS + (
+    "release",
+    ".github",
+    "app.json",
+    "app.config.ts",
+    "app.config.js",
+    "eas.json",
+)
+LOCALIZATION_MESSAGES_DIR = "src/localization/messages"
+LOCALIZATION_BASE_LOCALE = "en"
+# Bundle files are named by locale code (en.ts, pt-BR.ts, zh_Hant.ts); index.ts
+# barrels and types.ts helpers in the same directory are not locales.
+LOCALIZATION_LOCALE_FILE_PATTERN = re.compile(r"^[a-z]{2,3}(?:[-_][A-Za-z0-9]{2,8})*$")
+LOCALIZATION_SCAN_ROOTS: tuple[str, ...] = ("app", "src")
+LOCALIZATION_CALL_PATTERN = re.compile(
+    r"(?<![\w$])(?<!function )t\(\s*(?:\"([^\"\\\n]*)\"|'([^'\\\n]*)'|`([^`\\$\n]*)`|(?=[^\s)]))"
+)
+MESSAGE_KEY_PATTERN = re.compile(
+    r"\s*(?:([A-Za-z_$][\w$]*)|\"((?:[^\"\\\n]|\\.)*)\"|'((?:[^'\\\n]|\\.)*)')\s*:(?!:)"
+)
+MESSAGES_OBJECT_PATTERN = re.compile(
+    r"\bexport\s+(?:const\s+[A-Za-z_$][\w$]*\s*(?::[^=]+)?=|default)\s*\{"
+)
+TSX_CODE_SPECIAL_PATTERN = re.compile(r"[\"'`/<{}]")
+TSX_CHILDREN_SPECIAL_PATTERN = re.compile(r"[<{]")
+TSX_NAME_PATTERN = re.compile(r"[A-Za-z_$][\w$.:-]*")
+# Characters and keywords after which "<" opens JSX and "/" opens a regex.
+TSX_EXPRESSION_PRECEDERS = frozenset("(,=:[!&|?{};>")
+TSX_EXPRESSION_KEYWORDS = frozenset(
+    {"return", "yield", "await", "default", "case", "else", "do", "in", "of", "typeof", "void"}
+)
+JSX_TOUCHABLE_TAGS: frozenset[str] = frozenset(
+    {
+        "Pressable",
+        "TouchableOpacity",
+        "TouchableHighlight",
+        "TouchableWithoutFeedback",
+        "TouchableNativeFeedback",
+    }
+)
+JSX_LABEL_PROPS: frozenset[str] = frozenset(
+    {"accessibilityLabel", "aria-label", "accessibilityLabelledBy", "aria-labelledby"}
+)
+JSX_INTERACTIVE_A11Y_PROPS: frozenset[str] = JSX_LABEL_PROPS | {"accessibilityRole", "role", "accessible"}
+JSX_IMAGE_A11Y_PROPS: frozenset[str] = JSX_LABEL_PROPS | {
+    "alt",
+    "accessible",
+    "accessibilityElementsHidden",
+    "importantForAccessibility",
+    "aria-hidden",
+}
+JSX_SCROLL_VIEW_TAGS: frozenset[str] = frozenset({"ScrollView", "KeyboardAwareScrollView"})
+JSX_VIRTUALIZED_LIST_TAGS: frozenset[str] = frozenset({"FlatList", "SectionList"})
+JSX_MAP_CALL_PATTERN = re.compile(r"\.map\s*\(")
+JSX_INLINE_FUNCTION_PATTERN = re.compile(
+    r"^(?:async\s+)?(?:function\b|(?:\([^()]*\)|[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>)"
+)
+PERFORMANCE_LINT_SEVERITIES = ("error", "warning", "off")
+# rule id -> (default severity, finding message)
+PERFORMANCE_LINT_RULES: dict[str, tuple[str, str]] = {
+    "scrollview-map": (
+        "error",
+        "renders a .map() list inside <{tag}>; use FlatList so rows are virtualized",
+    ),
+    "flatlist-key-extractor": ("error", "<{tag}> has no keyExtractor"),
+    "flatlist-get-item-layout": (
+        "warning",
+        "<{tag}> has no getItemLayout; rows are measured while scrolling",
+    ),
+    "inline-render-item": (
+        "warning",
+        "<{tag}> renderItem is an inline function; every render recreates it",
+    ),
+    "context-value-not-memoized": (
+        "error",
+        "<{tag}> value is rebuilt on every render; wrap it in useMemo",
+    ),
+}
+PERFORMANCE_SUPPRESSION_PATTERN = re.compile(
+    r"perf-lint-disable-(line|next-line)\b((?:[ \t]*,?[ \t]*[a-z][a-z-]*)*)"
+)
+SOURCE_REQUIREMENT_TAG_PATTERN = re.compile(r"\b(FR-[A-Z0-9]+(?:-[A-Z0-9]+)*|NFR-[0-9]+)\b")
 
 BASELINE_TEST_FILES: frozenset[str] = frozenset(
     {
@@ -39,6 +260,144 @@ IMPLEMENTED_STATUSES: frozenset[str] = frozenset(
 )
 
 DEFAULT_PRD_IMPLEMENTATION_REPORT_REL_PATH = "reports/prd-implementation.json"
+DEFAULT_CACHE_DIR_REL_PATH = ".expo/validator-cache"
+
+SKILL_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_ROOT = SKILL_ROOT / "assets" / "templates"
+TEMPLATE_FINGERPRINT_MANIFEST_PATH = TEMPLATE_ROOT / "template-fingerprints.json"
+TEMPLATE_FINGERPRINT_SOURCES: tuple[str, ...] = ("feature-modules/*", "testing")
+TEMPLATE_TOKENS: tuple[str, ...] = ("__APP_NAME__",)
+FILE_HASH_CACHE_NAME = "file-hashes.json"
+FILE_HASH_CACHE_VERSION = 2
+SCAN_RESUME_FILE_NAME = "scan-resume.json"
+LOCALIZATION_INDEX_CACHE_NAME = "localization-index.json"
+ASSET_INDEX_CACHE_NAME = "asset-index.json"
+PRIVACY_API_CACHE_NAME = "privacy-api-scan.json"
+PRIVACY_NATIVE_SOURCE_DIRS: tuple[str, ...] = ("ios", "apple")
+PRIVACY_NATIVE_SOURCE_EXTENSIONS: frozenset[str] = frozenset({".m", ".mm", ".swift"})
+# Required-reason API categories and the symbols that use them. Lowercase C
+# functions only count when called.
+PRIVACY_REQUIRED_REASON_APIS: dict[str, tuple[str, ...]] = {
+    "NSPrivacyAccessedAPICategoryUserDefaults": ("NSUserDefaults", "UserDefaults"),
+    "NSPrivacyAccessedAPICategoryFileTimestamp": (
+        "NSFileCreationDate",
+        "NSFileModificationDate",
+        "NSURLCreationDateKey",
+        "NSURLContentModificationDateKey",
+        "creationDateKey",
+        "contentModificationDateKey",
+        "fileCreationDate",
+        "fileModificationDate",
+        "getattrlist",
+        "getattrlistbulk",
+        "fgetattrlist",
+        "getattrlistat",
+        "stat",
+        "fstat",
+        "fstatat",
+        "lstat",
+    ),
+    "NSPrivacyAccessedAPICategorySystemBootTime": ("systemUptime", "mach_absolute_time"),
+    "NSPrivacyAccessedAPICategoryDiskSpace": (
+        "NSFileSystemFreeSize",
+        "NSFileSystemSize",
+        "NSURLVolumeAvailableCapacityKey",
+        "NSURLVolumeAvailableCapacityForImportantUsageKey",
+        "NSURLVolumeAvailableCapacityForOpportunisticUsageKey",
+        "NSURLVolumeTotalCapacityKey",
+        "volumeAvailableCapacityKey",
+        "volumeAvailableCapacityForImportantUsageKey",
+        "volumeAvailableCapacityForOpportunisticUsageKey",
+        "volumeTotalCapacityKey",
+        "systemFreeSize",
+        "systemSize",
+        "statfs",
+        "statvfs",
+        "fstatfs",
+        "fstatvfs",
+    ),
+    "NSPrivacyAccessedAPICategoryActiveKeyboards": ("activeInputModes",),
+}
+PRIVACY_API_SYMBOL_CATEGORIES: dict[str, str] = {
+    symbol: category
+    for category, symbols in PRIVACY_REQUIRED_REASON_APIS.items()
+    for symbol in symbols
+}
+PRIVACY_API_PATTERN = re.compile(
+    r"\b(?:("
+    + "|".join(
+        sorted((s for s in PRIVACY_API_SYMBOL_CATEGORIES if not s.islower()), key=len, reverse=True)
+    )
+    + r")\b|("
+    + "|".join(
+        sorted((s for s in PRIVACY_API_SYMBOL_CATEGORIES if s.islower()), key=len, reverse=True)
+    )
+    + r")(?=\s*\())"
+)
+# Words that document each category in the PRD privacy section.
+PRIVACY_API_PRD_TERMS: dict[str, tuple[str, ...]] = {
+    "NSPrivacyAccessedAPICategoryUserDefaults": ("userdefaults", "user defaults"),
+    "NSPrivacyAccessedAPICategoryFileTimestamp": ("file timestamp",),
+    "NSPrivacyAccessedAPICategorySystemBootTime": ("boot time", "uptime"),
+    "NSPrivacyAccessedAPICategoryDiskSpace": ("disk space",),
+    "NSPrivacyAccessedAPICategoryActiveKeyboards": ("keyboard",),
+}
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+NATIVE_PROJECT_PATTERN = re.compile(r"ios/([^/]+)\.xcodeproj/project\.pbxproj")
+# Unconditional build settings only; "KEY[sdk=...]" variants are ignored.
+PBXPROJ_SETTING_PATTERN = re.compile(r'^"?([A-Z][A-Z0-9_]*)"?\s*=\s*(.*?);$')
+BUILD_SETTING_REFERENCE_PATTERN = re.compile(r"\$\((\w+)(?::[^)]*)?\)|\$\{(\w+)\}")
+NATIVE_INFO_PLIST_KEYS: frozenset[str] = frozenset(
+    {"CFBundleIdentifier", "CFBundleShortVersionString", "CFBundleVersion", "UIBackgroundModes"}
+)
+ASSET_IMAGE_EXTENSIONS: frozenset[str] = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
+ASSET_REFERENCE_ROOTS: tuple[str, ...] = (
+    "app",
+    "src",
+    "app.json",
+    "app.config.ts",
+    "app.config.js",
+)
+ASSET_REFERENCE_EXTENSIONS: frozenset[str] = frozenset(
+    {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".json"}
+)
+ASSET_REFERENCE_PATTERN = re.compile(r"[\w@.+-]+\.(?:png|jpe?g|gif|webp)\b", re.IGNORECASE)
+ASSET_SCALE_SUFFIX_PATTERN = re.compile(r"@[23]x(?=\.\w+$)")
+ASSET_OVERSIZED_BYTES = 1024 * 1024
+# Longest side of the largest iOS screen (12.9" iPad Pro); larger images are
+# always downscaled when rendered.
+ASSET_MAX_RENDER_DIMENSION = 2732
+APP_STORE_ICON_SIZE = 1024
+ASSET_ICON_BUNDLE_SUFFIX = ".icon"
+# expo-splash-screen draws the image 200 pt wide by default: 600 px at @3x.
+ASSET_SPLASH_MIN_DIMENSION = 600
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_ALPHA_COLOR_TYPES = frozenset({4, 6})
+JPEG_START_OF_FRAME_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+JSX_LINT_CACHE_NAME = "jsx-lint.json"
+APP_CONFIG_CACHE_NAME = "app-config.json"
+APP_CONFIG_UNRESOLVED_REASON = (
+    "Could not resolve the app.config.ts default export to an object literal."
+)
+ROUTE_REFERENCE_CACHE_NAME = "route-references.json"
+DEEP_LINK_MODULE_PATH = "src/notifications/notificationDeepLink.ts"
+ROUTE_GROUP_PATTERN = re.compile(r"\((.+)\)")
+ROUTE_PLATFORM_SUFFIX_PATTERN = re.compile(r"\.(ios|android|native|web)$")
+# Stands for a template-literal segment; matches any static or dynamic segment.
+ROUTE_WILDCARD = "${}"
+ROUTE_CALL_PATTERN = re.compile(
+    r"(?:\brouter\s*\.\s*(?:push|replace|navigate|dismissTo|prefetch)\s*\(|\bhref\s*(?:=\s*\{?|:))"
+    r"\s*(?:\{[^{}]*?\bpathname\s*:\s*)?([\"'`])((?:\\.|(?!\1)[^\\\n])*)\1"
+)
+JS_TOKEN_PATTERN = re.compile(
+    r"0[xXbBoO][\da-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?"
+    r"|\.\.\.|=>|\?\?|\?\.|[A-Za-z_$][\w$]*|\S"
+)
+JS_INTEGER_PATTERN = re.compile(r"0[xXbBoO][\da-fA-F]+|\d+")
+JS_STRING_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+JS_STRING_ESCAPES: dict[str, str] = {"n": "\n", "r": "\r", "t": "\t", "0": "\0", "\n": ""}
+# Changes whenever the validator itself changes, invalidating shared cached results.
+VALIDATOR_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
 
 
 def utc_now_iso() -> str:
@@ -100,20 +459,113 @@ def check_app_json(app_json_path: Path) -> list[str]:
     return errors
 
 
-def check_app_config_ts(app_config_path: Path) -> list[str]:
+def check_app_config_ts(app_config: dict[str, Any] | None) -> list[str]:
+    """Check the parsed app.config.ts; keys set by an expression count as set.
+
+    A default export the parser cannot resolve (None) fails, since none of
+    the required fields can be confirmed.
+    """
+    if app_config is None:
+        return [APP_CONFIG_UNRESOLVED_REASON]
     errors: list[str] = []
-    content = app_config_path.read_text(encoding="utf-8-sig")
-    if not re.search(r"bundleIdentifier\s*:\s*['\"][^'\"]+['\"]", content):
+    is_set, bundle = app_config_field(app_config, "ios.bundleIdentifier")
+    if not is_set or not (bundle is None or (isinstance(bundle, str) and bundle.strip())):
         errors.append("app.config.ts is missing ios.bundleIdentifier.")
-    if not re.search(r"usesNonExemptEncryption\s*:\s*(true|false)", content):
+    is_set, uses_non_exempt = app_config_field(app_config, "ios.config.usesNonExemptEncryption")
+    if not is_set or not (uses_non_exempt is None or isinstance(uses_non_exempt, bool)):
         errors.append("app.config.ts is missing ios.config.usesNonExemptEncryption.")
-    if not re.search(r"userInterfaceStyle\s*:\s*['\"]automatic['\"]", content):
+    is_set, style = app_config_field(app_config, "userInterfaceStyle")
+    if style != "automatic" and not (is_set and style is None):
         errors.append('app.config.ts must set userInterfaceStyle to "automatic".')
-    if "expo-router" not in content:
+    is_set, plugins = app_config_field(app_config, "plugins")
+    if not (is_set and plugins is None) and not has_router_plugin(plugins):
         errors.append("app.config.ts is missing expo-router plugin reference.")
     return errors
 
 
+def expo_sdk_major(pkg: dict[str, Any] | None) -> int | None:
+    dependencies = pkg.get("dependencies") if isinstance(pkg, dict) else None
+    spec = dependencies.get("expo") if isinstance(dependencies, dict) else None
+    match = re.match(r"[~^>=v\s]*(\d+)", spec) if isinstance(spec, str) else None
+    return int(match.group(1)) if match else None
+
+
+def new_architecture_support(sdk_major: int) -> str:
+    if sdk_major >= EXPO_NEW_ARCHITECTURE_REQUIRED_SDK:
+        return "required"
+    return EXPO_NEW_ARCHITECTURE_MATRIX.get(sdk_major, "unsupported")
+
+
+def read_app_json_expo(project_dir: Path) -> dict[str, Any] | None:
+    app_json_path = project_dir / "app.json"
+    if not app_json_path.exists():
+        return None
+    try:
+        expo = load_json(app_json_path).get("expo")
+    except ValueError:
+        return None
+    return expo if isinstance(expo, dict) else None
+
+
+def expo_config_layers(
+    project_dir: Path, use_app_config_ts: bool, app_config_ts: dict[str, Any] | None
+) -> list[dict[str, Any]]:
+    """Return app.json's expo object, then app.config.ts's config in app.config.ts mode."""
+    layers = [read_app_json_expo(project_dir)]
+    if use_app_config_ts:
+        layers.append(app_config_ts)
+    return [layer for layer in layers if layer is not None]
+
+
+def read_runtime_config(
+    project_dir: Path, use_app_config_ts: bool, app_config_ts: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Return the runtime settings that affect startup and rendering performance.
+
+    Values come from app.json; in app.config.ts mode, values app.config.ts
+    sets override them.
+    """
+    config: dict[str, Any] = {
+        "jsEngines": [],
+        "newArchEnabled": None,
+        "checkAutomatically": None,
+        "fallbackToCacheTimeout": None,
+        "updatesEnabled": None,
+        "hasUpdatesConfig": False,
+        "plugins": [],
+    }
+    for expo in expo_config_layers(project_dir, use_app_config_ts, app_config_ts):
+        ios = expo.get("ios") if isinstance(expo.get("ios"), dict) else {}
+        engines = [
+            engine
+            for engine in (expo.get("jsEngine"), ios.get("jsEngine"))
+            if isinstance(engine, str) and engine
+        ]
+        if engines:
+            config["jsEngines"] = engines
+        for scope in (expo, ios):
+            if isinstance(scope.get("newArchEnabled"), bool):
+                config["newArchEnabled"] = scope["newArchEnabled"]
+        if "updates" in expo:
+            config["hasUpdatesConfig"] = True
+        updates = expo.get("updates")
+        if isinstance(updates, dict):
+            for key, field_name in (
+                ("checkAutomatically", "checkAutomatically"),
+                ("fallbackToCacheTimeout", "fallbackToCacheTimeout"),
+                ("enabled", "updatesEnabled"),
+            ):
+                if key in updates:
+                    config[field_name] = updates[key]
+        plugins = expo.get("plugins")
+        if isinstance(plugins, list):
+            config["plugins"].extend(
+                plugin[0] if isinstance(plugin, list) and plugin else plugin
+                for plugin in plugins
+            )
+    return config
+
+
 def check_eas_json(eas_path: Path) -> list[str]:
     errors: list[str] = []
     data = load_json(eas_path)
@@ -153,6 +605,47 @@ def is_placeholder_test_script(script: str) -> bool:
     return any(pattern in normalized for pattern in placeholder_patterns)
 
 
+class EventStream:
+    """NDJSON events written and flushed as soon as results are produced."""
+
+    def __init__(
+        self,
+        handle: Any,
+        context: dict[str, Any] | None = None,
+        lock: threading.Lock | None = None,
+    ) -> None:
+        self.handle = handle
+        self.context = context or {}
+        self.lock = lock or threading.Lock()
+
+    def bind(self, **context: Any) -> EventStream:
+        """Return a stream that adds ``context`` fields to every event."""
+        return EventStream(self.handle, {**self.context, **context}, self.lock)
+
+    def emit(self, event: str, payload: dict[str, Any]) -> None:
+        line = json.dumps({"event": event, **self.context, **payload}, sort_keys=True)
+        with self.lock:
+            self.handle.write(line + "\n")
+            self.handle.flush()
+
+
+class CheckList(list):
+    """Check results that record how long the work behind each check took.
+
+    With an event stream, every appended result is also emitted immediately.
+    """
+
+    def __init__(self, event: str = "check", events: EventStream | None = None) -> None:
+        super().__init__()
+        self.event = event
+        self.events = events
+
+    def append(self, check: dict[str, Any]) -> None:
+        super().append(check)
+        if self.events is not None:
+            self.events.emit(self.event, check)
+
+
 def add_check(
     checks: list[dict[str, Any]],
     check_id: str,
@@ -160,16 +653,23 @@ def add_check(
     blocking: str,
     result: str,
     reason: str = "",
+    started: float | None = None,
 ) -> None:
-    checks.append(
-        {
-            "id": check_id,
-            "name": name,
-            "blocking": blocking,
-            "result": result,
-            "reason": reason,
-        }
-    )
+    """Append a check; ``started`` is the monotonic time its work began."""
+    check = {
+        "id": check_id,
+        "name": name,
+        "blocking": blocking,
+        "result": result,
+        "reason": reason,
+    }
+    if isinstance(checks, CheckList) and started is not None:
+        check["durationMs"] = elapsed_ms(started)
+    checks.append(check)
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 3)
 
 
 def compute_infra_status(checks: list[dict[str, Any]]) -> str:
@@ -200,16 +700,30 @@ def compute_status(
     )
     if conditional_failed:
         return "partial"
+    if any(check["result"] == "partial" for check in checks):
+        return "partial"
     if feature_status == "partial":
         return "partial"
     return "pass"
 
 
+def compute_exit_code(status: str, checks: list[dict[str, Any]]) -> int:
+    """Budget-limited scans report partial coverage without blocking callers."""
+    if status == "pass":
+        return 0
+    if status == "partial" and all(
+        check["result"] in ("pass", "skipped", "partial") for check in checks
+    ):
+        return 0
+    return 1
+
+
 def print_check_result(check: dict[str, Any]) -> None:
     prefix = {
         "pass": "[OK]",
         "fail": "[FAIL]",
         "skipped": "[SKIP]",
+        "partial": "[PARTIAL]",
     }.get(check["result"], "[INFO]")
 
     if check.get("reason"):
@@ -263,8 +777,21 @@ def priority_rank(priority: str) -> int:
     return 9
 
 
-def extract_prd_requirements(prd_path: Path) -> list[dict[str, str]]:
-    content = prd_path.read_text(encoding="utf-8-sig")
+def extract_prd_requirements(
+    prd_path: Path, memo: ContentMemo | None = None
+) -> list[dict[str, str]]:
+    raw = prd_path.read_bytes()
+    if memo is None:
+        return parse_prd_requirements(raw.decode("utf-8-sig"))
+    digest = hashlib.sha256(raw).hexdigest()
+    hit, requirements = memo.get("prd-requirements", digest)
+    if not hit:
+        requirements = parse_prd_requirements(raw.decode("utf-8-sig"))
+        memo.put("prd-requirements", digest, requirements)
+    return [dict(item) for item in requirements]
+
+
+def parse_prd_requirements(content: str) -> list[dict[str, str]]:
     requirements_by_id: dict[str, dict[str, str]] = {}
 
     for line in content.splitlines():
@@ -305,7 +832,7 @@ def resolve_project_path(project_dir: Path, raw_path: str) -> tuple[Path | None,
     resolved = resolved.resolve()
     try:
         relative = resolved.relative_to(project_dir)
-    except ValueError:
+    except (ValueError, TypeError):
         return None, ""
     return resolved, relative.as_posix()
 
@@ -331,1337 +858,7564 @@ def normalize_str_list(value: Any) -> list[str]:
     return items
 
 
-def scan_placeholder_markers(project_dir: Path, limit: int = 20) -> list[str]:
-    findings: list[str] = []
-    roots = [project_dir / "app", project_dir / "src", project_dir / "__tests__"]
-    for root in roots:
-        if not root.exists() or not root.is_dir():
-            continue
-        for file_path in root.rglob("*"):
-            if (
-                not file_path.is_file()
-                or file_path.suffix.lower() not in PLACEHOLDER_SCAN_EXTENSIONS
-            ):
+class GitObjectReader:
+    """A single long-lived ``git cat-file`` batch process for object lookups."""
+
+    def __init__(self, repo_dir: Path) -> None:
+        self.process = subprocess.Popen(
+            ["git", "cat-file", "--batch-command", "--buffer"],
+            cwd=repo_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def request(
+        self, commands: list[tuple[str, str]]
+    ) -> list[tuple[str, str, int, bytes | None] | None]:
+        """Run ("info"|"contents", object) commands in one flush, in order."""
+        assert self.process.stdin and self.process.stdout
+        payload = "".join(f"{command} {name}\n" for command, name in commands)
+        self.process.stdin.write((payload + "flush\n").encode("utf-8"))
+        self.process.stdin.flush()
+        results: list[tuple[str, str, int, bytes | None] | None] = []
+        for command, _ in commands:
+            header = self.process.stdout.readline().decode("utf-8").rstrip("\n")
+            parts = header.split(" ")
+            if len(parts) != 3 or parts[2] in ("missing", "ambiguous"):
+                results.append(None)
                 continue
+            oid, object_type, size = parts[0], parts[1], int(parts[2])
+            content = None
+            if command == "contents":
+                content = self.process.stdout.read(size)
+                self.process.stdout.read(1)
+            results.append((oid, object_type, size, content))
+        return results
+
+    def close(self) -> None:
+        if self.process.stdin:
+            self.process.stdin.close()
+        self.process.wait()
+
+
+class GitStat(NamedTuple):
+    st_size: int
+    st_mtime: float = 0.0
+    st_mtime_ns: int = 0
+
+
+class GitRevisionTree:
+    """Virtual directory index of one project subtree at a git revision."""
+
+    def __init__(self, reader: GitObjectReader, revision: str, commit_id: str, prefix: str) -> None:
+        self.reader = reader
+        self.revision = revision
+        self.commit_id = commit_id
+        self.prefix = prefix
+        self.blobs: dict[str, str] = {}
+        self.directories: set[str] = set()
+        self.sizes: dict[str, int] = {}
+
+    @classmethod
+    def open(cls, project_dir: Path, revision: str) -> "GitRevisionTree":
+        repo_dir = find_git_worktree_root(project_dir)
+        if repo_dir is None:
+            raise ValueError(f"No git repository found above {project_dir}")
+        prefix = project_dir.relative_to(repo_dir).as_posix()
+        prefix = "" if prefix == "." else prefix
+        reader = GitObjectReader(repo_dir)
+        commit, tree = reader.request(
+            [("info", f"{revision}^{{commit}}"), ("contents", f"{revision}:{prefix}")]
+        )
+        if commit is None:
+            reader.close()
+            raise ValueError(f"Git revision not found: {revision}")
+        index = cls(reader, revision, commit[0], prefix)
+        if tree is not None and tree[1] == "tree":
+            index.load(tree[3] or b"")
+        return index
+
+    def load(self, root_tree: bytes) -> None:
+        """Expand tree objects level by level, like ``git ls-tree -r``."""
+        self.directories.add("")
+        level = [("", root_tree)]
+        while level:
+            subtrees: list[tuple[str, str]] = []
+            for directory, content in level:
+                for mode, name, oid in parse_git_tree(content, len(self.commit_id) // 2):
+                    relative = f"{directory}/{name}" if directory else name
+                    if mode == "40000":
+                        self.directories.add(relative)
+                        subtrees.append((relative, oid))
+                    elif mode != "160000":
+                        self.blobs[relative] = oid
+            results = self.reader.request([("contents", oid) for _, oid in subtrees])
+            level = [
+                (relative, result[3] or b"")
+                for (relative, _), result in zip(subtrees, results)
+                if result is not None
+            ]
+
+    def size(self, relative: str) -> int:
+        if not self.sizes and self.blobs:
+            paths = sorted(self.blobs)
+            results = self.reader.request([("info", self.blobs[path]) for path in paths])
+            self.sizes = {
+                path: result[2] for path, result in zip(paths, results) if result is not None
+            }
+        return self.sizes.get(relative, 0)
+
+    def read_bytes(self, relative: str) -> bytes:
+        oid = self.blobs.get(relative)
+        result = self.reader.request([("contents", oid)])[0] if oid else None
+        if result is None:
+            raise FileNotFoundError(f"{self.revision}:{relative}")
+        return result[3] or b""
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def parse_git_tree(content: bytes, digest_size: int = 20) -> list[tuple[str, str, str]]:
+    entries: list[tuple[str, str, str]] = []
+    index = 0
+    while index < len(content):
+        space = content.index(b" ", index)
+        nul = content.index(b"\0", space)
+        mode = content[index:space].decode("ascii")
+        name = content[space + 1 : nul].decode("utf-8", errors="surrogateescape")
+        oid = content[nul + 1 : nul + 1 + digest_size].hex()
+        entries.append((mode, name, oid))
+        index = nul + 1 + digest_size
+    return entries
+
+
+def find_git_worktree_root(path: Path) -> Path | None:
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+class GitRevisionPath:
+    """The pathlib subset the checks use, backed by a GitRevisionTree."""
+
+    def __init__(self, tree: GitRevisionTree, relative: str = "") -> None:
+        self.tree = tree
+        self.relative = relative
+
+    def __truediv__(self, other: str | Path) -> "GitRevisionPath | Path":
+        other_path = Path(other)
+        if other_path.is_absolute():
+            return other_path
+        joined = PurePosixPath(self.relative, other_path.as_posix()).as_posix()
+        return GitRevisionPath(self.tree, "" if joined == "." else joined)
+
+    def __str__(self) -> str:
+        full = "/".join(part for part in (self.tree.prefix, self.relative) if part)
+        return f"{self.tree.revision}:{full}"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, GitRevisionPath)
+            and other.tree is self.tree
+            and other.relative == self.relative
+        )
 
-            try:
-                content = file_path.read_text(encoding="utf-8-sig")
-            except UnicodeDecodeError:
+    def __hash__(self) -> int:
+        return hash(self.relative)
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self.relative).name
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.relative).suffix
+
+    @property
+    def object_id(self) -> str | None:
+        return self.tree.blobs.get(self.relative)
+
+    def resolve(self) -> "GitRevisionPath":
+        parts: list[str] = []
+        for part in self.relative.split("/"):
+            if part in ("", "."):
                 continue
+            if part == "..":
+                if not parts:
+                    return GitRevisionPath(self.tree, "../")
+                parts.pop()
+            else:
+                parts.append(part)
+        return GitRevisionPath(self.tree, "/".join(parts))
+
+    def relative_to(self, other: "GitRevisionPath") -> PurePosixPath:
+        if not isinstance(other, GitRevisionPath) or self.relative.startswith("../"):
+            raise ValueError(f"{self} is not within {other}")
+        if other.relative and not (
+            self.relative == other.relative or self.relative.startswith(other.relative + "/")
+        ):
+            raise ValueError(f"{self} is not within {other}")
+        return PurePosixPath(self.relative[len(other.relative) :].lstrip("/") or ".")
 
-            for line_number, line in enumerate(content.splitlines(), start=1):
-                for pattern in PLACEHOLDER_SCAN_PATTERNS:
-                    if not pattern.search(line):
-                        continue
-                    relative_path = file_path.relative_to(project_dir).as_posix()
-                    findings.append(
-                        f"{relative_path}:{line_number}: {line.strip()[:140]}"
-                    )
-                    break
-                if len(findings) >= limit:
-                    return findings
-    return findings
+    def as_posix(self) -> str:
+        return self.relative
 
+    def exists(self) -> bool:
+        return self.is_file() or self.is_dir()
 
-def load_prd_implementation_report(path: Path) -> dict[str, Any]:
-    report = load_json(path)
-    requirements = report.get("requirements")
-    if not isinstance(requirements, list):
-        raise ValueError(
-            f"{path} is missing 'requirements' array for PRD implementation mapping."
-        )
-    return report
+    def is_file(self) -> bool:
+        return self.relative in self.tree.blobs
 
+    def is_dir(self) -> bool:
+        return self.relative in self.tree.directories
 
-REQUIRED_HUMAN_INPUT_FIELDS: tuple[tuple[str, str], ...] = (
-    ("APP_NAME", "product-owner"),
-    ("IOS_BUNDLE_ID", "mobile-lead"),
-    ("ASC_APP_ID", "release-manager"),
-    ("ASC_SKU", "product-owner"),
-    ("PRIMARY_LANGUAGE", "product-owner"),
-    ("APPLE_DEV_MEMBERSHIP_ACTIVE", "release-manager"),
-    ("APP_STORE_CONNECT_ROLE_OK", "release-manager"),
-    ("EXPO_EAS_ACCESS_OK", "mobile-lead"),
-    ("GITHUB_REPO_READY", "mobile-lead"),
-    ("RELEASE_BRANCH", "mobile-lead"),
-    ("GITHUB_SECRET_EXPO_TOKEN", "release-manager"),
-    ("ASC_API_KEY_CONFIGURED", "release-manager"),
-    ("SUPPORT_URL", "product-owner"),
-    ("PRIVACY_POLICY_URL", "legal"),
-)
+    def stat(self) -> GitStat:
+        if not self.is_file():
+            raise FileNotFoundError(str(self))
+        return GitStat(st_size=self.tree.size(self.relative))
 
-YES_NO_HUMAN_INPUT_FIELDS: tuple[str, ...] = (
-    "APPLE_DEV_MEMBERSHIP_ACTIVE",
-    "APP_STORE_CONNECT_ROLE_OK",
-    "EXPO_EAS_ACCESS_OK",
-    "GITHUB_REPO_READY",
-    "ASC_API_KEY_CONFIGURED",
-    "SCREENSHOTS_READY",
-    "TESTFLIGHT_INTERNAL_TESTERS_READY",
-    "REVIEW_NOTES_READY",
-)
+    def read_bytes(self) -> bytes:
+        return self.tree.read_bytes(self.relative)
 
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
 
-def strip_optional_quotes(value: str) -> str:
-    normalized = value.strip()
-    if len(normalized) >= 2:
-        if normalized[0] == normalized[-1] and normalized[0] in ("'", '"'):
-            return normalized[1:-1].strip()
-    return normalized
+    def iter_files(self, roots: tuple[str, ...]) -> list[tuple[str, "GitRevisionPath"]]:
+        files: list[tuple[str, GitRevisionPath]] = []
+        # Same order as the working-tree walk: a directory's files before its subdirectories.
+        ordered = sorted(
+            self.tree.blobs, key=lambda path: (tuple(path.split("/")[:-1]), path)
+        )
+        for root in dict.fromkeys(roots):
+            if root in self.tree.blobs:
+                files.append((root, GitRevisionPath(self.tree, root)))
+                continue
+            for relative in ordered:
+                if not relative.startswith(root + "/"):
+                    continue
+                if SOURCE_SCAN_PRUNED_DIRS.intersection(relative.split("/")[:-1]):
+                    continue
+                files.append((relative, GitRevisionPath(self.tree, relative)))
+        return files
+
+
+@dataclass
+class SourceFile:
+    """One decoded source file shared by every detector in a scan pass."""
+
+    relative_path: str
+    suffix: str
+    content: str
+    first_line: int = 1
+    offsets: array.array | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_content(
+        cls, relative_path: str, content: str, first_line: int = 1
+    ) -> "SourceFile":
+        return cls(
+            relative_path=relative_path,
+            suffix=Path(relative_path).suffix.lower(),
+            content=content,
+            first_line=first_line,
+        )
 
+    @property
+    def line_offsets(self) -> Sequence[int]:
+        """Start offset of each line, built on first use (most chunks never need it)."""
+        if self.offsets is None:
+            self.offsets = array.array("q", [0])
+            self.offsets.extend(match.end() for match in re.finditer("\n", self.content))
+        return self.offsets
+
+    def line_bounds(self, index: int) -> tuple[int, int]:
+        start = self.line_offsets[index - 1]
+        end = (
+            self.line_offsets[index] - 1
+            if index < len(self.line_offsets)
+            else len(self.content)
+        )
+        return start, end
+
+    def line_number(self, offset: int) -> int:
+        return self.first_line - 1 + bisect.bisect_right(self.line_offsets, offset)
+
+    def line_text(self, line_number: int) -> str:
+        start, end = self.line_bounds(line_number - self.first_line + 1)
+        return self.content[start:end]
+
+    def snippet(self, offset: int, width: int = SNIPPET_WIDTH) -> str:
+        """Stripped line text around ``offset``, never copying more than a window.
+
+        Matches near the start of their line give the usual line prefix; matches
+        deep inside a long line give a window centred on the match.
+        """
+        start, end = self.line_bounds(bisect.bisect_right(self.line_offsets, offset))
+        head_end = min(end, start + 4 * width)
+        head = self.content[start:head_end].lstrip()
+        column = offset - (head_end - len(head))
+        if column + 20 <= width:
+            return head.strip()[:width]
+        left = max(start, offset - width // 3)
+        return self.content[left : min(end, left + width)].strip()
+
+
+@dataclass(frozen=True)
+class SourceScanLimits:
+    """Bounds that keep source scans memory-bounded whatever is committed."""
+
+    max_file_bytes: int = 4 * 1024 * 1024
+    max_line_length: int = 4096
+    chunk_bytes: int = 1024 * 1024
+    minified: str = "skip"
+
+    def looks_minified(self, relative_path: str, first_chunk: SourceFile) -> bool:
+        if MINIFIED_FILE_NAME_PATTERN.search(relative_path):
+            return True
+        if re.search(f"[^\n]{{{self.max_line_length + 1}}}", first_chunk.content):
+            return True
+        return (
+            len(first_chunk.content) >= 4096
+            and len(first_chunk.content) / (first_chunk.content.count("\n") + 1)
+            > MINIFIED_MEAN_LINE_LENGTH
+        )
 
-def parse_human_inputs_markdown(path: Path) -> dict[str, str]:
-    values: dict[str, str] = {}
-    content = path.read_text(encoding="utf-8-sig")
-    for line in content.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+    def cache_key(self) -> str:
+        return f"{self.max_file_bytes}:{self.max_line_length}:{self.chunk_bytes}:{self.minified}"
+
+
+def source_scan_limits(args: argparse.Namespace) -> SourceScanLimits:
+    return SourceScanLimits(
+        max_file_bytes=args.scan_max_file_bytes,
+        max_line_length=args.scan_max_line_length,
+        minified=args.scan_minified,
+    )
+
+
+def iter_file_blocks(file_path: Path | GitRevisionPath, block_bytes: int) -> Iterator[bytes]:
+    if isinstance(file_path, GitRevisionPath):
+        # Blobs arrive whole from cat-file; callers bound their size first.
+        raw = file_path.read_bytes()
+        for start in range(0, len(raw), block_bytes):
+            yield raw[start : start + block_bytes]
+        return
+    with file_path.open("rb") as handle:
+        while block := handle.read(block_bytes):
+            yield block
+
+
+def iter_source_chunks(
+    relative_path: str,
+    file_path: Path | GitRevisionPath,
+    chunk_bytes: int,
+    raw: bytes | None = None,
+) -> Iterator[SourceFile]:
+    """Yield decoded, line-aligned chunks so a large file is never held whole.
+
+    A chunk ends at its last newline. A line longer than a whole chunk is cut
+    and continues in the next chunk under the same line number.
+    """
+    if raw is not None:
+        yield SourceFile.from_content(relative_path, raw.decode("utf-8-sig"))
+        return
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    first_line = 1
+    emitted = False
+    for block in iter_file_blocks(file_path, chunk_bytes):
+        pending += decoder.decode(block)
+        if len(pending) < chunk_bytes:
             continue
-        match = re.match(r"^([A-Z0-9_]+)\s*=\s*(.*)$", stripped)
-        if not match:
+        cut = pending.rfind("\n") + 1 or len(pending)
+        chunk, pending = pending[:cut], pending[cut:]
+        yield SourceFile.from_content(relative_path, chunk, first_line)
+        first_line += chunk.count("\n")
+        emitted = True
+    pending += decoder.decode(b"", final=True)
+    if pending or not emitted:
+        yield SourceFile.from_content(relative_path, pending, first_line)
+
+
+@dataclass
+class SourceDetector:
+    """A source rule registered for file extensions under the scan roots."""
+
+    name: str
+    extensions: tuple[str, ...]
+    detect: Callable[[SourceFile, "SourceDetector"], None]
+    roots: tuple[str, ...] = SOURCE_SCAN_ROOTS
+    limit: int = 20
+    memo_key: str = ""
+    check_id: str = ""
+    findings: list[str] = field(default_factory=list)
+    events: EventStream | None = None
+    baseline: FindingBaseline | None = None
+    suppressed: list[str] = field(default_factory=list)
+    line_records: list[dict[str, Any]] | None = None
+
+    @property
+    def full(self) -> bool:
+        return len(self.findings) >= self.limit
+
+    def memoizes(self, relative_path: str) -> bool:
+        """Whether results for this path may be shared with other copies of its content."""
+        if not self.memo_key:
+            return False
+        return self.baseline is None or relative_path not in self.baseline.paths
+
+    def handles(self, relative_path: str, suffix: str) -> bool:
+        if relative_path in self.roots:
+            return True
+        if suffix not in self.extensions:
+            return False
+        return relative_path.split("/", 1)[0] in self.roots
+
+    def add_finding(
+        self,
+        source: SourceFile,
+        line_number: int,
+        detail: str = "",
+        offset: int | None = None,
+    ) -> None:
+        if self.full:
+            return
+        if detail:
+            text = detail
+        elif offset is not None:
+            text = source.snippet(offset)
+        else:
+            text = source.line_text(line_number).strip()[:SNIPPET_WIDTH]
+        finding = f"{source.relative_path}:{line_number}: {text}"
+        if self.baseline is not None or self.line_records is not None:
+            line_hash = finding_line_hash(source.line_text(line_number))
+            if self.line_records is not None:
+                self.line_records.append(
+                    {
+                        "path": source.relative_path,
+                        "line": line_number,
+                        "lineHash": line_hash,
+                        "text": text,
+                    }
+                )
+            if self.baseline is not None and self.baseline.accepts(
+                source.relative_path, line_hash
+            ):
+                self.suppressed.append(finding)
+                return
+        self.record_finding(finding)
+
+    def extend_findings(self, relative_path: str, located: list[str]) -> None:
+        """Add memoized "line: text" findings for another copy of the same content."""
+        for item in located[: max(0, self.limit - len(self.findings))]:
+            self.record_finding(f"{relative_path}:{item}")
+
+    def record_finding(self, finding: str) -> None:
+        self.findings.append(finding)
+        if self.events is not None:
+            self.events.emit(
+                "finding", {"checkId": self.check_id, "detector": self.name, "finding": finding}
+            )
+
+
+def iter_source_files(
+    project_dir: Path | GitRevisionPath, roots: tuple[str, ...]
+) -> list[tuple[str, Path]]:
+    """Walk scan roots once, pruning dependency and tool directories.
+
+    A root that names a file rather than a directory is returned as is.
+    """
+    if isinstance(project_dir, GitRevisionPath):
+        return project_dir.iter_files(roots)
+    files: list[tuple[str, Path]] = []
+    pending: list[Path] = []
+    for root in dict.fromkeys(roots):
+        if (project_dir / root).is_file():
+            files.append((root, project_dir / root))
+        else:
+            pending.append(project_dir / root)
+    while pending:
+        directory = pending.pop(0)
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
             continue
-        key = match.group(1)
-        raw_value = match.group(2)
-        values[key] = strip_optional_quotes(raw_value)
-    return values
+        subdirectories: list[Path] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SOURCE_SCAN_PRUNED_DIRS:
+                    subdirectories.append(Path(entry.path))
+            elif entry.is_file():
+                path = Path(entry.path)
+                files.append((path.relative_to(project_dir).as_posix(), path))
+        pending[0:0] = subdirectories
+    return files
+
+
+@dataclass
+class SourceScanCoverage:
+    files_total: int = 0
+    files_scanned: int = 0
+    bytes_total: int = 0
+    bytes_scanned: int = 0
+    unscanned: list[str] = field(default_factory=list)
+    limited: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.unscanned
+
+    def to_report(self) -> dict[str, Any]:
+        return {
+            "complete": self.complete,
+            "filesScanned": self.files_scanned,
+            "filesTotal": self.files_total,
+            "bytesScanned": self.bytes_scanned,
+            "bytesTotal": self.bytes_total,
+            "resumePending": len(self.unscanned),
+            "limitedFiles": self.limited[:20],
+            "limitedCount": len(self.limited),
+        }
 
 
-def extract_app_identity(project_dir: Path, use_app_config_ts: bool) -> dict[str, str]:
-    identity: dict[str, str] = {
-        "bundleIdentifier": "",
-        "version": "",
-        "buildNumber": "",
-    }
+def order_source_files_by_recency(
+    files: list[tuple[str, Path, os.stat_result]], resume_paths: list[str]
+) -> list[tuple[str, Path, os.stat_result]]:
+    """Resume-list files first, then most recently modified first."""
+    resume_rank = {path: index for index, path in enumerate(resume_paths)}
+    return sorted(
+        files,
+        key=lambda item: (
+            resume_rank.get(item[0], len(resume_rank)),
+            -item[2].st_mtime_ns,
+            item[0],
+        ),
+    )
 
-    app_json_path = project_dir / "app.json"
-    app_config_path = project_dir / "app.config.ts"
 
-    if not use_app_config_ts and app_json_path.exists():
-        try:
-            data = load_json(app_json_path)
-        except ValueError:
-            return identity
-        expo = data.get("expo", {})
-        if isinstance(expo, dict):
-            ios = expo.get("ios", {})
-            if isinstance(ios, dict):
-                bundle = ios.get("bundleIdentifier")
-                build_number = ios.get("buildNumber")
-                if isinstance(bundle, str):
-                    identity["bundleIdentifier"] = bundle.strip()
-                if isinstance(build_number, str):
-                    identity["buildNumber"] = build_number.strip()
-            version = expo.get("version")
-            if isinstance(version, str):
-                identity["version"] = version.strip()
-        return identity
+def load_scan_resume_list(cache_dir: Path | None) -> list[str]:
+    if not cache_dir:
+        return []
+    path = cache_dir / SCAN_RESUME_FILE_NAME
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return normalize_str_list(payload.get("paths") if isinstance(payload, dict) else None)
 
-    if not app_config_path.exists():
-        return identity
 
-    content = app_config_path.read_text(encoding="utf-8-sig")
-    bundle_match = re.search(r"bundleIdentifier\s*:\s*['\"]([^'\"]+)['\"]", content)
-    version_match = re.search(r"\bversion\s*:\s*['\"]([^'\"]+)['\"]", content)
-    build_number_match = re.search(r"buildNumber\s*:\s*['\"]([^'\"]+)['\"]", content)
+def save_scan_resume_list(cache_dir: Path | None, paths: list[str]) -> None:
+    if not cache_dir:
+        return
+    path = cache_dir / SCAN_RESUME_FILE_NAME
+    try:
+        if not paths:
+            path.unlink(missing_ok=True)
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"paths": paths}, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        return
+
+
+def reuse_memoized_findings(
+    memo: ContentMemo, digest: str, relative_path: str, detectors: list[SourceDetector]
+) -> list[SourceDetector]:
+    """Apply memoized findings and return the detectors that still need to run."""
+    pending: list[SourceDetector] = []
+    for detector in detectors:
+        hit, located = (
+            memo.get(detector.memo_key, digest)
+            if detector.memoizes(relative_path)
+            else (False, None)
+        )
+        if hit:
+            detector.extend_findings(relative_path, located)
+        else:
+            pending.append(detector)
+    return pending
+
+
+def run_source_scan(
+    project_dir: Path,
+    detectors: list[SourceDetector],
+    deadline: float | None = None,
+    resume_paths: list[str] | None = None,
+    hash_cache: FileHashCache | None = None,
+    memo: ContentMemo | None = None,
+    remote_cache: RemoteResultCache | None = None,
+    limits: SourceScanLimits | None = None,
+) -> SourceScanCoverage:
+    """Read each source file once and hand it to every interested detector.
+
+    With a monotonic ``deadline``, files are visited resume-list first and then
+    newest first; whatever is left when the deadline passes is reported as
+    unscanned so the next run can pick it up. With a ``memo``, detector results
+    are reused for any content already scanned in this run (or known unchanged
+    through ``hash_cache``) without reading the file again. With a
+    ``remote_cache``, a detector's whole result is fetched when another run
+    already scanned identical inputs, and uploaded after a complete scan.
+
+    Files are read in line-aligned chunks under ``limits``; files over the
+    size limit and minified files are skipped (or only their first chunk is
+    sampled) and listed in the coverage's ``limited`` entries.
+    """
+    limits = limits or SourceScanLimits()
+    roots = tuple(dict.fromkeys(root for detector in detectors for root in detector.roots))
+    coverage = SourceScanCoverage()
+    candidates: list[tuple[str, Path, os.stat_result]] = []
+    for relative_path, file_path in iter_source_files(project_dir, roots):
+        suffix = file_path.suffix.lower()
+        if not any(detector.handles(relative_path, suffix) for detector in detectors):
+            continue
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        candidates.append((relative_path, file_path, stat))
+        coverage.files_total += 1
+        coverage.bytes_total += stat.st_size
+    if deadline is not None:
+        candidates = order_source_files_by_recency(candidates, resume_paths or [])
+
+    remote_digests: dict[str, str] = {}
+    if remote_cache is not None and hash_cache is not None:
+        pending: list[SourceDetector] = []
+        for detector in detectors:
+            if not detector.check_id:
+                pending.append(detector)
+                continue
+            input_digest = detector_input_digest(detector, candidates, hash_cache, limits)
+            hit, value = remote_cache.get(detector.check_id, input_digest)
+            if hit and isinstance(value, dict) and isinstance(value.get("findings"), list):
+                for item in value["findings"][: detector.limit]:
+                    detector.record_finding(str(item))
+                detector.suppressed.extend(normalize_str_list(value.get("suppressed")))
+            else:
+                remote_digests[detector.check_id] = input_digest
+                pending.append(detector)
+        if not pending:
+            coverage.files_scanned = coverage.files_total
+            coverage.bytes_scanned = coverage.bytes_total
+            return coverage
+        detectors = pending
+
+    for index, (relative_path, file_path, stat) in enumerate(candidates):
+        if deadline is not None and time.monotonic() >= deadline:
+            coverage.unscanned = [item[0] for item in candidates[index:]]
+            break
+        suffix = file_path.suffix.lower()
+        active = [
+            detector
+            for detector in detectors
+            if not detector.full and detector.handles(relative_path, suffix)
+        ]
+        if not active:
+            if all(detector.full for detector in detectors):
+                break
+            continue
+        if stat.st_size > limits.max_file_bytes:
+            coverage.limited.append(
+                f"{relative_path}: skipped, larger than {limits.max_file_bytes} bytes"
+            )
+            continue
+        digest = (
+            hash_cache.lookup(relative_path, file_path)
+            if memo is not None and hash_cache
+            else None
+        )
+        if memo is not None and digest:
+            active = reuse_memoized_findings(memo, digest, relative_path, active)
+            if not active:
+                coverage.files_scanned += 1
+                coverage.bytes_scanned += stat.st_size
+                continue
+        raw: bytes | None = None
+        if stat.st_size <= limits.chunk_bytes:
+            try:
+                raw = file_path.read_bytes()
+            except OSError:
+                continue
+            if memo is not None and not digest:
+                digest = (
+                    hash_cache.record(relative_path, file_path, raw)
+                    if hash_cache
+                    else fingerprint_content(raw)
+                )
+                active = reuse_memoized_findings(memo, digest, relative_path, active)
+        found_before = {id(detector): len(detector.findings) for detector in active}
+        bytes_scanned = stat.st_size
+        try:
+            for chunk in iter_source_chunks(relative_path, file_path, limits.chunk_bytes, raw):
+                if chunk.first_line == 1 and limits.looks_minified(relative_path, chunk):
+                    if limits.minified == "skip":
+                        coverage.limited.append(f"{relative_path}: skipped, minified")
+                        bytes_scanned = -1
+                        break
+                    coverage.limited.append(f"{relative_path}: minified, first chunk sampled")
+                    bytes_scanned = min(stat.st_size, len(chunk.content))
+                    for detector in active:
+                        detector.detect(chunk, detector)
+                    break
+                for detector in active:
+                    detector.detect(chunk, detector)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if bytes_scanned < 0:
+            continue
+        coverage.files_scanned += 1
+        coverage.bytes_scanned += bytes_scanned
+        if memo is not None and digest:
+            for detector in active:
+                if detector.memoizes(relative_path) and not detector.full:
+                    located = [
+                        finding[len(relative_path) + 1 :]
+                        for finding in detector.findings[found_before[id(detector)] :]
+                    ]
+                    memo.put(detector.memo_key, digest, located)
+    if remote_cache is not None and coverage.complete:
+        for detector in detectors:
+            if detector.check_id in remote_digests:
+                remote_cache.put(
+                    detector.check_id,
+                    remote_digests[detector.check_id],
+                    {"findings": detector.findings, "suppressed": detector.suppressed},
+                )
+    return coverage
 
-    if bundle_match:
-        identity["bundleIdentifier"] = bundle_match.group(1).strip()
-    if version_match:
-        identity["version"] = version_match.group(1).strip()
-    if build_number_match:
-        identity["buildNumber"] = build_number_match.group(1).strip()
 
-    return identity
+def detector_input_digest(
+    detector: SourceDetector,
+    candidates: list[tuple[str, Path, os.stat_result]],
+    hash_cache: FileHashCache,
+    limits: SourceScanLimits,
+) -> str:
+    """Hash a detector's configuration and the content of every file it would scan."""
+    digest = hashlib.sha256(
+        f"{detector.memo_key or detector.name}\0{limits.cache_key()}\n".encode("utf-8")
+    )
+    if detector.baseline is not None:
+        digest.update(f"baseline\0{detector.baseline.digest}\n".encode("utf-8"))
+    for relative_path, file_path, _ in sorted(candidates, key=lambda item: item[0]):
+        if detector.handles(relative_path, file_path.suffix.lower()):
+            fingerprint = hash_cache.fingerprint(relative_path, file_path)
+            digest.update(f"{relative_path}\0{fingerprint or 'unreadable'}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compile_literal_terms(terms: Iterable[str]) -> str:
+    """Compile literal terms into one trie-shaped regex alternation.
+
+    Terms sharing a prefix share a branch, so each scan position walks a single
+    path through the trie (the Aho-Corasick idea) inside the C regex engine
+    instead of retrying every term in turn.
+    """
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + emit(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+@dataclass(frozen=True)
+class PlaceholderRules:
+    """Placeholder regex rules plus rule-pack terms compiled into one pattern."""
+
+    regex: re.Pattern[str] = PLACEHOLDER_SCAN_REGEX
+    digest: str = ""
+    packs: tuple[str, ...] = ()
+    term_count: int = 0
+    pattern_count: int = 0
+
+
+def load_placeholder_rules(
+    project_dir: Path | GitRevisionPath, pack_paths: list[str]
+) -> PlaceholderRules:
+    """Load rule packs (``{"terms": [...], "patterns": [...]}``) on top of the built-ins.
+
+    Terms are case-insensitive literals that match when not adjacent to a
+    letter, digit or underscore; patterns are case-insensitive regexes.
+    """
+    if not pack_paths:
+        return PlaceholderRules()
+    terms: set[str] = set()
+    patterns: list[str] = []
+    packs: list[str] = []
+    for raw_path in pack_paths:
+        pack_path, relative_path = resolve_project_path(project_dir, raw_path)
+        if pack_path is None:
+            raise ValueError(f"Rule pack is outside the project: {raw_path}")
+        if not pack_path.is_file():
+            raise ValueError(f"Rule pack not found: {relative_path}")
+        pack = load_json(pack_path)
+        pack_terms = [term.strip().lower() for term in normalize_str_list(pack.get("terms"))]
+        pack_patterns = normalize_str_list(pack.get("patterns"))
+        if not any(pack_terms) and not pack_patterns:
+            raise ValueError(f"Rule pack defines no terms or patterns: {relative_path}")
+        for pattern in pack_patterns:
+            # Patterns are joined into one alternation, where global flags and
+            # numbered group references would not mean what they say alone.
+            if PLACEHOLDER_PACK_UNSUPPORTED_PATTERN.search(pattern):
+                raise ValueError(
+                    f"Pattern {pattern!r} in rule pack {relative_path} uses an inline "
+                    "global flag or a numbered backreference; use a scoped flag "
+                    "group like (?i:...) or a named group (?P=name) instead."
+                )
+            try:
+                re.compile(pattern, re.IGNORECASE)
+            except re.error as exc:
+                raise ValueError(
+                    f"Invalid pattern {pattern!r} in rule pack {relative_path}: {exc}"
+                ) from exc
+        terms.update(term for term in pack_terms if term)
+        patterns.extend(pattern for pattern in pack_patterns if pattern not in patterns)
+        packs.append(relative_path)
+    alternatives = [PLACEHOLDER_SCAN_REGEX.pattern] + [f"(?:{pattern})" for pattern in patterns]
+    if terms:
+        alternatives.append(rf"(?<!\w)(?:{compile_literal_terms(terms)})(?!\w)")
+    digest = hashlib.sha256(
+        json.dumps({"patterns": patterns, "terms": sorted(terms)}).encode("utf-8")
+    ).hexdigest()
+    try:
+        regex = re.compile("|".join(alternatives), re.IGNORECASE)
+    except re.error as exc:
+        raise ValueError(f"Rule packs {', '.join(packs)} cannot be combined: {exc}") from exc
+    return PlaceholderRules(
+        regex=regex,
+        digest=digest,
+        packs=tuple(packs),
+        term_count=len(terms),
+        pattern_count=len(patterns),
+    )
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--project-dir", required=True)
-    parser.add_argument(
-        "--prd-path",
-        required=True,
-        help="Path to completed PRD used as implementation contract.",
+def finding_line_hash(line: str) -> str:
+    """Key a finding by its line text, so it survives moving within the file."""
+    return hashlib.sha256(line.strip().encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class FindingBaseline:
+    """Accepted findings keyed by project-relative path and line hash."""
+
+    path: str
+    entries: frozenset[tuple[str, str]]
+    paths: frozenset[str]
+    digest: str
+
+    def accepts(self, relative_path: str, line_hash: str) -> bool:
+        return (relative_path, line_hash) in self.entries
+
+
+def load_finding_baseline(
+    project_dir: Path | GitRevisionPath, raw_path: str
+) -> FindingBaseline:
+    baseline_path, relative_path = resolve_project_path(project_dir, raw_path)
+    if baseline_path is None:
+        raise ValueError(f"Placeholder baseline is outside the project: {raw_path}")
+    if not baseline_path.is_file():
+        raise ValueError(f"Placeholder baseline not found: {relative_path}")
+    payload = load_json(baseline_path)
+    if payload.get("format") != PLACEHOLDER_BASELINE_FORMAT:
+        raise ValueError(f"Unsupported placeholder baseline format in {relative_path}")
+    raw_findings = payload.get("findings")
+    if not isinstance(raw_findings, list):
+        raise ValueError(f"Placeholder baseline has no findings list: {relative_path}")
+    entries: set[tuple[str, str]] = set()
+    for item in raw_findings:
+        path = item.get("path") if isinstance(item, dict) else None
+        line_hash = item.get("lineHash") if isinstance(item, dict) else None
+        if not isinstance(path, str) or not isinstance(line_hash, str):
+            raise ValueError(
+                f"Placeholder baseline entries need path and lineHash: {relative_path}"
+            )
+        entries.add((path, line_hash))
+    return FindingBaseline(
+        path=relative_path,
+        entries=frozenset(entries),
+        paths=frozenset(path for path, _ in entries),
+        digest=hashlib.sha256(
+            "\n".join(f"{path}\0{line_hash}" for path, line_hash in sorted(entries)).encode(
+                "utf-8"
+            )
+        ).hexdigest(),
     )
-    parser.add_argument(
-        "--implementation-report-path",
-        required=False,
-        help=(
-            "Optional path to PRD implementation report JSON. "
-            "Defaults to <project-dir>/reports/prd-implementation.json."
-        ),
+
+
+def placeholder_config_paths(metadata: dict[str, Any]) -> tuple[list[str], str]:
+    """Return (rule pack paths, baseline path) configured in skill.modules.json."""
+    baseline_path = metadata.get("placeholderBaseline")
+    return (
+        normalize_str_list(metadata.get("placeholderRulePacks")),
+        baseline_path.strip() if isinstance(baseline_path, str) else "",
     )
-    parser.add_argument(
-        "--report-path",
-        required=False,
-        help="Optional path to write machine-readable validation report JSON.",
+
+
+def placeholder_detector(
+    limit: int = 20,
+    rules: PlaceholderRules | None = None,
+    baseline: FindingBaseline | None = None,
+) -> SourceDetector:
+    rules = rules or PlaceholderRules()
+
+    def detect(source: SourceFile, detector: SourceDetector) -> None:
+        last_line = 0
+        for match in rules.regex.finditer(source.content):
+            line_number = source.line_number(match.start())
+            if line_number == last_line:
+                continue
+            last_line = line_number
+            detector.add_finding(source, line_number, offset=match.start())
+            if detector.full:
+                return
+
+    return SourceDetector(
+        name="placeholder-markers",
+        extensions=PLACEHOLDER_SCAN_EXTENSIONS,
+        detect=detect,
+        limit=limit,
+        memo_key="placeholder-markers" + (f":{rules.digest}" if rules.digest else ""),
+        check_id="VC-030",
+        baseline=baseline,
     )
-    args = parser.parse_args()
 
-    started_at = utc_now_iso()
-    project_dir = Path(args.project_dir).resolve()
-    checks: list[dict[str, Any]] = []
-    module_checks: list[dict[str, Any]] = []
-    warnings: list[str] = []
-    unresolved_human_dependencies: list[dict[str, str]] = []
-    prd_requirement_ids: list[str] = []
-    p0_requirement_ids: list[str] = []
-    missing_requirement_mappings: list[str] = []
-    p0_implementation_failures: list[str] = []
-    placeholder_findings: list[str] = []
 
-    if not project_dir.exists() or not project_dir.is_dir():
-        add_check(
-            checks,
-            "VC-000",
-            "Project Directory Exists",
-            "Blocker",
-            "fail",
-            f"Project directory does not exist: {project_dir}",
-        )
-    else:
-        add_check(checks, "VC-000", "Project Directory Exists", "Blocker", "pass")
+def requirement_tag_detector(
+    known_requirement_ids: set[str], limit: int = 20
+) -> SourceDetector:
+    """Flag FR-/NFR- tags in sources that do not exist in the PRD."""
 
-    package_json_path = project_dir / "package.json"
-    pkg: dict[str, Any] | None = None
-    if checks[-1]["result"] == "pass":
-        if package_json_path.exists():
-            add_check(checks, "VC-001", "package.json Exists", "Blocker", "pass")
-            try:
-                pkg = load_json(package_json_path)
-                add_check(checks, "VC-002", "package.json Parse", "Blocker", "pass")
-            except ValueError as exc:
-                add_check(
-                    checks,
-                    "VC-002",
-                    "package.json Parse",
-                    "Blocker",
-                    "fail",
-                    str(exc),
-                )
-        else:
-            add_check(
-                checks,
-                "VC-001",
-                "package.json Exists",
-                "Blocker",
-                "fail",
-                "package.json not found.",
+    def detect(source: SourceFile, detector: SourceDetector) -> None:
+        for match in SOURCE_REQUIREMENT_TAG_PATTERN.finditer(source.content):
+            requirement_id = match.group(1).upper()
+            if requirement_id in known_requirement_ids:
+                continue
+            detector.add_finding(
+                source,
+                source.line_number(match.start()),
+                f"{requirement_id} is not defined in the PRD",
             )
+            if detector.full:
+                return
+
+    return SourceDetector(
+        name="requirement-tags",
+        extensions=PLACEHOLDER_SCAN_EXTENSIONS,
+        detect=detect,
+        limit=limit,
+        memo_key="requirement-tags:"
+        + hashlib.sha256(",".join(sorted(known_requirement_ids)).encode("utf-8")).hexdigest(),
+        check_id="VC-032",
+    )
 
-    if isinstance(pkg, dict):
-        scripts = pkg.get("scripts", {})
-        for check_id, script_name in (
-            ("VC-003", "lint"),
-            ("VC-004", "typecheck"),
-            ("VC-005", "test"),
-        ):
-            if isinstance(scripts, dict) and script_name in scripts:
-                add_check(
-                    checks,
-                    check_id,
-                    f"package.json scripts.{script_name}",
-                    "Blocker",
-                    "pass",
-                )
+
+def shannon_entropy(value: str) -> float:
+    counts: dict[str, int] = {}
+    for char in value:
+        counts[char] = counts.get(char, 0) + 1
+    return -sum(
+        count / len(value) * math.log2(count / len(value)) for count in counts.values()
+    )
+
+
+def redact_secret(value: str) -> str:
+    return f"{value[:4]}... ({len(value)} chars)"
+
+
+def find_secrets(content: str) -> Iterator[tuple[int, str]]:
+    """Yield (offset, "rule: redacted value") for each likely secret in ``content``.
+
+    Token formats match outright; generic ``*token|secret|key* = value``
+    assignments only when the value looks random (letters and digits with
+    high Shannon entropy), so identifiers and secret names pass.
+    """
+    for start, end in iter_secret_windows(content):
+        for match in SECRET_SCAN_REGEX.finditer(content, start, end):
+            rule = match.lastgroup or ""
+            value_group = f"{rule}_value"
+            value = match.group(value_group) if value_group in match.re.groupindex else None
+            name_start = match.start()
+            while name_start > 0 and (
+                content[name_start - 1].isalnum() or content[name_start - 1] == "_"
+            ):
+                name_start -= 1
+            name_prefix = content[name_start : match.start()].upper()
+            if rule == "secret_assignment" and name_prefix.startswith(
+                SECRET_PUBLIC_NAME_PREFIXES
+            ):
+                continue
+            if value is not None and not is_random_secret(value):
+                continue
+            if rule == "private_key":
+                detail = match.group(0)
             else:
-                add_check(
-                    checks,
-                    check_id,
-                    f"package.json scripts.{script_name}",
-                    "Blocker",
-                    "fail",
-                    f"scripts.{script_name} is missing",
-                )
+                detail = redact_secret(value or match.group(0))
+            yield name_start, f"{rule.replace('_', '-')}: {detail}"
+
+
+def iter_secret_windows(content: str) -> Iterator[tuple[int, int]]:
+    """Yield merged (start, end) windows around trigger terms, within their lines."""
+    lowered = content.lower()
+    if len(lowered) != len(content):
+        # A few non-ASCII characters change length when lowercased; offsets
+        # would no longer line up, so scan the whole content instead.
+        yield 0, len(content)
+        return
+    window_start = window_end = -1
+    for trigger in SECRET_TRIGGER_REGEX.finditer(lowered):
+        line_start = content.rfind("\n", 0, trigger.start()) + 1
+        line_end = content.find("\n", trigger.end())
+        start = max(line_start, trigger.start() - SECRET_WINDOW_BEFORE)
+        end = min(
+            len(content) if line_end < 0 else line_end, trigger.end() + SECRET_WINDOW_AFTER
+        )
+        if start <= window_end:
+            window_end = max(window_end, end)
+            continue
+        if window_end > window_start:
+            yield window_start, window_end
+        window_start, window_end = start, end
+    if window_end > window_start:
+        yield window_start, window_end
 
-        test_script = ""
-        if isinstance(scripts, dict):
-            raw_test = scripts.get("test")
-            if isinstance(raw_test, str):
-                test_script = raw_test
-        if test_script and not is_placeholder_test_script(test_script):
-            add_check(
-                checks,
-                "VC-014",
-                "Non-placeholder Test Script",
-                "Blocker",
-                "pass",
-            )
-        else:
-            reason = (
-                "scripts.test is missing or appears to be placeholder/no-op"
-                if not test_script
-                else f"scripts.test appears to be placeholder/no-op: {test_script}"
-            )
-            add_check(
-                checks,
-                "VC-014",
-                "Non-placeholder Test Script",
-                "Blocker",
-                "fail",
-                reason,
-            )
 
-        main_entry = pkg.get("main")
-        if main_entry == "expo-router/entry":
-            add_check(
-                checks,
-                "VC-006",
-                "package.json main Entry",
-                "Blocker",
-                "pass",
-            )
-        else:
-            add_check(
-                checks,
-                "VC-006",
-                "package.json main Entry",
-                "Blocker",
-                "fail",
-                "package.json main must be expo-router/entry",
-            )
+def is_random_secret(value: str) -> bool:
+    if not re.search(r"[0-9]", value) or not re.search(r"[A-Za-z]", value):
+        return False
+    if re.fullmatch(r"[0-9a-fA-F]+", value):
+        return len(value) >= 32 and shannon_entropy(value) >= SECRET_HEX_MIN_ENTROPY
+    return shannon_entropy(value) >= SECRET_MIN_ENTROPY
 
-        deps: dict[str, Any] = {}
-        if isinstance(pkg.get("dependencies"), dict):
-            deps.update(pkg["dependencies"])
-        if isinstance(pkg.get("devDependencies"), dict):
-            deps.update(pkg["devDependencies"])
 
-        if "expo-router" in deps:
-            add_check(
-                checks,
-                "VC-007",
-                "expo-router Dependency",
-                "Blocker",
-                "pass",
-            )
-        else:
-            add_check(
-                checks,
-                "VC-007",
-                "expo-router Dependency",
-                "Blocker",
-                "fail",
-                "expo-router dependency is missing",
-            )
+def detect_secrets(source: SourceFile, detector: SourceDetector) -> None:
+    last_line = 0
+    for offset, detail in find_secrets(source.content):
+        line_number = source.line_number(offset)
+        if line_number == last_line:
+            continue
+        last_line = line_number
+        detector.add_finding(source, line_number, detail)
+        if detector.full:
+            return
+
+
+def secret_detector(limit: int = 20) -> SourceDetector:
+    return SourceDetector(
+        name="secrets",
+        extensions=SECRET_SCAN_EXTENSIONS,
+        detect=detect_secrets,
+        roots=SECRET_SCAN_ROOTS,
+        limit=limit,
+        memo_key="secrets",
+        check_id="VC-034",
+    )
 
-        if (project_dir / "tsconfig.json").exists():
-            add_check(
-                checks,
-                "VC-008",
-                "tsconfig.json Exists",
-                "Blocker",
-                "pass",
-            )
-        else:
-            add_check(
-                checks,
-                "VC-008",
-                "tsconfig.json Exists",
-                "Blocker",
-                "fail",
-                "tsconfig.json is missing",
-            )
 
-        if "typescript" in deps:
-            add_check(
-                checks,
-                "VC-009",
-                "TypeScript Dependency",
-                "Blocker",
-                "pass",
+def iter_git_history_blobs(
+    repo_dir: Path,
+    prefix: str,
+    max_blob_bytes: int,
+    wanted: Callable[[str, str], bool],
+) -> Iterator[tuple[str, str, bytes]]:
+    """Yield (blob id, path, content) once per blob reachable from any ref.
+
+    ``git rev-list --objects --all`` lists each reachable blob once (trees are
+    walked but not listed, and blobs over ``max_blob_bytes`` are dropped by
+    git). Blobs accepted by
+    ``wanted(blob id, path)`` are fed by a thread into one ``git cat-file
+    --batch`` process whose output is read here as a single stream.
+    """
+    rev_list = subprocess.Popen(
+        [
+            "git",
+            "rev-list",
+            "--objects",
+            "--all",
+            f"--filter=combine:object:type=blob+blob:limit={max_blob_bytes}",
+            "--",
+            prefix or ".",
+        ],
+        cwd=repo_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    cat_file = subprocess.Popen(
+        ["git", "cat-file", "--batch=%(objectname) %(objecttype) %(objectsize) %(rest)"],
+        cwd=repo_dir,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    assert rev_list.stdout and cat_file.stdin and cat_file.stdout
+
+    def feed() -> None:
+        try:
+            for line in rev_list.stdout:
+                oid, _, raw_path = line.rstrip(b"\n").partition(b" ")
+                path = raw_path.decode("utf-8", errors="surrogateescape")
+                if path and wanted(oid.decode("ascii"), path):
+                    cat_file.stdin.write(line)
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            with contextlib.suppress(BrokenPipeError):
+                cat_file.stdin.close()
+            rev_list.stdout.close()
+            rev_list.wait()
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        for header in cat_file.stdout:
+            parts = header.decode("utf-8", errors="surrogateescape").rstrip("\n").split(" ", 3)
+            if len(parts) < 3 or parts[1] == "missing":
+                continue
+            content = cat_file.stdout.read(int(parts[2]))
+            cat_file.stdout.read(1)
+            if parts[1] == "blob":
+                yield parts[0], parts[3] if len(parts) > 3 else "", content
+    finally:
+        if cat_file.poll() is None:
+            rev_list.kill()
+            cat_file.kill()
+        feeder.join()
+        cat_file.stdout.close()
+        cat_file.wait()
+
+
+@dataclass
+class GitHistorySecretScan:
+    blobs_scanned: int = 0
+    blobs_cached: int = 0
+    bytes_scanned: int = 0
+    findings: list[str] = field(default_factory=list)
+    finding_count: int = 0
+    error: str = ""
+
+    def to_report(self) -> dict[str, Any]:
+        return {
+            "blobsScanned": self.blobs_scanned,
+            "blobsCached": self.blobs_cached,
+            "bytesScanned": self.bytes_scanned,
+            "findings": self.findings,
+            "findingCount": self.finding_count,
+            "error": self.error or None,
+        }
+
+
+def scan_git_history_secrets(
+    project_dir: Path,
+    cache_dir: Path | None,
+    max_blob_bytes: int,
+    limit: int = 20,
+) -> GitHistorySecretScan:
+    """Scan every blob reachable from any ref under ``project_dir`` for secrets.
+
+    Results are cached per blob id (blobs never change), so later runs only
+    read blobs added since. Findings name the path the blob was first seen at
+    and the blob id; ``git log --find-object=<id>`` lists the commits.
+    """
+    scan = GitHistorySecretScan()
+    repo_dir = find_git_worktree_root(project_dir)
+    if repo_dir is None:
+        scan.error = f"No git repository found above {project_dir}"
+        return scan
+    prefix = project_dir.relative_to(repo_dir).as_posix()
+    prefix = "" if prefix == "." else prefix
+    cache_path = cache_dir / SECRET_HISTORY_CACHE_FILE_NAME if cache_dir else None
+    cached: dict[str, list[str]] = {}
+    if cache_path is not None:
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            if payload.get("validatorVersion") == VALIDATOR_VERSION:
+                cached = payload.get("blobs") or {}
+        except (OSError, ValueError, AttributeError):
+            cached = {}
+
+    seen: set[str] = set()
+    all_located: list[str] = []
+
+    def wanted(oid: str, path: str) -> bool:
+        if oid in seen:
+            return False
+        seen.add(oid)
+        relative_path = path[len(prefix) + 1 :] if prefix else path
+        if SOURCE_SCAN_PRUNED_DIRS.intersection(relative_path.split("/")[:-1]):
+            return False
+        if PurePosixPath(path).suffix.lower() in SECRET_HISTORY_SKIPPED_SUFFIXES:
+            return False
+        if oid in cached:
+            scan.blobs_cached += 1
+            all_located.extend(f"{relative_path}@{oid[:12]}:{item}" for item in cached[oid])
+            return False
+        return True
+
+    try:
+        for oid, path, content in iter_git_history_blobs(
+            repo_dir, prefix, max_blob_bytes, wanted
+        ):
+            scan.blobs_scanned += 1
+            scan.bytes_scanned += len(content)
+            located: list[str] = []
+            if b"\0" not in content[:8192]:
+                relative_path = path[len(prefix) + 1 :] if prefix else path
+                source = SourceFile.from_content(
+                    relative_path, content.decode("utf-8", errors="replace")
+                )
+                last_line = 0
+                for offset, detail in find_secrets(source.content):
+                    line_number = source.line_number(offset)
+                    if line_number != last_line:
+                        last_line = line_number
+                        located.append(f"{line_number}: {detail}")
+                all_located.extend(f"{relative_path}@{oid[:12]}:{item}" for item in located)
+            cached[oid] = located
+    except OSError as exc:
+        scan.error = f"git history scan failed: {exc}"
+        return scan
+
+    all_located.sort()
+    scan.findings = all_located[:limit]
+    scan.finding_count = len(all_located)
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps(
+                    {
+                        "validatorVersion": VALIDATOR_VERSION,
+                        "blobs": {oid: cached[oid] for oid in seen if oid in cached},
+                    }
+                ),
+                encoding="utf-8",
             )
+        except OSError:
+            pass
+    return scan
+
+
+def git_refs_digest(project_dir: Path) -> str:
+    repo_dir = find_git_worktree_root(project_dir)
+    if repo_dir is None:
+        return "no-repository"
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(objectname) %(refname)"],
+        cwd=repo_dir,
+        capture_output=True,
+    )
+    return hashlib.sha256(result.stdout).hexdigest()
+
+
+def skip_js_trivia(content: str, index: int) -> int:
+    """Skip whitespace and comments starting at ``index``."""
+    while index < len(content):
+        if content[index].isspace():
+            index += 1
+        elif content.startswith("//", index):
+            newline = content.find("\n", index)
+            index = len(content) if newline < 0 else newline + 1
+        elif content.startswith("/*", index):
+            close = content.find("*/", index + 2)
+            index = len(content) if close < 0 else close + 2
         else:
-            add_check(
-                checks,
-                "VC-009",
-                "TypeScript Dependency",
-                "Blocker",
-                "fail",
-                "typescript dependency is missing",
-            )
+            break
+    return index
+
+
+def skip_js_string(content: str, index: int) -> int:
+    """Return the index just past the string literal that starts at ``index``."""
+    quote = content[index]
+    index += 1
+    while index < len(content):
+        char = content[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote:
+            return index + 1
+        index += 1
+    return index
 
-        app_json_path = project_dir / "app.json"
-        app_config_ts_path = project_dir / "app.config.ts"
-        app_errors: list[str] = []
-        if app_json_path.exists():
-            try:
-                app_errors = check_app_json(app_json_path)
-            except ValueError as exc:
-                app_errors = [str(exc)]
-        elif app_config_ts_path.exists():
-            app_errors = check_app_config_ts(app_config_ts_path)
-        else:
-            app_errors = ["Neither app.json nor app.config.ts was found."]
 
-        if app_errors:
-            add_check(
-                checks,
-                "VC-010",
-                "App Config Contract",
-                "Blocker",
-                "fail",
-                " | ".join(app_errors),
-            )
+def parse_message_keys(content: str) -> list[str]:
+    """Return the keys of the exported messages object, nested keys dotted.
+
+    Walks the object literal after ``export const <name> =`` (or ``export
+    default``), skipping strings, comments and non-object values, so
+    punctuation inside messages is never mistaken for structure.
+    """
+    start = MESSAGES_OBJECT_PATTERN.search(content)
+    if not start:
+        return []
+    keys: list[str] = []
+    # One frame per open bracket: the object key path, or None inside values.
+    frames: list[list[str] | None] = [[]]
+    expecting_key = True
+    index = start.end()
+    while index < len(content) and frames:
+        index = skip_js_trivia(content, index)
+        if index >= len(content):
+            break
+        path = frames[-1]
+        if expecting_key and path is not None:
+            expecting_key = False
+            match = MESSAGE_KEY_PATTERN.match(content, index)
+            if match:
+                key = next(group for group in match.groups() if group is not None)
+                index = skip_js_trivia(content, match.end())
+                if content.startswith("{", index):
+                    frames.append(path + [key])
+                    expecting_key = True
+                    index += 1
+                else:
+                    keys.append(".".join(path + [key]))
+                continue
+        char = content[index]
+        if char in "\"'`":
+            index = skip_js_string(content, index)
+            continue
+        if char in "{[(":
+            frames.append(None)
+        elif char in "}])":
+            frames.pop()
+        elif char == "," and path is not None:
+            expecting_key = True
+        index += 1
+    return keys
+
+
+def extract_localization_calls(content: str) -> tuple[list[list[Any]], int]:
+    """Return ([line, key] static t() calls, dynamic call count)."""
+    source = SourceFile.from_content("", content)
+    calls: list[list[Any]] = []
+    dynamic = 0
+    for match in LOCALIZATION_CALL_PATTERN.finditer(content):
+        key = next((group for group in match.groups() if group is not None), None)
+        if key is None:
+            dynamic += 1
         else:
-            add_check(
-                checks,
-                "VC-010",
-                "App Config Contract",
-                "Blocker",
-                "pass",
-            )
+            calls.append([source.line_number(match.start()), key])
+    return calls, dynamic
+
+
+def iter_js_tokens(content: str) -> Iterator[tuple[int, str, Any]]:
+    """Yield (offset, kind, value) tokens of JS/TS source, dropping comments.
+
+    Kinds are ``string`` (decoded value), ``template`` (a template literal with
+    ``${}`` substitutions, raw text), ``number``, ``name`` and ``punct``. JSX
+    text is not understood, so this is meant for .ts/.js modules.
+    """
+    index = 0
+    while True:
+        index = skip_js_trivia(content, index)
+        if index >= len(content):
+            return
+        char = content[index]
+        if char in "\"'`":
+            end = skip_js_string(content, index)
+            raw = content[index + 1 : end - 1]
+            if char == "`" and "${" in raw:
+                yield index, "template", raw
+            else:
+                yield index, "string", JS_STRING_ESCAPE_PATTERN.sub(unescape_js_char, raw)
+            index = end
+            continue
+        match = JS_TOKEN_PATTERN.match(content, index)
+        text = match.group(0)
+        if text[0].isdigit() or (text[0] == "." and len(text) > 1 and text[1].isdigit()):
+            yield index, "number", text
+        elif text[0].isalpha() or text[0] in "_$":
+            yield index, "name", text
+        else:
+            yield index, "punct", text
+        index = match.end()
+
+
+def tokenize_js(content: str) -> list[tuple[str, Any]]:
+    return [(kind, value) for _, kind, value in iter_js_tokens(content)]
+
+
+def unescape_js_char(match: re.Match[str]) -> str:
+    return JS_STRING_ESCAPES.get(match.group(1), match.group(1))
+
+
+class AppConfigParser:
+    """Evaluate the object literal an app.config.ts exports, without running it.
+
+    Literals, nested objects and arrays, spreads of known objects and
+    top-level ``const`` values are resolved. Values the parser cannot know
+    (environment lookups, calls, conditionals) become None, so the key still
+    counts as set.
+    """
+
+    def __init__(self, tokens: list[tuple[str, Any]]) -> None:
+        self.tokens = tokens
+        self.index = 0
+        self.constants: dict[str, Any] = {}
+
+    def peek(self, offset: int = 0) -> tuple[str, Any]:
+        position = self.index + offset
+        return self.tokens[position] if position < len(self.tokens) else ("end", "")
+
+    def at(self, text: str, offset: int = 0) -> bool:
+        kind, value = self.peek(offset)
+        return kind in ("punct", "name") and value == text
+
+    def at_delimiter(self) -> bool:
+        kind, value = self.peek()
+        return kind == "end" or (kind == "punct" and value in (",", ";", ")", "]", "}"))
+
+    def skip_expression(self) -> None:
+        """Advance to the next ``,``/``;`` or unmatched closing bracket."""
+        depth = 0
+        while self.index < len(self.tokens):
+            kind, value = self.tokens[self.index]
+            if kind == "punct":
+                if value in ("(", "[", "{"):
+                    depth += 1
+                elif value in (")", "]", "}"):
+                    if depth == 0:
+                        return
+                    depth -= 1
+                elif value in (",", ";") and depth == 0:
+                    return
+            self.index += 1
+
+    def matching_close(self, position: int) -> int:
+        depth = 0
+        for index in range(position, len(self.tokens)):
+            kind, value = self.tokens[index]
+            if kind != "punct":
+                continue
+            if value in ("(", "[", "{"):
+                depth += 1
+            elif value in (")", "]", "}"):
+                depth -= 1
+                if depth == 0:
+                    return index
+        return len(self.tokens)
+
+    def parse_module(self) -> Any:
+        return self.parse_block(len(self.tokens), top_level=True)
+
+    def parse_block(self, end: int, top_level: bool) -> Any:
+        """Record ``const`` values up to ``end``; return the exported or returned value.
+
+        Nested blocks are skipped, so only statements at this level count.
+        """
+        while self.index < end:
+            if self.at("{") or self.at("(") or self.at("["):
+                self.index = self.matching_close(self.index) + 1
+            elif top_level and self.at("export") and self.at("default", 1):
+                self.index += 2
+                return self.parse_value()
+            elif (
+                top_level
+                and self.at("module")
+                and self.at(".", 1)
+                and self.at("exports", 2)
+                and self.at("=", 3)
+            ):
+                self.index += 4
+                return self.parse_value()
+            elif not top_level and self.at("return"):
+                self.index += 1
+                return self.parse_value()
+            elif self.at("const") or self.at("let") or self.at("var"):
+                self.parse_declaration()
+            else:
+                self.index += 1
+        return None
 
-        eas_path = project_dir / "eas.json"
-        if eas_path.exists():
+    def parse_declaration(self) -> None:
+        self.index += 1
+        kind, name = self.peek()
+        if kind != "name":
+            return
+        self.index += 1
+        # Skip a type annotation up to the initializer.
+        while not self.at("=") and not self.at_delimiter():
+            if self.at("<"):
+                self.index = self.skip_type_arguments()
+            elif self.at("{") or self.at("(") or self.at("["):
+                self.index = self.matching_close(self.index) + 1
+            else:
+                self.index += 1
+        if self.at("="):
+            self.index += 1
+            self.constants[name] = self.parse_value()
+
+    def skip_type_arguments(self) -> int:
+        depth = 0
+        for index in range(self.index, len(self.tokens)):
+            if self.tokens[index] == ("punct", "<"):
+                depth += 1
+            elif self.tokens[index] == ("punct", ">"):
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+        return len(self.tokens)
+
+    def parse_value(self) -> Any:
+        kind, text = self.peek()
+        if self.at("async"):
+            self.index += 1
+            return self.parse_value()
+        if self.at("function"):
+            return self.parse_function()
+        if self.at("("):
+            close = self.matching_close(self.index)
+            following = close + 1 - self.index
+            if self.at("=>", following) or self.at(":", following):
+                return self.parse_function()
+            self.index += 1
+            value = self.parse_value()
+            if not self.at(")"):
+                self.skip_expression()
+                value = None
+            self.index += 1
+        elif kind == "name" and self.at("=>", 1):
+            return self.parse_function()
+        elif kind == "name" and self.call_arguments_offset() is not None:
+            value = self.parse_call()
+        elif self.at("{"):
+            value = self.parse_object()
+        elif self.at("["):
+            value = self.parse_array()
+        elif kind == "string":
+            value = text
+            self.index += 1
+        elif kind == "number" or (self.at("-") and self.peek(1)[0] == "number"):
+            negative = self.at("-")
+            self.index += 2 if negative else 1
+            number_text = self.peek(-1)[1].replace("_", "")
             try:
-                eas_errors = check_eas_json(eas_path)
-            except ValueError as exc:
-                eas_errors = [str(exc)]
+                value = (
+                    int(number_text, 0)
+                    if JS_INTEGER_PATTERN.fullmatch(number_text)
+                    else float(number_text)
+                )
+            except ValueError:
+                value = None
+            if negative and value is not None:
+                value = -value
+        elif kind == "name" and text in ("true", "false"):
+            value = text == "true"
+            self.index += 1
+        elif kind == "name" and text in ("null", "undefined"):
+            value = None
+            self.index += 1
+        elif kind == "name" and text in self.constants:
+            value = self.constants[text]
+            self.index += 1
         else:
-            eas_errors = ["eas.json is missing."]
+            self.skip_expression()
+            return None
+        while self.at("as") or self.at("satisfies"):
+            self.index += 1
+            self.skip_expression()
+        if not self.at_delimiter():
+            self.skip_expression()
+            return None
+        return value
+
+    def call_arguments_offset(self) -> int | None:
+        """Offset of the ``(`` when a (dotted) name call starts here."""
+        offset = 1
+        while self.at(".", offset) and self.peek(offset + 1)[0] == "name":
+            offset += 2
+        return offset if self.at("(", offset) else None
+
+    def parse_call(self) -> Any:
+        """Return the first object argument of a call such as ``withPlugin({...})``.
+
+        Config plugins wrap the config they return, so the object passed in is
+        the closest static view of the result.
+        """
+        self.index += self.call_arguments_offset()
+        close = self.matching_close(self.index)
+        self.index += 1
+        value = None
+        while self.index < close:
+            if self.at(","):
+                self.index += 1
+                continue
+            argument = self.parse_value()
+            if value is None and isinstance(argument, dict):
+                value = argument
+            if self.index < close and not self.at(","):
+                self.index += 1
+        self.index = close + 1
+        return value
+
+    def parse_function(self) -> Any:
+        """Return the object a config function returns; its parameters are unknown."""
+        while not self.at("=>") and not self.at("{") and self.peek()[0] != "end":
+            if self.at("("):
+                self.index = self.matching_close(self.index) + 1
+            else:
+                self.index += 1
+        if self.at("=>"):
+            self.index += 1
+            if not self.at("{"):
+                return self.parse_value()
+        body_end = self.matching_close(self.index)
+        self.index += 1
+        value = self.parse_block(body_end, top_level=False)
+        self.index = body_end + 1
+        return value
+
+    def parse_object(self) -> dict[str, Any]:
+        close = self.matching_close(self.index)
+        self.index += 1
+        result: dict[str, Any] = {}
+        while self.index < close:
+            kind, text = self.peek()
+            if self.at(","):
+                self.index += 1
+            elif self.at("..."):
+                self.index += 1
+                spread = self.parse_value()
+                if isinstance(spread, dict):
+                    result.update(spread)
+            elif kind in ("name", "string", "number"):
+                self.index += 1
+                if self.at(":"):
+                    self.index += 1
+                    result[str(text)] = self.parse_value()
+                elif self.at(",") or self.at("}"):
+                    result[str(text)] = self.constants.get(text)
+                else:
+                    # Methods and accessors: set, but not evaluated.
+                    result[str(text)] = None
+                    self.skip_expression()
+            else:
+                self.skip_expression()
+                if self.index < close and not self.at(","):
+                    self.index += 1
+        self.index = close + 1
+        return result
+
+    def parse_array(self) -> list[Any]:
+        close = self.matching_close(self.index)
+        self.index += 1
+        result: list[Any] = []
+        while self.index < close:
+            if self.at(","):
+                self.index += 1
+            elif self.at("..."):
+                self.index += 1
+                spread = self.parse_value()
+                if isinstance(spread, list):
+                    result.extend(spread)
+            else:
+                result.append(self.parse_value())
+                if self.index < close and not self.at(","):
+                    self.index += 1
+        self.index = close + 1
+        return result
 
-        if eas_errors:
-            add_check(
-                checks,
-                "VC-011",
-                "EAS Profile Contract",
-                "Blocker",
-                "fail",
-                " | ".join(eas_errors),
+
+def parse_app_config_ts(content: str) -> dict[str, Any] | None:
+    """Return the Expo config exported by app.config.ts, or None if not an object.
+
+    ``{ expo: {...} }`` exports are unwrapped to the inner object.
+    """
+    config = AppConfigParser(tokenize_js(content)).parse_module()
+    if not isinstance(config, dict):
+        return None
+    return config["expo"] if isinstance(config.get("expo"), dict) else config
+
+
+def load_app_config_ts(
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+    cache_dir: Path | None,
+) -> dict[str, Any] | None:
+    """Parse app.config.ts once per run, reusing the result cached by content hash."""
+    result_cache = PersistentResultCache(cache_dir, APP_CONFIG_CACHE_NAME)
+    parsed = dict(
+        iter_cached_file_results(
+            project_dir,
+            ("app.config.ts",),
+            hash_cache,
+            result_cache,
+            lambda relative_path: "app-config",
+            lambda kind, content: {"config": parse_app_config_ts(content)},
+        )
+    )
+    result_cache.save()
+    entry = parsed.get("app.config.ts")
+    return entry["config"] if entry else None
+
+
+def app_config_field(config: dict[str, Any] | None, dotted_path: str) -> tuple[bool, Any]:
+    """Return (is set, value) for a dotted key; a value set by an expression is None."""
+    if config is None:
+        return False, None
+    value: Any = config
+    for key in dotted_path.split("."):
+        if value is None:
+            return True, None
+        if not isinstance(value, dict) or key not in value:
+            return False, None
+        value = value[key]
+    return True, value
+
+
+class PersistentResultCache:
+    """Per-file analysis results kept in ``<cache dir>/<name>`` between runs.
+
+    Entries are keyed by analysis kind and content hash and dropped whenever
+    the validator changes; only entries used in a run are written back.
+    """
+
+    def __init__(self, cache_dir: Path | None, name: str) -> None:
+        self.path = cache_dir / name if cache_dir else None
+        self.entries: dict[str, Any] = {}
+        self.used: dict[str, Any] = {}
+        self.hits = 0
+        if self.path is not None:
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+                if payload.get("validatorVersion") == VALIDATOR_VERSION:
+                    self.entries = payload.get("entries") or {}
+            except (OSError, ValueError, AttributeError):
+                self.entries = {}
+
+    def get(self, key: str) -> Any | None:
+        value = self.entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self.used[key] = value
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self.used[key] = value
+
+    def save(self) -> None:
+        if self.path is None or self.used == self.entries:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps({"validatorVersion": VALIDATOR_VERSION, "entries": self.used}),
+                encoding="utf-8",
             )
+        except OSError:
+            return
+        self.entries = dict(self.used)
+
+
+def iter_cached_file_results(
+    project_dir: Path | GitRevisionPath,
+    roots: tuple[str, ...],
+    hash_cache: FileHashCache,
+    result_cache: PersistentResultCache,
+    kind_of: Callable[[str], str | None],
+    analyze: Callable[[str, str], Any],
+) -> Iterator[tuple[str, Any]]:
+    """Yield (relative path, analysis result) for each file ``kind_of`` accepts.
+
+    Results are cached by kind and content hash. A file is read only when its
+    fingerprint in ``hash_cache`` is stale or no result is cached for it.
+    """
+    for relative_path, file_path in iter_source_files(project_dir, roots):
+        kind = kind_of(relative_path)
+        if kind is None:
+            continue
+        digest = hash_cache.lookup(relative_path, file_path)
+        result = result_cache.get(f"{kind}:{digest}") if digest else None
+        if result is None:
+            try:
+                raw = file_path.read_bytes()
+                content = raw.decode("utf-8-sig")
+            except (OSError, UnicodeDecodeError):
+                continue
+            digest = hash_cache.record(relative_path, file_path, raw)
+            result = analyze(kind, content)
+            result_cache.put(f"{kind}:{digest}", result)
+        yield relative_path, result
+
+
+def localization_file_kind(relative_path: str) -> str | None:
+    if PurePosixPath(relative_path).suffix.lower() not in PLACEHOLDER_SCAN_EXTENSIONS:
+        return None
+    bundle_name = relative_path[len(LOCALIZATION_MESSAGES_DIR) + 1 :]
+    if (
+        relative_path.startswith(LOCALIZATION_MESSAGES_DIR + "/")
+        and "/" not in bundle_name
+        and LOCALIZATION_LOCALE_FILE_PATTERN.match(PurePosixPath(bundle_name).stem)
+    ):
+        return "messages"
+    return "calls"
+
+
+def analyze_localization_file(kind: str, content: str) -> dict[str, Any]:
+    if kind == "messages":
+        if not MESSAGES_OBJECT_PATTERN.search(content):
+            return {"keys": None}
+        return {"keys": parse_message_keys(content)}
+    calls, dynamic = extract_localization_calls(content)
+    return {"calls": calls, "dynamic": dynamic}
+
+
+def build_localization_index(
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+    cache_dir: Path | None,
+) -> dict[str, Any]:
+    """Index locale bundle keys and t() call sites in one walk over app/ and src/."""
+    result_cache = PersistentResultCache(cache_dir, LOCALIZATION_INDEX_CACHE_NAME)
+    locales: dict[str, list[str]] = {}
+    calls: list[tuple[str, int, str]] = []
+    dynamic_calls = 0
+    files_indexed = 0
+    for relative_path, entry in iter_cached_file_results(
+        project_dir,
+        LOCALIZATION_SCAN_ROOTS,
+        hash_cache,
+        result_cache,
+        localization_file_kind,
+        analyze_localization_file,
+    ):
+        files_indexed += 1
+        if "keys" in entry:
+            # A locale-named file without a messages object is a helper, not a bundle.
+            if entry["keys"] is not None:
+                locales[PurePosixPath(relative_path).stem] = entry["keys"]
         else:
-            add_check(
-                checks,
+            calls.extend((relative_path, line, key) for line, key in entry["calls"])
+            dynamic_calls += entry["dynamic"]
+    result_cache.save()
+
+    base_locale = LOCALIZATION_BASE_LOCALE if LOCALIZATION_BASE_LOCALE in locales else ""
+    base_keys = set(locales.get(base_locale, [])) or set().union(*locales.values())
+    called_keys = {key for _, _, key in calls}
+    locale_report: dict[str, Any] = {}
+    for locale, keys in sorted(locales.items()):
+        missing = sorted(base_keys - set(keys))
+        locale_report[locale] = {
+            "keys": len(set(keys)),
+            "missing": missing[:50],
+            "missingCount": len(missing),
+        }
+    unknown = [
+        f"{relative_path}:{line}: {key}"
+        for relative_path, line, key in calls
+        if key not in base_keys
+    ]
+    unused = sorted(base_keys - called_keys)
+    return {
+        "baseLocale": base_locale or None,
+        "locales": locale_report,
+        "callSites": len(calls),
+        "dynamicCallSites": dynamic_calls,
+        "unknownKeys": unknown[:20],
+        "unknownKeyCount": len(unknown),
+        "unusedKeys": unused[:50],
+        "unusedKeyCount": len(unused),
+        "filesIndexed": files_indexed,
+        "filesReused": result_cache.hits,
+    }
+
+
+@dataclass
+class JsxElement:
+    """One JSX element: its props' source text and its child expressions."""
+
+    line: int
+    tag: str
+    props: dict[str, str] = field(default_factory=dict)
+    prop_lines: dict[str, int] = field(default_factory=dict)
+    spread: bool = False
+    parent: int = -1
+    child_expressions: list[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.tag.rsplit(".", 1)[-1]
+
+
+def extract_jsx_elements(content: str) -> list[JsxElement]:
+    """Return every JSX element in ``content`` in source order.
+
+    A single pass over the source that skips strings, template literals,
+    comments and regex literals, and treats ``<`` as JSX only where an
+    expression may start, so comparisons and type arguments are not parsed
+    as elements. Elements it cannot parse are skipped, never guessed at.
+    """
+    source = SourceFile.from_content("", content)
+    elements: list[JsxElement] = []
+    open_elements: list[int] = []
+    length = len(content)
+
+    def expression_allowed(index: int) -> bool:
+        index -= 1
+        while index >= 0 and content[index].isspace():
+            index -= 1
+        if index < 0 or content[index] in TSX_EXPRESSION_PRECEDERS:
+            return True
+        end = index + 1
+        while index >= 0 and (content[index].isalnum() or content[index] in "_$"):
+            index -= 1
+        return content[index + 1 : end] in TSX_EXPRESSION_KEYWORDS
+
+    def skip_regex(index: int) -> int:
+        in_class = False
+        cursor = index + 1
+        while cursor < length:
+            char = content[cursor]
+            if char == "\n":
+                return index + 1
+            if char == "\\":
+                cursor += 2
+                continue
+            if char == "[":
+                in_class = True
+            elif char == "]":
+                in_class = False
+            elif char == "/" and not in_class:
+                return cursor + 1
+            cursor += 1
+        return index + 1
+
+    def skip_template(index: int) -> int:
+        index += 1
+        while index < length:
+            char = content[index]
+            if char == "\\":
+                index += 2
+            elif char == "`":
+                return index + 1
+            elif content.startswith("${", index):
+                index = scan_code(index + 2, nested=True)
+            else:
+                index += 1
+        return index
+
+    def scan_code(index: int, nested: bool = False) -> int:
+        depth = 0
+        while True:
+            match = TSX_CODE_SPECIAL_PATTERN.search(content, index)
+            if match is None:
+                return length
+            index = match.start()
+            char = match.group()
+            if char in "\"'":
+                index = skip_js_string(content, index)
+            elif char == "`":
+                index = skip_template(index)
+            elif char == "/":
+                if content.startswith("//", index) or content.startswith("/*", index):
+                    index = skip_js_trivia(content, index)
+                elif expression_allowed(index):
+                    index = skip_regex(index)
+                else:
+                    index += 1
+            elif char == "<":
+                end = parse_element(index) if expression_allowed(index) else None
+                index = end if end is not None else index + 1
+            elif char == "{":
+                depth += 1
+                index += 1
+            else:
+                index += 1
+                if depth == 0 and nested:
+                    return index
+                depth = max(depth - 1, 0)
+
+    def parse_children(index: int, element: JsxElement | None) -> int | None:
+        while True:
+            match = TSX_CHILDREN_SPECIAL_PATTERN.search(content, index)
+            if match is None:
+                return None
+            index = match.start()
+            if match.group() == "{":
+                end = scan_code(index + 1, nested=True)
+                if element is not None:
+                    element.child_expressions.append(content[index + 1 : end - 1].strip())
+                index = end
+                continue
+            cursor = skip_js_trivia(content, index + 1)
+            if content.startswith("/", cursor):
+                close = content.find(">", cursor)
+                return None if close < 0 else close + 1
+            end = parse_element(index)
+            if end is None:
+                return None
+            index = end
+
+    def parse_element(index: int) -> int | None:
+        cursor = skip_js_trivia(content, index + 1)
+        if content.startswith(">", cursor):
+            return parse_children(cursor + 1, None)
+        name = TSX_NAME_PATTERN.match(content, cursor)
+        if name is None:
+            return None
+        element = JsxElement(
+            line=source.line_number(index),
+            tag=name.group(),
+            parent=open_elements[-1] if open_elements else -1,
+        )
+        cursor = name.end()
+        while True:
+            cursor = skip_js_trivia(content, cursor)
+            if cursor >= length:
+                return None
+            char = content[cursor]
+            if content.startswith("/>", cursor) or char == ">":
+                break
+            if char == "{":
+                if content.startswith("...", skip_js_trivia(content, cursor + 1)):
+                    element.spread = True
+                cursor = scan_code(cursor + 1, nested=True)
+                continue
+            prop = TSX_NAME_PATTERN.match(content, cursor)
+            if prop is None or (prop.group() == "extends" and not element.props):
+                return None
+            prop_name = prop.group()
+            element.props[prop_name] = ""
+            element.prop_lines[prop_name] = source.line_number(cursor)
+            cursor = skip_js_trivia(content, prop.end())
+            if not content.startswith("=", cursor):
+                continue
+            cursor = skip_js_trivia(content, cursor + 1)
+            if cursor >= length:
+                return None
+            value_start = cursor
+            if content[cursor] in "\"'":
+                cursor = skip_js_string(content, cursor)
+                element.props[prop_name] = content[value_start:cursor]
+            elif content[cursor] == "{":
+                cursor = scan_code(cursor + 1, nested=True)
+                element.props[prop_name] = content[value_start + 1 : cursor - 1].strip()
+            elif content[cursor] == "<":
+                end = parse_element(cursor)
+                if end is None:
+                    return None
+                cursor = end
+                element.props[prop_name] = content[value_start:cursor]
+            else:
+                return None
+        elements.append(element)
+        if content.startswith("/>", cursor):
+            return cursor + 2
+        open_elements.append(len(elements) - 1)
+        try:
+            return parse_children(cursor + 1, element)
+        finally:
+            open_elements.pop()
+
+    scan_code(0)
+    return elements
+
+
+def jsx_accessibility_rule(tag: str) -> str | None:
+    """Return "interactive", "image" or None for a JSX tag name."""
+    name = tag.rsplit(".", 1)[-1]
+    if not name[:1].isupper():
+        return None
+    if name in JSX_TOUCHABLE_TAGS or name.endswith("Button"):
+        return "interactive"
+    if name.endswith("Image"):
+        return "image"
+    return None
+
+
+def find_accessibility_issues(elements: list[JsxElement]) -> tuple[int, list[list[Any]]]:
+    """Return (elements checked, [line, tag, rule] for each unlabelled element)."""
+    checked = 0
+    missing: list[list[Any]] = []
+    for element in elements:
+        rule = jsx_accessibility_rule(element.tag)
+        if rule is None:
+            continue
+        checked += 1
+        if element.spread:
+            continue
+        accepted = JSX_INTERACTIVE_A11Y_PROPS if rule == "interactive" else JSX_IMAGE_A11Y_PROPS
+        if accepted.intersection(element.props) or (
+            element.tag == "Button" and "title" in element.props
+        ):
+            continue
+        missing.append([element.line, element.tag, rule])
+    return checked, missing
+
+
+def is_unmemoized_value(expression: str, content: str) -> bool:
+    """True when a context value is an inline literal or a plain local object."""
+    if expression[:1] in "{[" or JSX_INLINE_FUNCTION_PATTERN.match(expression):
+        return True
+    if not re.fullmatch(r"[A-Za-z_$][\w$]*", expression):
+        return False
+    declaration = re.search(
+        rf"\b(?:const|let|var)\s+{re.escape(expression)}\s*(?::[^=;]+)?=\s*", content
+    )
+    if declaration is None:
+        return False
+    initializer = content[declaration.end() : declaration.end() + 200]
+    return initializer[:1] in "{[" or bool(JSX_INLINE_FUNCTION_PATTERN.match(initializer))
+
+
+def find_performance_issues(elements: list[JsxElement], content: str) -> list[list[Any]]:
+    """Return [line, rule id, tag] for each render-performance anti-pattern."""
+    issues: list[list[Any]] = []
+    reported_scroll_views: set[int] = set()
+    for index, element in enumerate(elements):
+        if any(JSX_MAP_CALL_PATTERN.search(text) for text in element.child_expressions):
+            ancestor = index
+            while ancestor >= 0:
+                name = elements[ancestor].name
+                if name in JSX_VIRTUALIZED_LIST_TAGS:
+                    break
+                if name in JSX_SCROLL_VIEW_TAGS:
+                    if ancestor not in reported_scroll_views:
+                        reported_scroll_views.add(ancestor)
+                        scroll_view = elements[ancestor]
+                        issues.append([scroll_view.line, "scrollview-map", scroll_view.tag])
+                    break
+                ancestor = elements[ancestor].parent
+        if element.name in JSX_VIRTUALIZED_LIST_TAGS:
+            if not element.spread and "keyExtractor" not in element.props:
+                issues.append([element.line, "flatlist-key-extractor", element.tag])
+            if (
+                element.name == "FlatList"
+                and not element.spread
+                and "getItemLayout" not in element.props
+            ):
+                issues.append([element.line, "flatlist-get-item-layout", element.tag])
+            render_item = element.props.get("renderItem", "")
+            if JSX_INLINE_FUNCTION_PATTERN.match(render_item):
+                issues.append([element.prop_lines["renderItem"], "inline-render-item", element.tag])
+        if element.tag.endswith(".Provider") and is_unmemoized_value(
+            element.props.get("value", ""), content
+        ):
+            issues.append(
+                [element.prop_lines.get("value", element.line), "context-value-not-memoized", element.tag]
+            )
+    return issues
+
+
+def performance_suppressions(content: str) -> dict[int, set[str]]:
+    """Map line -> rule ids silenced there by perf-lint-disable comments.
+
+    An empty set silences every rule on that line.
+    """
+    source = SourceFile.from_content("", content)
+    suppressions: dict[int, set[str]] = {}
+    for match in PERFORMANCE_SUPPRESSION_PATTERN.finditer(content):
+        line = source.line_number(match.start())
+        if match.group(1) == "next-line":
+            line += 1
+        rules = set(re.findall(r"[a-z][a-z-]*", match.group(2)))
+        current = suppressions.get(line)
+        suppressions[line] = set() if current == set() or not rules else (current or set()) | rules
+    return suppressions
+
+
+def react_native_image_tags(content: str) -> set[str]:
+    """JSX tags bound to react-native's Image or ImageBackground by this file's imports."""
+    tags: set[str] = set()
+    for match in REACT_NATIVE_IMPORT_PATTERN.finditer(content):
+        named, namespace = match.groups()
+        if namespace:
+            tags.update(f"{namespace}.{name}" for name in REACT_NATIVE_IMAGE_COMPONENTS)
+            continue
+        for specifier in named.split(","):
+            parts = specifier.split()
+            if parts and parts[0] == "type":
+                continue
+            if parts and parts[0] in REACT_NATIVE_IMAGE_COMPONENTS:
+                tags.add(parts[-1] if len(parts) == 3 and parts[1] == "as" else parts[0])
+    return tags
+
+
+def analyze_jsx_file(kind: str, content: str) -> dict[str, Any]:
+    try:
+        elements = extract_jsx_elements(content)
+    except RecursionError:
+        return {
+            "checked": 0,
+            "missing": [],
+            "performance": [],
+            "suppressed": 0,
+            "imageElements": [],
+            "skipped": True,
+        }
+    checked, missing = find_accessibility_issues(elements)
+    suppressions = performance_suppressions(content) if "perf-lint-disable" in content else {}
+    performance: list[list[Any]] = []
+    suppressed = 0
+    for line, rule, tag in find_performance_issues(elements, content):
+        silenced = suppressions.get(line)
+        if silenced is not None and (not silenced or rule in silenced):
+            suppressed += 1
+        else:
+            performance.append([line, rule, tag])
+    image_tags = react_native_image_tags(content) if "react-native" in content else set()
+    return {
+        "checked": checked,
+        "missing": missing,
+        "performance": performance,
+        "suppressed": suppressed,
+        "imageElements": [
+            [element.line, element.tag] for element in elements if element.tag in image_tags
+        ],
+        "skipped": False,
+    }
+
+
+def jsx_file_kind(relative_path: str) -> str | None:
+    if PurePosixPath(relative_path).suffix.lower() in {".tsx", ".jsx"}:
+        return "jsx"
+    return None
+
+
+@dataclass
+class JsxLintResults:
+    """Per-file JSX analyses for app/ and src/, shared by the JSX lint checks."""
+
+    files: list[tuple[str, dict[str, Any]]]
+    reused: int
+
+    @property
+    def unparsed(self) -> list[str]:
+        return [relative_path for relative_path, entry in self.files if entry["skipped"]]
+
+
+def collect_jsx_lint_results(
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+    cache_dir: Path | None,
+) -> JsxLintResults:
+    """Parse each .tsx/.jsx file once, reusing results cached by content hash."""
+    result_cache = PersistentResultCache(cache_dir, JSX_LINT_CACHE_NAME)
+    files = list(
+        iter_cached_file_results(
+            project_dir,
+            LOCALIZATION_SCAN_ROOTS,
+            hash_cache,
+            result_cache,
+            jsx_file_kind,
+            analyze_jsx_file,
+        )
+    )
+    result_cache.save()
+    return JsxLintResults(files=files, reused=result_cache.hits)
+
+
+def build_accessibility_lint(results: JsxLintResults) -> dict[str, Any]:
+    """Summarize touchables, buttons and images that lack accessibility props."""
+    findings: list[str] = []
+    checked = 0
+    for relative_path, entry in results.files:
+        checked += entry["checked"]
+        for line, tag, rule in entry["missing"]:
+            expected = (
+                "accessibilityLabel, accessibilityRole or accessible"
+                if rule == "interactive"
+                else "accessibilityLabel, alt or accessible"
+            )
+            findings.append(f"{relative_path}:{line}: <{tag}> has no {expected} prop")
+    return {
+        "elementsChecked": checked,
+        "findings": findings[:20],
+        "findingCount": len(findings),
+        "filesScanned": len(results.files),
+        "filesReused": results.reused,
+        "filesUnparsed": results.unparsed,
+    }
+
+
+def react_native_image_elements(results: JsxLintResults) -> list[str]:
+    """List <Image> and <ImageBackground> elements rendered from react-native."""
+    return [
+        f"{relative_path}:{line}: <{tag}>"
+        for relative_path, entry in results.files
+        for line, tag in entry["imageElements"]
+    ]
+
+
+def performance_lint_severities(metadata: dict[str, Any]) -> tuple[dict[str, str], list[str]]:
+    """Return (rule id -> severity, config errors) from skill.modules.json performanceLint."""
+    severities = {rule: default for rule, (default, _) in PERFORMANCE_LINT_RULES.items()}
+    errors: list[str] = []
+    configured = metadata.get("performanceLint", {})
+    if not isinstance(configured, dict):
+        return severities, ["performanceLint must be an object of rule id to severity."]
+    for rule, severity in configured.items():
+        if rule not in PERFORMANCE_LINT_RULES:
+            errors.append(f"performanceLint has unknown rule {rule!r}")
+        elif severity not in PERFORMANCE_LINT_SEVERITIES:
+            errors.append(
+                f"performanceLint.{rule} must be one of {', '.join(PERFORMANCE_LINT_SEVERITIES)}"
+            )
+        else:
+            severities[rule] = severity
+    return severities, errors
+
+
+def build_performance_lint(
+    results: JsxLintResults, severities: dict[str, str]
+) -> dict[str, Any]:
+    """Apply rule severities to the cached performance findings."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    suppressed = 0
+    for relative_path, entry in results.files:
+        suppressed += entry["suppressed"]
+        for line, rule, tag in entry["performance"]:
+            severity = severities.get(rule, "off")
+            if severity == "off":
+                continue
+            message = PERFORMANCE_LINT_RULES[rule][1].format(tag=tag)
+            finding = f"{relative_path}:{line}: [{rule}] {message}"
+            (errors if severity == "error" else warnings).append(finding)
+    return {
+        "severities": severities,
+        "errors": errors[:20],
+        "errorCount": len(errors),
+        "warnings": warnings[:20],
+        "warningCount": len(warnings),
+        "suppressedCount": suppressed,
+        "filesScanned": len(results.files),
+        "filesReused": results.reused,
+        "filesUnparsed": results.unparsed,
+    }
+
+
+def read_image_header(file_path: Path | GitRevisionPath) -> dict[str, Any]:
+    """Read format, dimensions and bit depth from a PNG or JPEG header.
+
+    Only the PNG IHDR chunk or the JPEG segments up to the first start-of-frame
+    marker are read; pixel data is never decoded.
+    """
+    if isinstance(file_path, GitRevisionPath):
+        handle: Any = io.BytesIO(file_path.read_bytes())
+    else:
+        handle = file_path.open("rb")
+    with handle:
+        head = handle.read(26)
+        if head.startswith(PNG_SIGNATURE) and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return {
+                "format": "png",
+                "width": width,
+                "height": height,
+                "bitDepth": head[24],
+                "alpha": head[25] in PNG_ALPHA_COLOR_TYPES,
+            }
+        if not head.startswith(b"\xff\xd8"):
+            return {"format": None}
+        handle.seek(2)
+        while True:
+            segment = handle.read(4)
+            if len(segment) < 4 or segment[0] != 0xFF or segment[1] in (0xD9, 0xDA):
+                return {"format": None}
+            if segment[1] in JPEG_START_OF_FRAME_MARKERS:
+                frame = handle.read(5)
+                if len(frame) < 5:
+                    return {"format": None}
+                height, width = struct.unpack(">HH", frame[1:5])
+                return {
+                    "format": "jpeg",
+                    "width": width,
+                    "height": height,
+                    "bitDepth": frame[0],
+                    "alpha": False,
+                }
+            length = struct.unpack(">H", segment[2:4])[0]
+            if length < 2:
+                return {"format": None}
+            handle.seek(length - 2, io.SEEK_CUR)
+
+
+def asset_reference_name(name: str) -> str:
+    """Return an image file name without its @2x/@3x scale suffix."""
+    return ASSET_SCALE_SUFFIX_PATTERN.sub("", name)
+
+
+def asset_reference_file_kind(relative_path: str) -> str | None:
+    if PurePosixPath(relative_path).suffix.lower() in ASSET_REFERENCE_EXTENSIONS:
+        return "asset-refs"
+    return None
+
+
+def analyze_asset_references(kind: str, content: str) -> list[str]:
+    return sorted(
+        {asset_reference_name(match.group()) for match in ASSET_REFERENCE_PATTERN.finditer(content)}
+    )
+
+
+def configured_image_assets(
+    project_dir: Path, use_app_config_ts: bool, app_config_ts: dict[str, Any] | None
+) -> dict[str, str]:
+    """Return {"icon": path, "splash": path} as configured in the Expo config.
+
+    An object-form ``ios.icon`` ({light, dark, tinted}) contributes its light
+    (or any) variant; otherwise ``expo.icon`` is used, then any other variant.
+    """
+    configured: dict[str, str] = {}
+    for expo in expo_config_layers(project_dir, use_app_config_ts, app_config_ts):
+        ios = expo.get("ios") if isinstance(expo.get("ios"), dict) else {}
+        splash = expo.get("splash") if isinstance(expo.get("splash"), dict) else {}
+        ios_icon = ios.get("icon")
+        icon_candidates = (
+            [ios_icon.get("light"), ios_icon.get("any"), expo.get("icon"), *ios_icon.values()]
+            if isinstance(ios_icon, dict)
+            else [ios_icon, expo.get("icon")]
+        )
+        icon = next(
+            (value for value in icon_candidates if isinstance(value, str) and value.strip()),
+            None,
+        )
+        for role, value in (
+            ("icon", icon),
+            ("splash", splash.get("image")),
+        ):
+            if isinstance(value, str) and value.strip():
+                configured[role] = value.strip()
+        plugins = expo.get("plugins")
+        for plugin in plugins if isinstance(plugins, list) else []:
+            if (
+                isinstance(plugin, list)
+                and len(plugin) > 1
+                and plugin[0] == "expo-splash-screen"
+                and isinstance(plugin[1], dict)
+                and isinstance(plugin[1].get("image"), str)
+            ):
+                configured["splash"] = plugin[1]["image"].strip()
+    return configured
+
+
+def build_asset_index(
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+    cache_dir: Path | None,
+    configured: dict[str, str],
+) -> dict[str, Any]:
+    """Index every image under assets/ and the image names sources refer to.
+
+    Each image is hashed once through ``hash_cache``; its header fields and each
+    source file's referenced names are cached by content hash.
+    """
+    result_cache = PersistentResultCache(cache_dir, ASSET_INDEX_CACHE_NAME)
+    referenced: set[str] = set()
+    for _, names in iter_cached_file_results(
+        project_dir,
+        ASSET_REFERENCE_ROOTS,
+        hash_cache,
+        result_cache,
+        asset_reference_file_kind,
+        analyze_asset_references,
+    ):
+        referenced.update(names)
+
+    images: dict[str, dict[str, Any]] = {}
+    for relative_path, file_path in iter_source_files(project_dir, ("assets",)):
+        if PurePosixPath(relative_path).suffix.lower() not in ASSET_IMAGE_EXTENSIONS:
+            continue
+        digest = hash_cache.fingerprint(relative_path, file_path)
+        if digest is None:
+            continue
+        header = result_cache.get(f"image:{digest}")
+        if header is None:
+            try:
+                header = read_image_header(file_path)
+                header["bytes"] = file_path.stat().st_size
+            except (OSError, struct.error):
+                continue
+            result_cache.put(f"image:{digest}", header)
+        images[relative_path] = header
+    result_cache.save()
+
+    oversized = [
+        f"{relative_path} ({header['bytes'] // 1024} KiB)"
+        for relative_path, header in images.items()
+        if header["bytes"] > ASSET_OVERSIZED_BYTES
+    ]
+    overscaled = [
+        f"{relative_path} ({header['width']}x{header['height']})"
+        for relative_path, header in images.items()
+        if header.get("width")
+        and max(header["width"], header["height"]) > ASSET_MAX_RENDER_DIMENSION
+    ]
+    unreferenced = [
+        relative_path
+        for relative_path in images
+        if asset_reference_name(PurePosixPath(relative_path).name) not in referenced
+    ]
+
+    roles: dict[str, Any] = {}
+    for role, raw_path in configured.items():
+        relative_path = PurePosixPath(raw_path.replace("\\", "/")).as_posix().removeprefix("./")
+        if PurePosixPath(relative_path).suffix.lower() == ASSET_ICON_BUNDLE_SUFFIX:
+            roles[role] = {"path": relative_path, "format": None, "bundle": True}
+            continue
+        header = images.get(relative_path)
+        if header is None and (project_dir / relative_path).is_file():
+            header = read_image_header(project_dir / relative_path)
+        roles[role] = {"path": relative_path, **(header or {"format": None, "missing": True})}
+
+    return {
+        "images": len(images),
+        "totalBytes": sum(header["bytes"] for header in images.values()),
+        "oversized": oversized[:20],
+        "oversizedCount": len(oversized),
+        "overscaled": overscaled[:20],
+        "overscaledCount": len(overscaled),
+        "unreferenced": unreferenced[:50],
+        "unreferencedCount": len(unreferenced),
+        "icon": roles.get("icon"),
+        "splash": roles.get("splash"),
+        "filesReused": result_cache.hits,
+    }
+
+
+def icon_and_splash_problems(asset_index: dict[str, Any]) -> list[str]:
+    problems: list[str] = []
+    icon = asset_index["icon"]
+    if icon is None:
+        problems.append("No app icon is configured (expo.icon or expo.ios.icon).")
+    elif icon.get("bundle"):
+        pass  # An Icon Composer .icon directory has no single image to measure.
+    elif icon.get("missing"):
+        problems.append(f"App icon {icon['path']} does not exist.")
+    elif icon["format"] != "png":
+        problems.append(f"App icon {icon['path']} must be a PNG file.")
+    elif (icon["width"], icon["height"]) != (APP_STORE_ICON_SIZE, APP_STORE_ICON_SIZE):
+        problems.append(
+            f"App icon {icon['path']} is {icon['width']}x{icon['height']}; App Store "
+            f"requires {APP_STORE_ICON_SIZE}x{APP_STORE_ICON_SIZE}."
+        )
+    splash = asset_index["splash"]
+    if splash is None:
+        return problems
+    if splash.get("missing"):
+        problems.append(f"Splash image {splash['path']} does not exist.")
+    elif splash["format"] is None:
+        problems.append(f"Splash image {splash['path']} is not a readable PNG or JPEG.")
+    elif min(splash["width"], splash["height"]) < ASSET_SPLASH_MIN_DIMENSION:
+        problems.append(
+            f"Splash image {splash['path']} is {splash['width']}x{splash['height']}; "
+            f"use at least {ASSET_SPLASH_MIN_DIMENSION} px on its shorter side."
+        )
+    return problems
+
+
+def privacy_manifest_categories(raw: bytes) -> list[str]:
+    """Return the NSPrivacyAccessedAPIType values declared in a PrivacyInfo.xcprivacy."""
+    try:
+        manifest = plistlib.loads(raw)
+    except (plistlib.InvalidFileException, ValueError, OverflowError):
+        return []
+    entries = manifest.get("NSPrivacyAccessedAPITypes") if isinstance(manifest, dict) else None
+    return sorted(
+        {
+            entry["NSPrivacyAccessedAPIType"]
+            for entry in entries or []
+            if isinstance(entry, dict) and isinstance(entry.get("NSPrivacyAccessedAPIType"), str)
+        }
+    )
+
+
+def scan_package_privacy_apis(package_dir: Path) -> dict[str, Any]:
+    """Scan a package's native iOS sources for required-reason API symbols.
+
+    Returns the first file:line per category and the categories the package
+    declares in its own privacy manifests.
+    """
+    categories: dict[str, str] = {}
+    declared: set[str] = set()
+    files_scanned = 0
+    for root in PRIVACY_NATIVE_SOURCE_DIRS:
+        for relative_path, file_path in iter_source_files(package_dir, (root,)):
+            name = PurePosixPath(relative_path).name
+            if name == "PrivacyInfo.xcprivacy":
+                with contextlib.suppress(OSError):
+                    declared.update(privacy_manifest_categories(file_path.read_bytes()))
+                continue
+            if PurePosixPath(name).suffix not in PRIVACY_NATIVE_SOURCE_EXTENSIONS:
+                continue
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            files_scanned += 1
+            source = SourceFile.from_content(relative_path, content)
+            for match in PRIVACY_API_PATTERN.finditer(content):
+                category = PRIVACY_API_SYMBOL_CATEGORIES[match.group(1) or match.group(2)]
+                if category not in categories:
+                    categories[category] = f"{relative_path}:{source.line_number(match.start())}"
+    return {"categories": categories, "declared": sorted(declared), "files": files_scanned}
+
+
+def iter_native_packages(node_modules: Path) -> Iterator[tuple[str, Path]]:
+    """Yield (package.json name@version, package dir) for packages with iOS sources.
+
+    Walks scoped and nested node_modules; packages without an ios/ or apple/
+    directory are skipped without reading their package.json.
+    """
+    pending = [node_modules]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            if entry.name.startswith("@") and directory.name == "node_modules":
+                pending.append(Path(entry.path))
+                continue
+            package_dir = Path(entry.path)
+            if (package_dir / "node_modules").is_dir():
+                pending.append(package_dir / "node_modules")
+            if not any((package_dir / root).is_dir() for root in PRIVACY_NATIVE_SOURCE_DIRS):
+                continue
+            try:
+                package = load_json(package_dir / "package.json")
+            except ValueError:
+                continue
+            name = package.get("name") or package_dir.name
+            yield f"{name}@{package.get('version') or '0.0.0'}", package_dir
+
+
+def app_declared_privacy_categories(
+    project_dir: Path, use_app_config_ts: bool, app_config_ts: dict[str, Any] | None
+) -> set[str]:
+    """Categories declared by the app: Expo config privacyManifests and ios/ manifests."""
+    declared: set[str] = set()
+    for expo in expo_config_layers(project_dir, use_app_config_ts, app_config_ts):
+        ios = expo.get("ios")
+        manifests = ios.get("privacyManifests") if isinstance(ios, dict) else None
+        entries = manifests.get("NSPrivacyAccessedAPITypes") if isinstance(manifests, dict) else None
+        for entry in entries if isinstance(entries, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("NSPrivacyAccessedAPIType"), str):
+                declared.add(entry["NSPrivacyAccessedAPIType"])
+    for relative_path, file_path in iter_source_files(project_dir, ("ios",)):
+        if relative_path.endswith("/PrivacyInfo.xcprivacy") and "/Pods/" not in relative_path:
+            with contextlib.suppress(OSError):
+                declared.update(privacy_manifest_categories(file_path.read_bytes()))
+    return declared
+
+
+def extract_prd_privacy_section(content: str) -> str | None:
+    """Return the text of the PRD section whose heading mentions privacy."""
+    lines = content.splitlines()
+    for index, line in enumerate(lines):
+        heading = MARKDOWN_HEADING_PATTERN.match(line)
+        if not heading or "privacy" not in heading.group(2).lower():
+            continue
+        level = len(heading.group(1))
+        section: list[str] = []
+        for following in lines[index + 1 :]:
+            next_heading = MARKDOWN_HEADING_PATTERN.match(following)
+            if next_heading and len(next_heading.group(1)) <= level:
+                break
+            section.append(following)
+        return "\n".join(section)
+    return None
+
+
+def build_privacy_api_scan(
+    project_dir: Path,
+    cache_dir: Path | None,
+    app_declared: set[str],
+) -> dict[str, Any]:
+    """Scan node_modules native iOS code for required-reason APIs, cached by name@version."""
+    result_cache = PersistentResultCache(cache_dir, PRIVACY_API_CACHE_NAME)
+    packages: dict[str, dict[str, Any]] = {}
+    for key, package_dir in iter_native_packages(project_dir / "node_modules"):
+        if key in packages:
+            continue
+        entry = result_cache.get(key)
+        if entry is None:
+            entry = scan_package_privacy_apis(package_dir)
+            result_cache.put(key, entry)
+        packages[key] = entry
+    result_cache.save()
+
+    undeclared: list[str] = []
+    app_responsible: set[str] = set()
+    for key, entry in sorted(packages.items()):
+        for category, location in sorted(entry["categories"].items()):
+            if category in entry["declared"]:
+                continue
+            app_responsible.add(category)
+            if category not in app_declared:
+                undeclared.append(f"{key}: {category} ({location})")
+    return {
+        "packagesScanned": len(packages),
+        "packagesReused": result_cache.hits,
+        "packages": {
+            key: entry["categories"] for key, entry in sorted(packages.items()) if entry["categories"]
+        },
+        "appDeclared": sorted(app_declared),
+        "appResponsible": sorted(app_responsible),
+        "undeclared": undeclared[:20],
+        "undeclaredCount": len(undeclared),
+    }
+
+
+def find_native_ios_project(
+    project_dir: Path | GitRevisionPath,
+) -> tuple[str, Path | GitRevisionPath] | None:
+    """Return (Xcode project name, project.pbxproj) for a prebuilt ios/ directory."""
+    if isinstance(project_dir, GitRevisionPath):
+        candidates = sorted(
+            relative
+            for relative in project_dir.tree.blobs
+            if NATIVE_PROJECT_PATTERN.fullmatch(relative)
+        )
+    else:
+        ios_dir = project_dir / "ios"
+        candidates = (
+            sorted(
+                path.relative_to(project_dir).as_posix()
+                for path in ios_dir.glob("*.xcodeproj/project.pbxproj")
+            )
+            if ios_dir.is_dir()
+            else []
+        )
+    if not candidates:
+        return None
+    match = NATIVE_PROJECT_PATTERN.fullmatch(candidates[0])
+    return match.group(1), project_dir / candidates[0]
+
+
+def read_pbxproj_build_settings(
+    pbxproj_path: Path | GitRevisionPath,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Collect XCBuildConfiguration settings and the push capability line by line.
+
+    project.pbxproj reaches many MB in large apps, so it is streamed and only
+    scalar settings inside ``buildSettings = { ... };`` blocks are kept; the
+    object graph is never built. Returns (configurations, push capability).
+    """
+    if isinstance(pbxproj_path, GitRevisionPath):
+        handle: Any = io.BytesIO(pbxproj_path.read_bytes())
+    else:
+        handle = pbxproj_path.open("rb")
+    configurations: list[dict[str, Any]] = []
+    current: dict[str, str] | None = None
+    last: dict[str, Any] | None = None
+    in_list = False
+    in_push = False
+    push_capability = False
+    with io.TextIOWrapper(handle, encoding="utf-8", errors="replace") as lines:
+        for line in lines:
+            stripped = line.strip()
+            if current is None:
+                if stripped == "buildSettings = {":
+                    current = {}
+                elif last is not None and stripped.startswith("name = "):
+                    last["name"] = strip_optional_quotes(stripped[7:].rstrip(";"))
+                    last = None
+                elif stripped.startswith("com.apple.Push = {"):
+                    in_push = True
+                elif in_push and stripped.startswith("enabled = "):
+                    push_capability = stripped[10:].rstrip(";").strip() == "1"
+                    in_push = False
+                continue
+            if in_list:
+                in_list = not stripped.startswith(");")
+            elif stripped.endswith("= ("):
+                in_list = True
+            elif stripped.startswith("};"):
+                last = {"name": "", "settings": current}
+                configurations.append(last)
+                current = None
+            else:
+                setting = PBXPROJ_SETTING_PATTERN.match(stripped)
+                if setting:
+                    current[setting.group(1)] = strip_optional_quotes(setting.group(2))
+    return configurations, push_capability
+
+
+def plist_element_value(element: ElementTree.Element) -> Any:
+    if element.tag in ("true", "false"):
+        return element.tag == "true"
+    if element.tag == "integer":
+        return int((element.text or "0").strip())
+    if element.tag == "array":
+        return [plist_element_value(child) for child in element]
+    if element.tag == "dict":
+        children = list(element)
+        return {
+            key.text or "": plist_element_value(value)
+            for key, value in zip(children[::2], children[1::2])
+        }
+    return element.text or ""
+
+
+def read_plist_values(file_path: Path | GitRevisionPath, keys: Iterable[str]) -> dict[str, Any]:
+    """Read selected top-level keys of an XML or binary property list.
+
+    XML plists are parsed incrementally and every top-level value is released
+    once read; binary plists are small and go through plistlib.
+    """
+    wanted = set(keys)
+    if isinstance(file_path, GitRevisionPath):
+        handle: Any = io.BytesIO(file_path.read_bytes())
+    else:
+        handle = file_path.open("rb")
+    values: dict[str, Any] = {}
+    with handle:
+        if handle.read(8) == b"bplist00":
+            handle.seek(0)
+            loaded = plistlib.load(handle)
+            return {key: loaded[key] for key in wanted if key in loaded}
+        handle.seek(0)
+        depth = 0
+        key: str | None = None
+        for event, element in ElementTree.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            # <plist> is depth 1 and its top-level <dict> depth 2.
+            if depth != 2:
+                continue
+            if element.tag == "key":
+                key = element.text
+            else:
+                if key in wanted:
+                    values[key] = plist_element_value(element)
+                key = None
+            element.clear()
+    return values
+
+
+def expand_build_settings(value: Any, settings: dict[str, str]) -> Any:
+    if not isinstance(value, str):
+        return value
+    return BUILD_SETTING_REFERENCE_PATTERN.sub(
+        lambda match: settings.get(match.group(1) or match.group(2), match.group(0)), value
+    )
+
+
+def build_native_project_summary(project_dir: Path | GitRevisionPath) -> dict[str, Any] | None:
+    """Resolve bundle id, version, build number and push setup from a prebuilt ios/ project.
+
+    Info.plist values are expanded with each app build configuration, so
+    ``$(PRODUCT_BUNDLE_IDENTIFIER)`` and ``$(MARKETING_VERSION)`` resolve to
+    what Xcode would build.
+    """
+    native_project = find_native_ios_project(project_dir)
+    if native_project is None:
+        return None
+    name, pbxproj_path = native_project
+    ios_dir = project_dir / "ios"
+    configurations, push_capability = read_pbxproj_build_settings(pbxproj_path)
+    app_configurations = [
+        configuration
+        for configuration in configurations
+        if configuration["settings"].get("INFOPLIST_FILE") == f"{name}/Info.plist"
+    ] or [
+        configuration
+        for configuration in configurations
+        if "PRODUCT_BUNDLE_IDENTIFIER" in configuration["settings"]
+    ]
+
+    info_plist_path = ios_dir / name / "Info.plist"
+    info_plist: dict[str, Any] = {}
+    problems: list[str] = []
+    if info_plist_path.is_file():
+        try:
+            info_plist = read_plist_values(info_plist_path, NATIVE_INFO_PLIST_KEYS)
+        except (ElementTree.ParseError, plistlib.InvalidFileException, ValueError) as exc:
+            problems.append(f"ios/{name}/Info.plist could not be parsed ({exc})")
+    else:
+        problems.append(f"ios/{name}/Info.plist is missing")
+
+    bundle_identifiers: set[str] = set()
+    versions: set[str] = set()
+    build_numbers: set[str] = set()
+    entitlement_paths: set[str] = set()
+    for configuration in app_configurations:
+        settings = configuration["settings"]
+        bundle_identifiers.add(
+            expand_build_settings(
+                info_plist.get("CFBundleIdentifier", "$(PRODUCT_BUNDLE_IDENTIFIER)"), settings
+            )
+        )
+        versions.add(
+            str(expand_build_settings(info_plist.get("CFBundleShortVersionString", ""), settings))
+        )
+        build_numbers.add(
+            str(expand_build_settings(info_plist.get("CFBundleVersion", ""), settings))
+        )
+        if settings.get("CODE_SIGN_ENTITLEMENTS"):
+            entitlement_paths.add(settings["CODE_SIGN_ENTITLEMENTS"])
+
+    aps_environments: set[str] = set()
+    for relative_path in sorted(entitlement_paths):
+        entitlements_path = ios_dir / relative_path
+        if not entitlements_path.is_file():
+            problems.append(f"CODE_SIGN_ENTITLEMENTS points to missing ios/{relative_path}")
+            continue
+        try:
+            entitlements = read_plist_values(entitlements_path, ("aps-environment",))
+        except (ElementTree.ParseError, plistlib.InvalidFileException, ValueError) as exc:
+            problems.append(f"ios/{relative_path} could not be parsed ({exc})")
+            continue
+        if entitlements.get("aps-environment"):
+            aps_environments.add(str(entitlements["aps-environment"]))
+
+    background_modes = info_plist.get("UIBackgroundModes")
+    return {
+        "project": f"ios/{name}.xcodeproj",
+        "configurations": [configuration["name"] for configuration in app_configurations],
+        "bundleIdentifiers": sorted(bundle_identifiers - {""}),
+        "versions": sorted(versions - {""}),
+        "buildNumbers": sorted(build_numbers - {""}),
+        "entitlements": [f"ios/{path}" for path in sorted(entitlement_paths)],
+        "apsEnvironments": sorted(aps_environments),
+        "pushCapability": push_capability,
+        "remoteNotificationBackgroundMode": isinstance(background_modes, list)
+        and "remote-notification" in background_modes,
+        "problems": problems,
+    }
+
+
+def native_project_drift(
+    native_project: dict[str, Any],
+    app_identity: dict[str, str],
+    with_push: bool,
+    human_inputs: dict[str, str] | None,
+) -> list[str]:
+    """Compare a prebuilt ios/ project with app config, withPush and human inputs."""
+    drift = list(native_project["problems"])
+    native_values = {
+        "bundleIdentifier": ("bundle identifier", native_project["bundleIdentifiers"]),
+        "version": ("CFBundleShortVersionString", native_project["versions"]),
+        "buildNumber": ("CFBundleVersion", native_project["buildNumbers"]),
+    }
+    expected_sources: list[tuple[str, dict[str, str]]] = [("app config", app_identity)]
+    if human_inputs is not None:
+        expected_sources.append(
+            (
+                "release/human-inputs.md",
+                {
+                    "bundleIdentifier": human_inputs.get("IOS_BUNDLE_ID", "").strip(),
+                    "version": human_inputs.get("APP_VERSION", "").strip(),
+                    "buildNumber": human_inputs.get("IOS_BUILD_NUMBER", "").strip(),
+                },
+            )
+        )
+    for field_name, (label, values) in native_values.items():
+        # Values still holding $(...) come from settings outside project.pbxproj.
+        resolved = [value for value in values if "$" not in value]
+        for source, expected_values in expected_sources:
+            expected = expected_values.get(field_name, "")
+            mismatched = [value for value in resolved if value != expected]
+            if expected and mismatched:
+                drift.append(
+                    f"ios/ {label} {', '.join(mismatched)} does not match {source} {expected}"
+                )
+
+    has_push_entitlement = bool(native_project["apsEnvironments"])
+    if with_push and not has_push_entitlement:
+        drift.append("withPush is enabled but ios/ entitlements have no aps-environment")
+    if not with_push and (has_push_entitlement or native_project["pushCapability"]):
+        drift.append("ios/ declares the push capability but withPush is disabled")
+    return drift
+
+
+@dataclass
+class RouteNode:
+    """One URL segment of the Expo Router route trie built from app/."""
+
+    children: dict[str, "RouteNode"] = field(default_factory=dict)
+    groups: dict[str, "RouteNode"] = field(default_factory=dict)
+    dynamic: "RouteNode | None" = None
+    catch_all: str | None = None
+    optional_catch_all: str | None = None
+    route: str | None = None
+    layout: bool = False
+
+    def insert(self, segments: list[str], route: str, layout: bool = False) -> None:
+        node = self
+        for position, segment in enumerate(segments):
+            group = ROUTE_GROUP_PATTERN.fullmatch(segment)
+            if group:
+                # Array groups "(a,b)" register the same files under each group.
+                for name in group.group(1).split(","):
+                    child = node.groups.setdefault(name.strip(), RouteNode())
+                    child.insert(segments[position + 1 :], route, layout)
+                return
+            if segment.startswith("[[..."):
+                node.optional_catch_all = node.optional_catch_all or route
+                return
+            if segment.startswith("[..."):
+                node.catch_all = node.catch_all or route
+                return
+            if segment.startswith("["):
+                node.dynamic = node.dynamic or RouteNode()
+                node = node.dynamic
+            else:
+                node = node.children.setdefault(segment, RouteNode())
+        if layout:
+            node.layout = True
+        else:
+            node.route = node.route or route
+
+    def match(self, segments: Sequence[str], position: int = 0) -> str | None:
+        """Return the route file an href's segments resolve to, or None.
+
+        Static children win over groups, then dynamic segments, then
+        catch-alls. A group can be named in the href or passed through.
+        """
+        if position == len(segments):
+            resolved = self.route or self.optional_catch_all
+            for group in self.groups.values():
+                resolved = resolved or group.match(segments, position)
+            return resolved
+        segment = segments[position]
+        resolved = None
+        if segment == ROUTE_WILDCARD:
+            for child in self.children.values():
+                resolved = resolved or child.match(segments, position + 1)
+        elif ROUTE_GROUP_PATTERN.fullmatch(segment):
+            group = self.groups.get(segment[1:-1])
+            resolved = group.match(segments, position + 1) if group else None
+        elif not segment.startswith("[") and segment in self.children:
+            resolved = self.children[segment].match(segments, position + 1)
+        if resolved is None and self.dynamic is not None:
+            resolved = self.dynamic.match(segments, position + 1)
+        resolved = resolved or self.catch_all or self.optional_catch_all
+        for group in self.groups.values():
+            resolved = resolved or group.match(segments, position)
+        return resolved
+
+
+def build_route_manifest(project_dir: Path | GitRevisionPath) -> tuple[RouteNode, dict[str, int]]:
+    """Index route files and _layout files under app/ into a RouteNode trie.
+
+    Only file names are read. ``+not-found``, ``+html`` and ``*+api`` files
+    and type declarations are not navigation targets.
+    """
+    root = RouteNode()
+    counts = {"routes": 0, "layouts": 0}
+    for relative_path, _ in iter_source_files(project_dir, ("app",)):
+        pure = PurePosixPath(relative_path)
+        if pure.suffix not in PLACEHOLDER_SCAN_EXTENSIONS or pure.name.endswith(".d.ts"):
+            continue
+        stem = ROUTE_PLATFORM_SUFFIX_PATTERN.sub("", pure.stem)
+        directories = list(pure.parts[1:-1])
+        if "+" in stem or any(part.startswith("+") for part in directories):
+            continue
+        if stem == "_layout":
+            root.insert(directories, relative_path, layout=True)
+            counts["layouts"] += 1
+            continue
+        root.insert(directories + ([] if stem == "index" else [stem]), relative_path)
+        counts["routes"] += 1
+    return root, counts
+
+
+def split_route_literal(value: str, template: bool, allow_scheme: bool) -> list[str] | None:
+    """Return an href's path segments, or None when it is not an app route.
+
+    Template substitutions become wildcard segments. Custom-scheme URLs
+    (``myapp://orders/1``) count as routes only when ``allow_scheme`` is set.
+    """
+    value = value.strip()
+    if "://" in value:
+        scheme, _, rest = value.partition("://")
+        if not allow_scheme or scheme.lower() in ("http", "https") or not scheme.isidentifier():
+            return None
+        value = "/" + rest
+    if not value.startswith("/") or value.startswith("//"):
+        return None
+    path = re.split(r"[?#]", value, maxsplit=1)[0]
+    segments = [segment for segment in path.split("/") if segment]
+    if template:
+        segments = [ROUTE_WILDCARD if "${" in segment else segment for segment in segments]
+    return segments
+
+
+def route_reference_kind(relative_path: str) -> str | None:
+    if relative_path == DEEP_LINK_MODULE_PATH:
+        return "deep-link"
+    if PurePosixPath(relative_path).suffix in PLACEHOLDER_SCAN_EXTENSIONS:
+        return "navigation"
+    return None
+
+
+def analyze_route_references(kind: str, content: str) -> dict[str, Any]:
+    """Return [line, href, segments] for each route literal in one file.
+
+    In the deep-link module every string that looks like a route counts; in
+    other files only router.push/replace/navigate arguments and href values.
+    """
+    source = SourceFile.from_content("", content)
+    references: list[list[Any]] = []
+    if kind == "deep-link":
+        for offset, token_kind, value in iter_js_tokens(content):
+            if token_kind not in ("string", "template"):
+                continue
+            segments = split_route_literal(value, token_kind == "template", allow_scheme=True)
+            # Bare "/" and all-wildcard strings are path handling, not targets.
+            if segments and any(segment != ROUTE_WILDCARD for segment in segments):
+                references.append([source.line_number(offset), value, segments])
+        return {"references": references}
+    for match in ROUTE_CALL_PATTERN.finditer(content):
+        value = match.group(2)
+        segments = split_route_literal(value, match.group(1) == "`" and "${" in value, False)
+        if segments is not None:
+            references.append([source.line_number(match.start()), value, segments])
+    return {"references": references}
+
+
+def build_route_index(
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+    cache_dir: Path | None,
+) -> dict[str, Any]:
+    """Resolve every deep-link and navigation route literal against the app/ trie."""
+    manifest, counts = build_route_manifest(project_dir)
+    result_cache = PersistentResultCache(cache_dir, ROUTE_REFERENCE_CACHE_NAME)
+    resolved: dict[tuple[str, ...], str | None] = {}
+    references = 0
+    deep_link_references = 0
+    unresolved: list[str] = []
+    for relative_path, entry in iter_cached_file_results(
+        project_dir,
+        LOCALIZATION_SCAN_ROOTS,
+        hash_cache,
+        result_cache,
+        route_reference_kind,
+        analyze_route_references,
+    ):
+        for line, value, segments in entry["references"]:
+            references += 1
+            if relative_path == DEEP_LINK_MODULE_PATH:
+                deep_link_references += 1
+            key = tuple(segments)
+            if key not in resolved:
+                resolved[key] = manifest.match(segments)
+            if resolved[key] is None:
+                unresolved.append(f"{relative_path}:{line}: {value}")
+    result_cache.save()
+    return {
+        "routes": counts["routes"],
+        "layouts": counts["layouts"],
+        "references": references,
+        "deepLinkReferences": deep_link_references,
+        "unresolved": unresolved[:20],
+        "unresolvedCount": len(unresolved),
+        "filesReused": result_cache.hits,
+    }
+
+
+def normalize_template_content(raw: bytes) -> bytes:
+    """Normalize BOM, line endings and trailing whitespace before hashing."""
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]
+    raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    lines = [line.rstrip() for line in raw.split(b"\n")]
+    return b"\n".join(lines).rstrip(b"\n") + b"\n"
+
+
+def fingerprint_content(raw: bytes, token_values: dict[str, str] | None = None) -> str:
+    normalized = normalize_template_content(raw)
+    if token_values:
+        for token, value in token_values.items():
+            if value:
+                normalized = normalized.replace(value.encode("utf-8"), token.encode("utf-8"))
+    return hashlib.sha256(normalized).hexdigest()
+
+
+def iter_template_fingerprint_files(template_root: Path) -> list[tuple[str, Path]]:
+    """Return (project-relative path, template file) pairs for copied templates."""
+    pairs: list[tuple[str, Path]] = []
+    for pattern in TEMPLATE_FINGERPRINT_SOURCES:
+        for source_root in sorted(template_root.glob(pattern)):
+            if not source_root.is_dir():
+                continue
+            for file_path in sorted(source_root.rglob("*")):
+                if file_path.is_file():
+                    pairs.append((file_path.relative_to(source_root).as_posix(), file_path))
+    return pairs
+
+
+def build_template_manifest(template_root: Path) -> dict[str, Any]:
+    files: dict[str, dict[str, Any]] = {}
+    for relative_path, template_path in iter_template_fingerprint_files(template_root):
+        raw = template_path.read_bytes()
+        text = raw.decode("utf-8", errors="ignore")
+        files[relative_path] = {
+            "template": template_path.relative_to(template_root).as_posix(),
+            "sha256": fingerprint_content(raw),
+            "tokens": [token for token in TEMPLATE_TOKENS if token in text],
+        }
+    return {"schemaVersion": 1, "algorithm": "sha256", "files": files}
+
+
+def load_template_manifest(path: Path) -> dict[str, dict[str, Any]]:
+    """Load the committed manifest, rebuilding from templates when it is absent."""
+    if path.exists():
+        manifest = load_json(path)
+    else:
+        manifest = build_template_manifest(TEMPLATE_ROOT)
+    files = manifest.get("files")
+    if not isinstance(files, dict):
+        raise ValueError(f"{path} is missing 'files' object.")
+    return {key: value for key, value in files.items() if isinstance(value, dict)}
+
+
+class FileHashCache:
+    """Content fingerprints keyed by project-relative path.
+
+    Each entry holds one digest per token variant, so a file hashed both raw
+    and with template tokens substituted keeps both. Entries are reused while
+    the file's mtime/size (or git blob id) is unchanged.
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        self.path = cache_dir / FILE_HASH_CACHE_NAME if cache_dir else None
+        self.entries: dict[str, list[Any]] = {}
+        self.dirty = False
+        if self.path and self.path.exists():
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            entries = payload.get("entries") if isinstance(payload, dict) else None
+            if isinstance(entries, dict) and payload.get("version") == FILE_HASH_CACHE_VERSION:
+                self.entries = entries
+
+    def stamp(self, file_path: Path) -> str | None:
+        object_id = getattr(file_path, "object_id", None)
+        if object_id:
+            return f"git:{object_id}"
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def lookup(
+        self,
+        relative_path: str,
+        file_path: Path,
+        token_values: dict[str, str] | None = None,
+    ) -> str | None:
+        """Return the cached fingerprint without reading the file, if still valid."""
+        cached = self.entries.get(relative_path)
+        if not isinstance(cached, list) or len(cached) != 2 or not isinstance(cached[1], dict):
+            return None
+        if cached[0] != self.stamp(file_path):
+            return None
+        return cached[1].get(json.dumps(token_values or {}, sort_keys=True))
+
+    def record(
+        self,
+        relative_path: str,
+        file_path: Path,
+        raw: bytes,
+        token_values: dict[str, str] | None = None,
+    ) -> str:
+        digest = fingerprint_content(raw, token_values)
+        self.store(relative_path, file_path, json.dumps(token_values or {}, sort_keys=True), digest)
+        return digest
+
+    def store(self, relative_path: str, file_path: Path, variant: str, digest: str) -> None:
+        """Add a variant's digest, dropping the other variants if the file changed."""
+        stamp = self.stamp(file_path)
+        if not stamp:
+            return
+        cached = self.entries.get(relative_path)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == stamp:
+            cached[1][variant] = digest
+        else:
+            self.entries[relative_path] = [stamp, {variant: digest}]
+        self.dirty = True
+
+    def fingerprint(
+        self,
+        relative_path: str,
+        file_path: Path,
+        token_values: dict[str, str] | None = None,
+    ) -> str | None:
+        digest = self.lookup(relative_path, file_path, token_values)
+        if digest:
+            return digest
+        try:
+            if isinstance(file_path, Path) and file_path.stat().st_size > STREAMED_HASH_BYTES:
+                return self.record_streamed(relative_path, file_path)
+            raw = file_path.read_bytes()
+        except OSError:
+            return None
+        return self.record(relative_path, file_path, raw, token_values)
+
+    def record_streamed(self, relative_path: str, file_path: Path) -> str:
+        """Hash a large file's raw bytes block by block (no normalization)."""
+        hasher = hashlib.sha256(b"raw\0")
+        for block in iter_file_blocks(file_path, STREAMED_HASH_BYTES):
+            hasher.update(block)
+        digest = hasher.hexdigest()
+        self.store(relative_path, file_path, json.dumps({}), digest)
+        return digest
+
+    def save(self) -> None:
+        if not self.path or not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(
+                    {"version": FILE_HASH_CACHE_VERSION, "entries": self.entries}, sort_keys=True
+                ),
+                encoding="utf-8",
+            )
+        except OSError:
+            return
+        self.dirty = False
+
+
+class ContentMemo:
+    """Content-addressed results shared by every project in a fleet run."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: dict[tuple[str, str], Any] = {}
+        self.lookups: dict[str, int] = {}
+        self.hits: dict[str, int] = {}
+
+    def get(self, kind: str, digest: str) -> tuple[bool, Any]:
+        """Look up a result; ``kind`` may carry a ":<config hash>" qualifier."""
+        label = kind.split(":", 1)[0]
+        with self.lock:
+            self.lookups[label] = self.lookups.get(label, 0) + 1
+            if (kind, digest) not in self.entries:
+                return False, None
+            self.hits[label] = self.hits.get(label, 0) + 1
+            return True, self.entries[(kind, digest)]
+
+    def put(self, kind: str, digest: str, value: Any) -> None:
+        with self.lock:
+            self.entries[(kind, digest)] = value
+
+    def to_report(self) -> dict[str, Any]:
+        with self.lock:
+            lookups = sum(self.lookups.values())
+            hits = sum(self.hits.values())
+            return {
+                "lookups": lookups,
+                "hits": hits,
+                "hitRate": round(hits / lookups, 4) if lookups else 0.0,
+                "uniqueEntries": len(self.entries),
+                "byKind": {
+                    kind: {"lookups": count, "hits": self.hits.get(kind, 0)}
+                    for kind, count in sorted(self.lookups.items())
+                },
+            }
+
+
+class RemoteResultCache:
+    """Per-check results shared across runners through an HTTP GET/PUT store.
+
+    Entries live at ``<base-url>/<key>``, where the key hashes the check ID, the
+    validator version and the check's input content hashes. Network errors
+    count as misses; after ``max_errors`` consecutive failures the cache is
+    bypassed for the rest of the run so an unreachable server cannot stall it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        read_only: bool = False,
+        timeout: float = 5.0,
+        max_errors: int = 3,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.read_only = read_only
+        self.timeout = timeout
+        self.max_errors = max_errors
+        self.lock = threading.Lock()
+        self.consecutive_errors = 0
+        self.stats = {"lookups": 0, "hits": 0, "misses": 0, "uploads": 0, "errors": 0}
+
+    def entry_key(self, check_id: str, input_digest: str) -> str:
+        return hashlib.sha256(
+            f"{check_id}\0{VALIDATOR_VERSION}\0{input_digest}".encode("utf-8")
+        ).hexdigest()
+
+    @property
+    def disabled(self) -> bool:
+        return self.consecutive_errors >= self.max_errors
+
+    def count(self, name: str, error: bool = False) -> None:
+        with self.lock:
+            self.stats[name] += 1
+            if error:
+                self.stats["errors"] += 1
+                self.consecutive_errors += 1
+            elif name != "lookups":
+                self.consecutive_errors = 0
+
+    def get(self, check_id: str, input_digest: str) -> tuple[bool, Any]:
+        self.count("lookups")
+        if self.disabled:
+            self.count("misses")
+            return False, None
+        url = f"{self.base_url}/{self.entry_key(check_id, input_digest)}"
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as exc:
+            self.count("misses", error=exc.code != 404)
+            return False, None
+        except (OSError, ValueError):
+            self.count("misses", error=True)
+            return False, None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("checkId") != check_id
+            or payload.get("validatorVersion") != VALIDATOR_VERSION
+        ):
+            self.count("misses")
+            return False, None
+        self.count("hits")
+        return True, payload.get("value")
+
+    def put(self, check_id: str, input_digest: str, value: Any) -> None:
+        if self.read_only or self.disabled:
+            return
+        body = json.dumps(
+            {"checkId": check_id, "validatorVersion": VALIDATOR_VERSION, "value": value},
+            sort_keys=True,
+        ).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.base_url}/{self.entry_key(check_id, input_digest)}",
+            data=body,
+            method="PUT",
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except (OSError, ValueError):
+            with self.lock:
+                self.stats["errors"] += 1
+                self.consecutive_errors += 1
+            return
+        self.count("uploads")
+
+    def to_report(self) -> dict[str, Any]:
+        with self.lock:
+            return {"url": self.base_url, "readOnly": self.read_only, **self.stats}
+
+
+def memoized_file_analysis(
+    memo: ContentMemo | None,
+    hash_cache: FileHashCache | None,
+    kind: str,
+    relative_path: str,
+    file_path: Path,
+    analyze: Callable[[bytes], Any],
+) -> Any:
+    """Run ``analyze`` on the file bytes once per distinct content in the run."""
+    if memo is None:
+        return analyze(file_path.read_bytes())
+    digest = hash_cache.lookup(relative_path, file_path) if hash_cache else None
+    raw: bytes | None = None
+    if not digest:
+        raw = file_path.read_bytes()
+        digest = (
+            hash_cache.record(relative_path, file_path, raw)
+            if hash_cache
+            else fingerprint_content(raw)
+        )
+    hit, value = memo.get(kind, digest)
+    if hit:
+        return value
+    value = analyze(raw if raw is not None else file_path.read_bytes())
+    memo.put(kind, digest, value)
+    return value
+
+
+def test_content_has_assertion(raw: bytes) -> bool:
+    return "expect(" in raw.decode("utf-8-sig", errors="replace")
+
+
+def scan_untouched_template_files(
+    project_dir: Path,
+    manifest_files: dict[str, dict[str, Any]],
+    hash_cache: FileHashCache,
+    app_name: str = "",
+) -> list[str]:
+    untouched: list[str] = []
+    for relative_path in sorted(manifest_files):
+        entry = manifest_files[relative_path]
+        token_values = (
+            {"__APP_NAME__": app_name}
+            if app_name and "__APP_NAME__" in entry.get("tokens", [])
+            else None
+        )
+        digest = hash_cache.fingerprint(
+            relative_path, project_dir / relative_path, token_values
+        )
+        if digest and digest == entry.get("sha256"):
+            untouched.append(relative_path)
+    return untouched
+
+
+def load_prd_implementation_report(path: Path) -> dict[str, Any]:
+    report = load_json(path)
+    requirements = report.get("requirements")
+    if not isinstance(requirements, list):
+        raise ValueError(
+            f"{path} is missing 'requirements' array for PRD implementation mapping."
+        )
+    return report
+
+
+REQUIRED_HUMAN_INPUT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("APP_NAME", "product-owner"),
+    ("IOS_BUNDLE_ID", "mobile-lead"),
+    ("ASC_APP_ID", "release-manager"),
+    ("ASC_SKU", "product-owner"),
+    ("PRIMARY_LANGUAGE", "product-owner"),
+    ("APPLE_DEV_MEMBERSHIP_ACTIVE", "release-manager"),
+    ("APP_STORE_CONNECT_ROLE_OK", "release-manager"),
+    ("EXPO_EAS_ACCESS_OK", "mobile-lead"),
+    ("GITHUB_REPO_READY", "mobile-lead"),
+    ("RELEASE_BRANCH", "mobile-lead"),
+    ("GITHUB_SECRET_EXPO_TOKEN", "release-manager"),
+    ("ASC_API_KEY_CONFIGURED", "release-manager"),
+    ("SUPPORT_URL", "product-owner"),
+    ("PRIVACY_POLICY_URL", "legal"),
+)
+
+YES_NO_HUMAN_INPUT_FIELDS: tuple[str, ...] = (
+    "APPLE_DEV_MEMBERSHIP_ACTIVE",
+    "APP_STORE_CONNECT_ROLE_OK",
+    "EXPO_EAS_ACCESS_OK",
+    "GITHUB_REPO_READY",
+    "ASC_API_KEY_CONFIGURED",
+    "SCREENSHOTS_READY",
+    "TESTFLIGHT_INTERNAL_TESTERS_READY",
+    "REVIEW_NOTES_READY",
+)
+
+
+def strip_optional_quotes(value: str) -> str:
+    normalized = value.strip()
+    if len(normalized) >= 2:
+        if normalized[0] == normalized[-1] and normalized[0] in ("'", '"'):
+            return normalized[1:-1].strip()
+    return normalized
+
+
+def parse_human_inputs_markdown(path: Path) -> dict[str, str]:
+    values: dict[str, str] = {}
+    content = path.read_text(encoding="utf-8-sig")
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = re.match(r"^([A-Z0-9_]+)\s*=\s*(.*)$", stripped)
+        if not match:
+            continue
+        key = match.group(1)
+        raw_value = match.group(2)
+        values[key] = strip_optional_quotes(raw_value)
+    return values
+
+
+def extract_app_identity(
+    project_dir: Path, use_app_config_ts: bool, app_config_ts: dict[str, Any] | None
+) -> dict[str, str]:
+    identity: dict[str, str] = {
+        "name": "",
+        "bundleIdentifier": "",
+        "version": "",
+        "buildNumber": "",
+    }
+
+    if not use_app_config_ts and (project_dir / "app.json").exists():
+        expo = read_app_json_expo(project_dir)
+    else:
+        expo = app_config_ts
+    if not isinstance(expo, dict):
+        return identity
+
+    ios = expo.get("ios")
+    if isinstance(ios, dict):
+        bundle = ios.get("bundleIdentifier")
+        build_number = ios.get("buildNumber")
+        if isinstance(bundle, str):
+            identity["bundleIdentifier"] = bundle.strip()
+        if isinstance(build_number, str):
+            identity["buildNumber"] = build_number.strip()
+    version = expo.get("version")
+    if isinstance(version, str):
+        identity["version"] = version.strip()
+    name = expo.get("name")
+    if isinstance(name, str):
+        identity["name"] = name.strip()
+    return identity
+
+
+def print_report(report: dict[str, Any]) -> None:
+    for check in report["checks"]:
+        print_check_result(check)
+    for module_check in report["moduleChecks"]:
+        print_check_result(
+            {
+                "id": module_check["id"],
+                "name": module_check["name"],
+                "blocking": "Module",
+                "result": module_check["result"],
+                "reason": module_check.get("reason", ""),
+            }
+        )
+
+    status = report["status"]
+    if status == "pass":
+        print("Validation passed.")
+    elif status == "partial":
+        print("Validation partial: blockers passed but conditional or feature checks need follow-up.")
+    else:
+        print("Validation failed.")
+
+
+def write_report_json(report_path: Path, report: dict[str, Any]) -> None:
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(
+        json.dumps(report, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    print(f"[OK] Wrote report: {report_path}")
+
+
+def load_fleet_manifest(path: Path, default_prd_path: str | None) -> list[dict[str, str]]:
+    manifest = load_json(path)
+    raw_projects = manifest.get("projects")
+    if not isinstance(raw_projects, list):
+        raise ValueError(f"{path} is missing 'projects' array.")
+    base_dir = path.parent
+    projects: list[dict[str, str]] = []
+    for item in raw_projects:
+        if isinstance(item, str):
+            item = {"projectDir": item}
+        if not isinstance(item, dict) or not isinstance(item.get("projectDir"), str):
+            raise ValueError(f"{path} has a project entry without projectDir: {item!r}")
+        prd_path = item.get("prdPath") or default_prd_path
+        if not isinstance(prd_path, str) or not prd_path:
+            raise ValueError(
+                f"{path} entry {item['projectDir']} has no prdPath and --prd-path is not set."
+            )
+        entry = {
+            "fleetKey": PurePosixPath(Path(item["projectDir"]).as_posix()).as_posix(),
+            "projectDir": str((base_dir / item["projectDir"]).resolve()),
+            "prdPath": str((base_dir / prd_path).resolve()),
+        }
+        report_path = item.get("implementationReportPath")
+        if isinstance(report_path, str) and report_path:
+            entry["implementationReportPath"] = str((base_dir / report_path).resolve())
+        projects.append(entry)
+    return projects
+
+
+def compute_fleet_status(statuses: list[str]) -> str:
+    if "fail" in statuses:
+        return "fail"
+    if "partial" in statuses:
+        return "partial"
+    return "pass"
+
+
+def parse_shard_spec(value: str) -> tuple[int, int]:
+    """Parse a 1-based ``INDEX/COUNT`` shard spec, e.g. ``2/8``."""
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+    if not match:
+        raise argparse.ArgumentTypeError("shard must look like INDEX/COUNT, e.g. 1/4")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("shard INDEX must be between 1 and COUNT")
+    return index, count
+
+
+def stable_project_hash(fleet_key: str) -> int:
+    return int.from_bytes(hashlib.sha256(fleet_key.encode("utf-8")).digest()[:8], "big")
+
+
+def assign_shards(
+    fleet_keys: list[str], count: int, durations: dict[str, float] | None = None
+) -> dict[str, int]:
+    """Map fleet keys to 1-based shards, identically on every runner.
+
+    Without history each project goes to ``hash % count``. With recorded
+    durations, projects are placed longest first onto the least-loaded shard,
+    with unknown projects weighted at the median duration.
+    """
+    if not durations:
+        return {key: stable_project_hash(key) % count + 1 for key in fleet_keys}
+    known = sorted(durations[key] for key in fleet_keys if key in durations)
+    fallback = known[len(known) // 2] if known else 1.0
+    ordered = sorted(
+        fleet_keys,
+        key=lambda key: (-durations.get(key, fallback), stable_project_hash(key), key),
+    )
+    loads = [0.0] * count
+    assignment: dict[str, int] = {}
+    for key in ordered:
+        shard = min(range(count), key=lambda index: (loads[index], index))
+        loads[shard] += durations.get(key, fallback)
+        assignment[key] = shard + 1
+    return assignment
+
+
+def iter_fleet_report_projects(
+    path: Path,
+) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Return (fleet-level fields, project reports) for a fleet or single report.
+
+    Compact reports decompress one project per step of the iterator; JSON
+    reports are parsed whole.
+    """
+    if path.name.endswith(COMPACT_REPORT_SUFFIX):
+        index = load_compact_report_index(path)
+        return index["fleet"], (
+            read_compact_project(path, index, entry) for entry in index["projects"]
+        )
+    report = load_json(path)
+    if report.get("kind") == "fleet":
+        projects = report.get("projects")
+        if not isinstance(projects, list):
+            raise ValueError(f"{path} is missing 'projects' array.")
+        return report, (item for item in projects if isinstance(item, dict))
+    if "checks" not in report or "status" not in report:
+        raise ValueError(f"{path} is not a validator report.")
+    return {}, iter([report])
+
+
+COMPACT_REPORT_FORMAT = "expo-ios-validator-fleet-jsonl"
+COMPACT_REPORT_SUFFIX = ".jsonl.gz"
+COMPACT_CHECK_FIELDS: tuple[str, ...] = ("id", "name", "blocking", "result", "reason")
+COMPACT_MODULE_CHECK_FIELDS: tuple[str, ...] = ("id", "name", "result", "reason")
+COMPACT_STRING_LIST_FIELDS: tuple[str, ...] = (
+    "failedChecks",
+    "warnings",
+    "prdRequirementIds",
+    "p0RequirementIds",
+    "missingRequirementMappings",
+    "p0ImplementationFailures",
+    "placeholderFindings",
+    "untouchedTemplateFiles",
+    "requirementTagFindings",
+    "secretFindings",
+)
+
+
+class StringTable:
+    """Interned strings referenced by index from compact project records."""
+
+    def __init__(self, strings: list[str] | None = None) -> None:
+        self.strings = strings or []
+        self.indexes = {value: index for index, value in enumerate(self.strings)}
+
+    def intern(self, value: str) -> int:
+        index = self.indexes.get(value)
+        if index is None:
+            index = self.indexes[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def encode_compact_checks(
+    checks: list[dict[str, Any]], fields: tuple[str, ...], strings: StringTable
+) -> list[list[Any]]:
+    """Checks as rows of interned ``fields`` plus durationMs and any extra keys."""
+    rows: list[list[Any]] = []
+    for check in checks:
+        row: list[Any] = [strings.intern(str(check.get(name, ""))) for name in fields]
+        extra = {key: value for key, value in check.items() if key not in fields}
+        row.append(extra.pop("durationMs", None))
+        if extra:
+            row.append(extra)
+        rows.append(row)
+    return rows
+
+
+def decode_compact_checks(
+    rows: list[list[Any]], fields: tuple[str, ...], strings: list[str]
+) -> list[dict[str, Any]]:
+    checks: list[dict[str, Any]] = []
+    for row in rows:
+        check: dict[str, Any] = {name: strings[row[index]] for index, name in enumerate(fields)}
+        if row[len(fields)] is not None:
+            check["durationMs"] = row[len(fields)]
+        if len(row) > len(fields) + 1:
+            check.update(row[len(fields) + 1])
+        checks.append(check)
+    return checks
+
+
+def encode_compact_project(report: dict[str, Any], strings: StringTable) -> dict[str, Any]:
+    encoded = dict(report)
+    encoded["checks"] = encode_compact_checks(report["checks"], COMPACT_CHECK_FIELDS, strings)
+    encoded["moduleChecks"] = encode_compact_checks(
+        report["moduleChecks"], COMPACT_MODULE_CHECK_FIELDS, strings
+    )
+    for name in COMPACT_STRING_LIST_FIELDS:
+        if isinstance(report.get(name), list):
+            encoded[name] = [strings.intern(str(value)) for value in report[name]]
+    return encoded
+
+
+def decode_compact_project(encoded: dict[str, Any], strings: list[str]) -> dict[str, Any]:
+    report = dict(encoded)
+    report["checks"] = decode_compact_checks(encoded["checks"], COMPACT_CHECK_FIELDS, strings)
+    report["moduleChecks"] = decode_compact_checks(
+        encoded["moduleChecks"], COMPACT_MODULE_CHECK_FIELDS, strings
+    )
+    for name in COMPACT_STRING_LIST_FIELDS:
+        if isinstance(encoded.get(name), list):
+            report[name] = [strings[index] for index in encoded[name]]
+    return report
+
+
+class StreamedFleetReportWriter:
+    """Schema-v4 fleet report JSON with projects written as they arrive.
+
+    Projects come first so merges stay memory-bounded; fleet totals follow
+    once every project has been seen.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.partial_path = path.with_name(path.name + ".partial")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.partial_path.open("w", encoding="utf-8")
+        self.handle.write('{\n  "projects": [')
+        self.count = 0
+
+    def add_project(self, report: dict[str, Any]) -> None:
+        self.handle.write(("," if self.count else "") + "\n    ")
+        self.handle.write(json.dumps(report, sort_keys=True))
+        self.count += 1
+
+    def close(self, fleet_fields: dict[str, Any]) -> None:
+        fields = {key: value for key, value in fleet_fields.items() if key != "projects"}
+        body = json.dumps(fields, indent=2, sort_keys=True)
+        self.handle.write("\n  ],\n" + body[body.index("\n") + 1 :] + "\n")
+        self.handle.close()
+        os.replace(self.partial_path, self.path)
+
+    def abort(self) -> None:
+        self.handle.close()
+        self.partial_path.unlink(missing_ok=True)
+
+
+class CompactFleetReportWriter:
+    """Fleet report as gzip-compressed JSONL, written as projects finish.
+
+    Each project is its own gzip member, so a reader can decompress one
+    project from its offset in the sidecar ``<report>.index.json`` without
+    touching the rest. Check names, reasons and findings are interned in a
+    string table stored in the trailing member and in the index.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.index_path = compact_report_index_path(path)
+        self.partial_path = path.with_name(path.name + ".partial")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.partial_path.open("wb")
+        self.strings = StringTable()
+        self.projects: list[dict[str, Any]] = []
+        self.write_member({"format": COMPACT_REPORT_FORMAT, "version": 1})
+
+    def write_member(self, record: dict[str, Any]) -> tuple[int, int]:
+        offset = self.handle.tell()
+        line = json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n"
+        self.handle.write(gzip.compress(line.encode("utf-8"), mtime=0))
+        self.handle.flush()
+        return offset, self.handle.tell() - offset
+
+    def add_project(self, report: dict[str, Any]) -> None:
+        offset, length = self.write_member(
+            {"project": encode_compact_project(report, self.strings)}
+        )
+        self.projects.append(
+            {
+                "fleetKey": report.get("fleetKey"),
+                "projectDir": report["projectDir"],
+                "status": report["status"],
+                "offset": offset,
+                "length": length,
+            }
+        )
+
+    def close(self, fleet_fields: dict[str, Any]) -> None:
+        fields = {key: value for key, value in fleet_fields.items() if key != "projects"}
+        self.write_member({"fleet": fields, "strings": self.strings.strings})
+        self.handle.close()
+        index = {
+            "format": COMPACT_REPORT_FORMAT,
+            "version": 1,
+            "fleet": fields,
+            "strings": self.strings.strings,
+            "projects": sorted(self.projects, key=lambda entry: entry["projectDir"]),
+        }
+        index_partial = self.index_path.with_name(self.index_path.name + ".partial")
+        index_partial.write_text(json.dumps(index, sort_keys=True), encoding="utf-8")
+        os.replace(self.partial_path, self.path)
+        os.replace(index_partial, self.index_path)
+
+    def abort(self) -> None:
+        self.handle.close()
+        self.partial_path.unlink(missing_ok=True)
+
+
+def compact_report_index_path(path: Path) -> Path:
+    return path.with_name(path.name[: -len(COMPACT_REPORT_SUFFIX)] + ".index.json")
+
+
+def load_compact_report_index(path: Path) -> dict[str, Any]:
+    index = load_json(compact_report_index_path(path))
+    if index.get("format") != COMPACT_REPORT_FORMAT or not isinstance(
+        index.get("projects"), list
+    ):
+        raise ValueError(f"{compact_report_index_path(path)} is not a compact fleet report index.")
+    return index
+
+
+def read_compact_project(
+    path: Path, index: dict[str, Any], entry: dict[str, Any]
+) -> dict[str, Any]:
+    """Decompress one project's gzip member using its index offset."""
+    try:
+        with path.open("rb") as handle:
+            handle.seek(entry["offset"])
+            record = json.loads(gzip.decompress(handle.read(entry["length"])))
+    except (OSError, EOFError, ValueError, KeyError) as exc:
+        raise ValueError(f"Failed to read {entry.get('projectDir')} from {path}: {exc}") from exc
+    return decode_compact_project(record["project"], index["strings"])
+
+
+def load_project_durations(path: Path) -> dict[str, float]:
+    """Read per-project ``durationMs`` from a previous fleet report."""
+    _, projects = iter_fleet_report_projects(path)
+    durations: dict[str, float] = {}
+    for project in projects:
+        key = project.get("fleetKey") or project.get("projectDir")
+        duration = project.get("durationMs")
+        if isinstance(key, str) and isinstance(duration, (int, float)):
+            durations[key] = float(duration)
+    return durations
+
+
+class FleetSummary:
+    """Fleet-level totals accumulated one project report at a time."""
+
+    def __init__(self) -> None:
+        self.project_count = 0
+        self.status_counts = {key: 0 for key in ("pass", "partial", "fail")}
+        self.failed_check_counts: dict[str, int] = {}
+        self.blocking_projects = 0
+        self.dedup_lookups: dict[str, int] = {}
+        self.dedup_hits: dict[str, int] = {}
+        self.started_at = ""
+        self.finished_at = ""
+
+    def add_project(self, report: dict[str, Any]) -> None:
+        self.project_count += 1
+        status = str(report.get("status", "fail"))
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        for check_id in report.get("failedChecks", []):
+            self.failed_check_counts[check_id] = self.failed_check_counts.get(check_id, 0) + 1
+        self.blocking_projects += compute_exit_code(
+            status, report.get("checks", []) + report.get("moduleChecks", [])
+        )
+
+    def add_run(self, fleet_fields: dict[str, Any]) -> None:
+        started_at = fleet_fields.get("startedAt")
+        finished_at = fleet_fields.get("finishedAt")
+        if isinstance(started_at, str) and (not self.started_at or started_at < self.started_at):
+            self.started_at = started_at
+        if isinstance(finished_at, str) and finished_at > self.finished_at:
+            self.finished_at = finished_at
+        dedup = fleet_fields.get("contentDedup")
+        by_kind = dedup.get("byKind") if isinstance(dedup, dict) else None
+        if isinstance(by_kind, dict):
+            for kind, counts in by_kind.items():
+                if not isinstance(counts, dict):
+                    continue
+                self.dedup_lookups[kind] = self.dedup_lookups.get(kind, 0) + int(counts.get("lookups", 0))
+                self.dedup_hits[kind] = self.dedup_hits.get(kind, 0) + int(counts.get("hits", 0))
+
+    @property
+    def status(self) -> str:
+        return compute_fleet_status(
+            [status for status, count in self.status_counts.items() if count]
+        )
+
+    @property
+    def exit_code(self) -> int:
+        """Non-zero when any project would fail on its own; budget-only partials pass."""
+        return 1 if self.blocking_projects else 0
+
+    def to_report(self) -> dict[str, Any]:
+        lookups = sum(self.dedup_lookups.values())
+        hits = sum(self.dedup_hits.values())
+        return {
+            "schemaVersion": 4,
+            "kind": "fleet",
+            "status": self.status,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "projectCount": self.project_count,
+            "statusCounts": self.status_counts,
+            "failedChecks": sorted(self.failed_check_counts),
+            "failedCheckCounts": dict(sorted(self.failed_check_counts.items())),
+            "contentDedup": {
+                "lookups": lookups,
+                "hits": hits,
+                "hitRate": round(hits / lookups, 4) if lookups else 0.0,
+                "byKind": {
+                    kind: {"lookups": count, "hits": self.dedup_hits.get(kind, 0)}
+                    for kind, count in sorted(self.dedup_lookups.items())
+                },
+            },
+        }
+
+    def print_summary(self, label: str) -> None:
+        dedup = self.to_report()["contentDedup"]
+        print(
+            f"{label} {self.status}: {self.status_counts['pass']} pass, "
+            f"{self.status_counts['partial']} partial, {self.status_counts['fail']} fail "
+            f"of {self.project_count} projects. Content dedup hit rate "
+            f"{dedup['hitRate']:.1%} ({dedup['hits']}/{dedup['lookups']})."
+        )
+
+
+class ValidationJournal:
+    """Append-only JSONL log of completed fleet projects, fsync'd per entry."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = path.open("a+", encoding="utf-8")
+        if self.handle.tell() > 0:
+            self.handle.seek(self.handle.tell() - 1)
+            if self.handle.read(1) != "\n":
+                # Terminate a line torn by an interrupted run before appending.
+                self.handle.write("\n")
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, sort_keys=True) + "\n"
+        with self.lock:
+            self.handle.write(line)
+            self.handle.flush()
+            os.fsync(self.handle.fileno())
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def read_validation_journal(path: Path) -> dict[str, dict[str, Any]]:
+    """Latest journal record per fleet key; torn or invalid lines are ignored."""
+    records: dict[str, dict[str, Any]] = {}
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except OSError:
+        return records
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if (
+                isinstance(record, dict)
+                and isinstance(record.get("fleetKey"), str)
+                and isinstance(record.get("report"), dict)
+            ):
+                records[record["fleetKey"]] = record
+    return records
+
+
+FLEET_HISTORY_WINDOW = 10
+FLEET_LIKELY_FAILURE_RATE = 0.5
+# Expected cost of a project with no recorded duration, per input file.
+FLEET_ESTIMATED_MS_PER_FILE = 2.0
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    project_dir TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    status TEXT NOT NULL,
+    input_fingerprint TEXT,
+    git_revision TEXT,
+    duration_ms INTEGER
+);
+CREATE TABLE IF NOT EXISTS check_results (
+    result_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    project TEXT NOT NULL,
+    check_id TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    input_fingerprint TEXT,
+    result TEXT NOT NULL,
+    reason TEXT,
+    duration_ms REAL
+);
+CREATE INDEX IF NOT EXISTS runs_by_project ON runs (project, started_at);
+CREATE INDEX IF NOT EXISTS runs_by_fingerprint ON runs (input_fingerprint);
+CREATE INDEX IF NOT EXISTS check_results_by_project
+    ON check_results (project, check_id, started_at, run_id);
+CREATE INDEX IF NOT EXISTS check_results_by_check
+    ON check_results (check_id, started_at);
+"""
+HISTORY_CHECK_COLUMNS = (
+    "run_id, project, check_id, started_at, input_fingerprint, result, reason, duration_ms"
+)
+
+
+def open_history_db(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path), timeout=30)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(HISTORY_SCHEMA)
+    return connection
+
+
+def record_validation_history(path: Path, reports: list[dict[str, Any]]) -> None:
+    """Append one run row per project report, plus a row per check, in one transaction."""
+    connection = open_history_db(path)
+    try:
+        with connection:
+            for report in reports:
+                project = str(report.get("fleetKey") or report["projectDir"])
+                fingerprint = report.get("inputFingerprint")
+                run_id = connection.execute(
+                    "INSERT INTO runs (project, project_dir, started_at, finished_at, status, "
+                    "input_fingerprint, git_revision, duration_ms) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        project,
+                        report["projectDir"],
+                        report["startedAt"],
+                        report.get("finishedAt"),
+                        report["status"],
+                        fingerprint,
+                        report.get("gitRevision"),
+                        report.get("durationMs"),
+                    ),
+                ).lastrowid
+                connection.executemany(
+                    f"INSERT INTO check_results ({HISTORY_CHECK_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run_id,
+                            project,
+                            check["id"],
+                            report["startedAt"],
+                            fingerprint,
+                            check["result"],
+                            check.get("reason", ""),
+                            check.get("durationMs"),
+                        )
+                        for check in report["checks"] + report["moduleChecks"]
+                    ],
+                )
+    finally:
+        connection.close()
+
+
+def query_slowest_checks(
+    connection: sqlite3.Connection, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    rows = connection.execute(
+        "SELECT check_id, COUNT(*) AS runs, AVG(duration_ms) AS avg_ms, "
+        "MAX(duration_ms) AS max_ms, MAX(started_at) AS last_run "
+        "FROM check_results "
+        "WHERE duration_ms IS NOT NULL AND started_at >= :since "
+        "AND (:project IS NULL OR project = :project) "
+        "GROUP BY check_id ORDER BY avg_ms DESC LIMIT :limit",
+        {"since": args.since or "", "project": args.project, "limit": args.limit},
+    )
+    return [dict(row) for row in rows]
+
+
+def query_duration_regressions(
+    connection: sqlite3.Connection, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    """Compare each project check's latest --window runs with the window before it."""
+    rows = connection.execute(
+        """
+        WITH ranked AS (
+            SELECT project, check_id, duration_ms, started_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY project, check_id
+                       ORDER BY started_at DESC, run_id DESC, result_id DESC
+                   ) AS recency
+            FROM check_results
+            WHERE duration_ms IS NOT NULL
+              AND (:project IS NULL OR project = :project)
+              AND (:check IS NULL OR check_id = :check)
+        ), windows AS (
+            SELECT project, check_id,
+                   AVG(CASE WHEN recency <= :window THEN duration_ms END) AS recent_ms,
+                   AVG(CASE WHEN recency > :window THEN duration_ms END) AS baseline_ms
+            FROM ranked
+            WHERE recency <= 2 * :window
+            GROUP BY project, check_id
+        )
+        SELECT windows.project, windows.check_id, baseline_ms, recent_ms,
+               recent_ms / baseline_ms AS ratio,
+               MIN(ranked.started_at) AS first_slow_run
+        FROM windows
+        JOIN ranked ON ranked.project = windows.project
+                   AND ranked.check_id = windows.check_id
+                   AND ranked.recency <= :window
+                   AND ranked.duration_ms >= :ratio * baseline_ms
+        WHERE baseline_ms > 0
+          AND recent_ms >= :ratio * baseline_ms
+          AND recent_ms - baseline_ms >= :min_ms
+        GROUP BY windows.project, windows.check_id
+        ORDER BY recent_ms - baseline_ms DESC
+        LIMIT :limit
+        """,
+        {
+            "project": args.project,
+            "check": args.check,
+            "window": args.window,
+            "ratio": args.ratio,
+            "min_ms": args.min_ms,
+            "limit": args.limit,
+        },
+    )
+    return [dict(row) for row in rows]
+
+
+def query_flapping_checks(
+    connection: sqlite3.Connection, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    """Count result changes across each project check's latest --window runs."""
+    rows = connection.execute(
+        """
+        WITH ranked AS (
+            SELECT project, check_id, run_id, result_id, result, input_fingerprint, started_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY project, check_id
+                       ORDER BY started_at DESC, run_id DESC, result_id DESC
+                   ) AS recency
+            FROM check_results
+            WHERE result != 'skipped'
+              AND (:project IS NULL OR project = :project)
+              AND (:check IS NULL OR check_id = :check)
+        ), transitions AS (
+            SELECT project, check_id, result, input_fingerprint, started_at,
+                   LAG(result) OVER run_order AS previous_result,
+                   LAG(input_fingerprint) OVER run_order AS previous_fingerprint
+            FROM ranked
+            WHERE recency <= :window
+            WINDOW run_order AS (
+                PARTITION BY project, check_id ORDER BY started_at, run_id, result_id
+            )
+        )
+        SELECT project, check_id, COUNT(*) AS runs,
+               SUM(result != previous_result) AS flips,
+               SUM(result != previous_result
+                   AND input_fingerprint = previous_fingerprint) AS flips_same_inputs,
+               GROUP_CONCAT(DISTINCT result) AS results,
+               MAX(started_at) AS last_run
+        FROM transitions
+        GROUP BY project, check_id
+        HAVING flips >= :min_flips
+        ORDER BY flips_same_inputs DESC, flips DESC, project, check_id
+        LIMIT :limit
+        """,
+        {
+            "project": args.project,
+            "check": args.check,
+            "window": args.window,
+            "min_flips": args.min_flips,
+            "limit": args.limit,
+        },
+    )
+    return [dict(row) for row in rows]
+
+
+def load_project_history(
+    path: Path, window: int = FLEET_HISTORY_WINDOW
+) -> dict[str, dict[str, float]]:
+    """Mean duration and failure rate of each project's latest runs."""
+    if not path.is_file():
+        return {}
+    connection = open_history_db(path)
+    try:
+        rows = connection.execute(
+            """
+            WITH recent AS (
+                SELECT project, status, duration_ms,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY project ORDER BY started_at DESC, run_id DESC
+                       ) AS recency
+                FROM runs
+            )
+            SELECT project, AVG(duration_ms) AS duration_ms,
+                   AVG(status = 'fail') AS failure_rate
+            FROM recent
+            WHERE recency <= :window
+            GROUP BY project
+            """,
+            {"window": window},
+        ).fetchall()
+    finally:
+        connection.close()
+    return {
+        row["project"]: {
+            "durationMs": row["duration_ms"],
+            "failureRate": row["failure_rate"],
+        }
+        for row in rows
+    }
+
+
+def schedule_fleet_projects(
+    projects: list[dict[str, str]],
+    history: dict[str, dict[str, float]],
+    durations: dict[str, float],
+) -> tuple[list[dict[str, str]], dict[str, Any]]:
+    """Order fleet projects for the worker pool.
+
+    Projects that failed in most of their recent runs start first so their
+    failures surface early; within each group the longest expected projects
+    start first (longest-processing-time), which keeps one large project from
+    running alone at the end. Expected durations come from run history, then
+    from ``--shard-durations``; only the remaining projects are walked, and
+    their file counts are scaled by FLEET_ESTIMATED_MS_PER_FILE.
+    """
+    expected: dict[str, float] = {}
+    for project in projects:
+        key = project["fleetKey"]
+        recorded = history.get(key, {}).get("durationMs")
+        if recorded is None:
+            recorded = durations.get(key)
+        if recorded is not None:
+            expected[key] = float(recorded)
+
+    estimated = [project for project in projects if project["fleetKey"] not in expected]
+    for project in estimated:
+        file_count = len(iter_source_files(Path(project["projectDir"]), INPUT_FINGERPRINT_ROOTS))
+        expected[project["fleetKey"]] = file_count * FLEET_ESTIMATED_MS_PER_FILE
+
+    def likely_to_fail(key: str) -> bool:
+        return (history.get(key, {}).get("failureRate") or 0.0) >= FLEET_LIKELY_FAILURE_RATE
+
+    ordered = sorted(
+        projects,
+        key=lambda project: (
+            not likely_to_fail(project["fleetKey"]),
+            -expected[project["fleetKey"]],
+            project["fleetKey"],
+        ),
+    )
+    from_history = sum(
+        1 for project in projects if history.get(project["fleetKey"], {}).get("durationMs") is not None
+    )
+    schedule = {
+        "historyProjects": from_history,
+        "durationReportProjects": len(projects) - from_history - len(estimated),
+        "estimatedProjects": len(estimated),
+        "likelyFailures": sum(1 for project in projects if likely_to_fail(project["fleetKey"])),
+        "expectedWorkMs": int(sum(expected.values())),
+    }
+    return ordered, schedule
+
+
+HISTORY_QUERIES: dict[str, tuple[Callable[..., list[dict[str, Any]]], tuple[str, ...]]] = {
+    "slowest": (query_slowest_checks, ("check_id", "runs", "avg_ms", "max_ms", "last_run")),
+    "regressions": (
+        query_duration_regressions,
+        ("project", "check_id", "baseline_ms", "recent_ms", "ratio", "first_slow_run"),
+    ),
+    "flapping": (
+        query_flapping_checks,
+        ("project", "check_id", "runs", "flips", "flips_same_inputs", "results", "last_run"),
+    ),
+}
+
+
+def validate_fleet_project(
+    args: argparse.Namespace,
+    project: dict[str, str],
+    memo: ContentMemo,
+    journal: ValidationJournal | None = None,
+    resumable: dict[str, dict[str, Any]] | None = None,
+    events: EventStream | None = None,
+) -> tuple[dict[str, Any], bool]:
+    """Validate one manifest project; returns (report, resumed from journal)."""
+    project_args = argparse.Namespace(
+        **{
+            **vars(args),
+            "project_dir": project["projectDir"],
+            "prd_path": project["prdPath"],
+            "implementation_report_path": project.get("implementationReportPath"),
+            "cache_dir": fleet_project_cache_dir(args.cache_dir, project["fleetKey"]),
+        }
+    )
+    input_fingerprint = ""
+    if journal is not None:
+        input_fingerprint, _ = project_input_fingerprint(project_args)
+        previous = (resumable or {}).get(project["fleetKey"])
+        if previous and previous.get("inputFingerprint") == input_fingerprint:
+            if args.resume and journal.path != Path(args.resume).resolve():
+                journal.append(previous)
+            return previous["report"], True
+
+    project_args.input_fingerprint = input_fingerprint
+    report = validate_project(
+        project_args, memo, events.bind(project=project["fleetKey"]) if events else None
+    )
+    report["fleetKey"] = project["fleetKey"]
+    if journal is not None:
+        journal.append(
+            {
+                "fleetKey": project["fleetKey"],
+                "projectDir": project["projectDir"],
+                "inputFingerprint": input_fingerprint,
+                "recordedAt": utc_now_iso(),
+                "report": report,
+            }
+        )
+    return report, False
+
+
+def run_fleet_validation(args: argparse.Namespace, events: EventStream | None = None) -> int:
+    manifest_path = Path(args.fleet_manifest).resolve()
+    try:
+        projects = load_fleet_manifest(manifest_path, args.prd_path)
+    except ValueError as exc:
+        print(f"[FAIL] {exc}")
+        return 1
+
+    durations: dict[str, float] = {}
+    if args.shard_durations:
+        try:
+            durations = load_project_durations(Path(args.shard_durations).resolve())
+        except ValueError as exc:
+            print(f"[WARN] Ignoring shard duration history: {exc}")
+    if args.shard:
+        shard_index, shard_count = args.shard
+        assignment = assign_shards(
+            [project["fleetKey"] for project in projects], shard_count, durations
+        )
+        projects = [
+            project for project in projects if assignment[project["fleetKey"]] == shard_index
+        ]
+        print(f"[OK] Shard {shard_index}/{shard_count}: {len(projects)} projects.")
+
+    compact_writer = (
+        CompactFleetReportWriter(Path(args.report_path).resolve())
+        if args.report_path and args.report_path.endswith(COMPACT_REPORT_SUFFIX)
+        else None
+    )
+    journal_path = args.journal or args.resume
+    journal = ValidationJournal(Path(journal_path).resolve()) if journal_path else None
+    resumable = read_validation_journal(Path(args.resume).resolve()) if args.resume else {}
+
+    history = load_project_history(Path(args.history_db).resolve()) if args.history_db else {}
+    projects, schedule = schedule_fleet_projects(projects, history, durations)
+    print(
+        f"[OK] Scheduled {len(projects)} projects longest first: "
+        f"{schedule['historyProjects']} from run history, "
+        f"{schedule['durationReportProjects']} from --shard-durations, "
+        f"{schedule['estimatedProjects']} estimated by file count, "
+        f"{schedule['likelyFailures']} likely failures first."
+    )
+
+    started_at = utc_now_iso()
+    run_started = time.monotonic()
+    first_failure_ms: int | None = None
+    memo = ContentMemo()
+    reports: list[dict[str, Any]] = []
+    fresh_reports: list[dict[str, Any]] = []
+    resumed_count = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = [
+                executor.submit(
+                    validate_fleet_project, args, project, memo, journal, resumable, events
+                )
+                for project in projects
+            ]
+            for future in as_completed(futures):
+                report, resumed = future.result()
+                reports.append(report)
+                if compact_writer is not None:
+                    compact_writer.add_project(report)
+                if events is not None:
+                    events.emit(
+                        "project",
+                        {
+                            "project": report.get("fleetKey"),
+                            "projectDir": report["projectDir"],
+                            "status": report["status"],
+                            "failedChecks": report["failedChecks"],
+                            "durationMs": report.get("durationMs"),
+                            "resumed": resumed,
+                        },
+                    )
+                if resumed:
+                    resumed_count += 1
+                    print(f"[SKIP] {report['projectDir']}: unchanged since journal entry")
+                    continue
+                fresh_reports.append(report)
+                if report["status"] == "fail" and first_failure_ms is None:
+                    first_failure_ms = int((time.monotonic() - run_started) * 1000)
+                prefix = {"pass": "[OK]", "partial": "[PARTIAL]"}.get(
+                    report["status"], "[FAIL]"
+                )
+                failed = ", ".join(report["failedChecks"])
+                print(
+                    f"{prefix} {report['projectDir']} ({report['durationMs']} ms)"
+                    + (f": {failed}" if failed else "")
+                )
+    finally:
+        if journal is not None:
+            journal.close()
+
+    if journal is not None:
+        recorded = read_validation_journal(journal.path)
+        reports = [
+            recorded[project["fleetKey"]]["report"]
+            for project in projects
+            if project["fleetKey"] in recorded
+        ]
+    reports.sort(key=lambda item: item["projectDir"])
+
+    summary = FleetSummary()
+    for report in reports:
+        summary.add_project(report)
+    summary.add_run(
+        {"startedAt": started_at, "finishedAt": utc_now_iso(), "contentDedup": memo.to_report()}
+    )
+    summary.print_summary("Fleet validation")
+
+    fleet_report = summary.to_report()
+    fleet_report["contentDedup"]["uniqueEntries"] = memo.to_report()["uniqueEntries"]
+    fleet_report["fleetManifest"] = str(manifest_path)
+    fleet_report["shard"] = (
+        {"index": args.shard[0], "count": args.shard[1]} if args.shard else None
+    )
+    fleet_report["resumedCount"] = resumed_count
+    if args.remote_cache:
+        remote_totals = {"lookups": 0, "hits": 0, "misses": 0, "uploads": 0, "errors": 0}
+        for report in reports:
+            for name in remote_totals:
+                remote_totals[name] += (report.get("remoteCache") or {}).get(name, 0)
+        fleet_report["remoteCache"] = {"url": args.remote_cache, **remote_totals}
+    fleet_report["schedule"] = {
+        **schedule,
+        "jobs": max(1, args.jobs),
+        "wallClockMs": int((time.monotonic() - run_started) * 1000),
+        "firstFailureMs": first_failure_ms,
+    }
+    fleet_report["projects"] = reports
+    if compact_writer is not None:
+        compact_writer.close(fleet_report)
+        print(f"[OK] Wrote report: {compact_writer.path} (index {compact_writer.index_path.name})")
+    elif args.report_path:
+        write_report_json(Path(args.report_path).resolve(), fleet_report)
+    if args.history_db:
+        record_validation_history(Path(args.history_db).resolve(), fresh_reports)
+    exit_code = summary.exit_code
+    if events is not None:
+        events.emit(
+            "summary",
+            {
+                "kind": "fleet",
+                "status": fleet_report["status"],
+                "projectCount": fleet_report["projectCount"],
+                "statusCounts": fleet_report["statusCounts"],
+                "failedCheckCounts": fleet_report["failedCheckCounts"],
+                "resumedCount": resumed_count,
+                "exitCode": exit_code,
+            },
+        )
+    return exit_code
+
+
+def merge_reports_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="validate_expo_ios_project.py merge-reports")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help=(
+            "Shard fleet reports or per-project reports (files or directories of *.json "
+            f"and *{COMPACT_REPORT_SUFFIX})."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help=f"Merged fleet report path; a *{COMPACT_REPORT_SUFFIX} path writes the compact format.",
+    )
+    args = parser.parse_args(argv)
+
+    input_paths: list[Path] = []
+    for raw in args.inputs:
+        path = Path(raw).resolve()
+        if not path.is_dir():
+            input_paths.append(path)
+            continue
+        compact_paths = sorted(path.glob(f"*{COMPACT_REPORT_SUFFIX}"))
+        indexes = {compact_report_index_path(item) for item in compact_paths}
+        input_paths.extend(
+            sorted([*compact_paths, *(item for item in path.glob("*.json") if item not in indexes)])
+        )
+
+    output_path = Path(args.output).resolve()
+    writer: CompactFleetReportWriter | StreamedFleetReportWriter = (
+        CompactFleetReportWriter(output_path)
+        if output_path.name.endswith(COMPACT_REPORT_SUFFIX)
+        else StreamedFleetReportWriter(output_path)
+    )
+    summary = FleetSummary()
+    seen: set[str] = set()
+    for input_path in input_paths:
+        if input_path == output_path:
+            continue
+        try:
+            fleet_fields, projects = iter_fleet_report_projects(input_path)
+            summary.add_run(fleet_fields)
+            for project in projects:
+                if not fleet_fields:
+                    summary.add_run(project)
+                key = str(project.get("fleetKey") or project.get("projectDir"))
+                if key in seen:
+                    print(f"[WARN] Skipping duplicate project report for {key} in {input_path}")
+                    continue
+                seen.add(key)
+                summary.add_project(project)
+                writer.add_project(project)
+        except ValueError as exc:
+            print(f"[FAIL] {exc}")
+            writer.abort()
+            return 1
+        del fleet_fields, projects
+    fields = summary.to_report()
+    fields["mergedFrom"] = [str(path) for path in input_paths if path != output_path]
+    writer.close(fields)
+
+    summary.print_summary("Merged fleet report")
+    print(f"[OK] Wrote report: {output_path}")
+    return summary.exit_code
+
+
+def history_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="validate_expo_ios_project.py history")
+    parser.add_argument("--db", required=True, help="History database written by --history-db.")
+    parser.add_argument("--json", action="store_true", help="Print rows as a JSON array.")
+    queries = parser.add_subparsers(dest="query", required=True)
+
+    def add_query(name: str, help_text: str) -> argparse.ArgumentParser:
+        query = queries.add_parser(name, help=help_text)
+        query.add_argument("--project", required=False, help="Limit to one project key.")
+        query.add_argument("--limit", type=int, default=20)
+        return query
+
+    slowest = add_query("slowest", "Checks with the highest mean duration.")
+    slowest.add_argument("--since", required=False, help="Only runs started at or after this ISO time.")
+    regressions = add_query(
+        "regressions",
+        "Project checks whose latest runs are slower than the runs before them.",
+    )
+    regressions.add_argument("--check", required=False)
+    regressions.add_argument("--window", type=int, default=10, help="Runs per comparison window.")
+    regressions.add_argument("--ratio", type=float, default=1.5, help="Minimum recent/baseline ratio.")
+    regressions.add_argument("--min-ms", type=float, default=100.0, help="Minimum slowdown in ms.")
+    flapping = add_query(
+        "flapping",
+        "Project checks whose result changed between consecutive runs; flips with "
+        "an unchanged input fingerprint point at nondeterministic checks.",
+    )
+    flapping.add_argument("--check", required=False)
+    flapping.add_argument("--window", type=int, default=20, help="Latest runs considered.")
+    flapping.add_argument("--min-flips", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    db_path = Path(args.db).resolve()
+    if not db_path.is_file():
+        print(f"[FAIL] History database not found: {db_path}")
+        return 1
+    query, columns = HISTORY_QUERIES[args.query]
+    connection = open_history_db(db_path)
+    try:
+        rows = query(connection, args)
+    finally:
+        connection.close()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    if not rows:
+        print(f"[OK] No {args.query} results.")
+        return 0
+    print("\t".join(columns))
+    for row in rows:
+        print(
+            "\t".join(
+                f"{row[column]:.1f}" if isinstance(row[column], float) else str(row[column])
+                for column in columns
+            )
+        )
+    return 0
+
+
+def write_fleet_report_json_stream(
+    path: Path, fields: dict[str, Any], projects: Iterable[dict[str, Any]]
+) -> None:
+    """Write the same bytes as ``write_report_json`` with projects streamed in."""
+    fields = {key: value for key, value in fields.items() if key != "projects"}
+    keys = sorted([*fields, "projects"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(path.name + ".partial")
+    with partial_path.open("w", encoding="utf-8") as handle:
+        handle.write("{\n")
+        for position, key in enumerate(keys):
+            handle.write(f"  {json.dumps(key)}: ")
+            if key == "projects":
+                count = 0
+                for project in projects:
+                    handle.write(",\n" if count else "[\n")
+                    body = json.dumps(project, indent=2, sort_keys=True)
+                    handle.write("    " + body.replace("\n", "\n    "))
+                    count += 1
+                handle.write("\n  ]" if count else "[]")
+            else:
+                body = json.dumps(fields[key], indent=2, sort_keys=True)
+                handle.write(body.replace("\n", "\n  "))
+            handle.write(",\n" if position < len(keys) - 1 else "\n")
+        handle.write("}\n")
+    os.replace(partial_path, path)
+
+
+def convert_report_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="validate_expo_ios_project.py convert-report")
+    parser.add_argument("input", help=f"Compact fleet report ({COMPACT_REPORT_SUFFIX}).")
+    parser.add_argument(
+        "--output",
+        required=False,
+        help="Write the full schema-v4 fleet report JSON to this path.",
+    )
+    parser.add_argument(
+        "--project",
+        required=False,
+        help="Print one project's schema-v4 report (by fleet key or projectDir) to stdout.",
+    )
+    args = parser.parse_args(argv)
+    if not args.output and not args.project:
+        parser.error("one of --output or --project is required")
+
+    input_path = Path(args.input).resolve()
+    try:
+        index = load_compact_report_index(input_path)
+    except ValueError as exc:
+        print(f"[FAIL] {exc}")
+        return 1
+
+    if args.project:
+        wanted = str(Path(args.project).resolve())
+        for entry in index["projects"]:
+            if args.project == entry.get("fleetKey") or wanted == entry["projectDir"]:
+                report = read_compact_project(input_path, index, entry)
+                print(json.dumps(report, indent=2, sort_keys=True))
+                return 0
+        print(f"[FAIL] {args.project} is not in {input_path}")
+        return 1
+
+    output_path = Path(args.output).resolve()
+    try:
+        write_fleet_report_json_stream(
+            output_path,
+            index["fleet"],
+            (read_compact_project(input_path, index, entry) for entry in index["projects"]),
+        )
+    except ValueError as exc:
+        print(f"[FAIL] {exc}")
+        output_path.with_name(output_path.name + ".partial").unlink(missing_ok=True)
+        return 1
+    print(f"[OK] Wrote report: {output_path} ({len(index['projects'])} projects)")
+    return 0
+
+
+def template_manifest_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="validate_expo_ios_project.py template-manifest")
+    parser.add_argument(
+        "--output-path",
+        required=False,
+        help=f"Manifest path. Defaults to {TEMPLATE_FINGERPRINT_MANIFEST_PATH}.",
+    )
+    args = parser.parse_args(argv)
+
+    output_path = (
+        Path(args.output_path).resolve()
+        if args.output_path
+        else TEMPLATE_FINGERPRINT_MANIFEST_PATH
+    )
+    manifest = build_template_manifest(TEMPLATE_ROOT)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"[OK] Wrote template manifest: {output_path} ({len(manifest['files'])} files)")
+    return 0
+
+
+def placeholder_baseline_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="validate_expo_ios_project.py placeholder-baseline")
+    parser.add_argument("--project-dir", required=True)
+    parser.add_argument(
+        "--output-path",
+        required=False,
+        help="Baseline path. Defaults to placeholderBaseline in skill.modules.json.",
+    )
+    args = parser.parse_args(argv)
+
+    project_dir = Path(args.project_dir).resolve()
+    try:
+        metadata = load_json(project_dir / "skill.modules.json")
+    except ValueError:
+        metadata = {}
+    rule_packs, baseline_path = placeholder_config_paths(metadata)
+    if args.output_path:
+        output_path = Path(args.output_path).resolve()
+    elif baseline_path:
+        output_path = (project_dir / baseline_path).resolve()
+    else:
+        parser.error("--output-path is required when skill.modules.json has no placeholderBaseline")
+    try:
+        rules = load_placeholder_rules(project_dir, rule_packs)
+    except ValueError as exc:
+        print(f"[FAIL] {exc}")
+        return 1
+
+    detector = placeholder_detector(sys.maxsize, rules)
+    detector.line_records = []
+    run_source_scan(project_dir, [detector])
+    records: dict[tuple[str, str], dict[str, Any]] = {}
+    for record in detector.line_records:
+        records.setdefault((record["path"], record["lineHash"]), record)
+    baseline = {
+        "format": PLACEHOLDER_BASELINE_FORMAT,
+        "findings": sorted(records.values(), key=lambda record: (record["path"], record["line"])),
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(
+        json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"[OK] Wrote placeholder baseline: {output_path} ({len(records)} findings)")
+    return 0
+
+
+SUBCOMMANDS = {
+    "template-manifest": template_manifest_main,
+    "placeholder-baseline": placeholder_baseline_main,
+    "merge-reports": merge_reports_main,
+    "history": history_main,
+    "convert-report": convert_report_main,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+    return validate_main(argv)
+
+
+def validate_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-dir", required=False)
+    parser.add_argument(
+        "--prd-path",
+        required=False,
+        help="Path to completed PRD used as implementation contract.",
+    )
+    parser.add_argument(
+        "--implementation-report-path",
+        required=False,
+        help=(
+            "Optional path to PRD implementation report JSON. "
+            "Defaults to <project-dir>/reports/prd-implementation.json."
+        ),
+    )
+    parser.add_argument(
+        "--report-path",
+        required=False,
+        help=(
+            "Optional path to write machine-readable validation report JSON. In "
+            f"--fleet-manifest mode a path ending in {COMPACT_REPORT_SUFFIX} writes the "
+            "compact gzip JSONL format with a sidecar .index.json."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        help=(
+            "Optional validator cache directory. "
+            f"Defaults to <project-dir>/{DEFAULT_CACHE_DIR_REL_PATH}. "
+            "In fleet mode each project uses <cache-dir>/<sha256(fleet key)[:16]>."
+        ),
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        required=False,
+        help=(
+            "Optional wall-clock budget in seconds for the source scan, counted from the "
+            "start of the run. The scan visits recently modified files first and reports "
+            "VC-030, VC-032 and VC-034 as partial when the budget expires; unscanned files "
+            "are scanned first on the next run. Other checks always run to completion."
+        ),
+    )
+    parser.add_argument(
+        "--scan-max-file-bytes",
+        type=int,
+        default=SourceScanLimits.max_file_bytes,
+        help="Source files larger than this are not scanned and are listed in sourceScanCoverage.",
+    )
+    parser.add_argument(
+        "--scan-max-line-length",
+        type=int,
+        default=SourceScanLimits.max_line_length,
+        help="A line longer than this in a file's first chunk marks the file as minified.",
+    )
+    parser.add_argument(
+        "--scan-minified",
+        choices=("skip", "sample"),
+        default=SourceScanLimits.minified,
+        help="Skip minified/bundled sources, or scan only their first chunk.",
+    )
+    parser.add_argument(
+        "--scan-git-history",
+        action="store_true",
+        help=(
+            "Also scan every blob reachable from any git ref under the project for "
+            "secrets (VC-035). Scanned blob ids are cached in the cache directory."
+        ),
+    )
+    parser.add_argument(
+        "--git-rev",
+        required=False,
+        help=(
+            "Optional git revision to validate instead of the working tree. Project "
+            "files are read from the repository object store; nothing is checked out."
+        ),
+    )
+    parser.add_argument(
+        "--fleet-manifest",
+        required=False,
+        help=(
+            "Optional JSON manifest listing projects to validate in one run: "
+            '{"projects": [{"projectDir": ..., "prdPath": ..., '
+            '"implementationReportPath": ...}]}. Relative paths resolve against the '
+            "manifest directory; --prd-path is the default PRD for entries without one."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of projects validated concurrently in --fleet-manifest mode.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard_spec,
+        required=False,
+        help=(
+            "Validate only shard INDEX of COUNT (1-based) of the fleet manifest. "
+            "Assignment is a stable hash of each manifest projectDir, so runners "
+            "agree without coordination. Combine shard reports with merge-reports."
+        ),
+    )
+    parser.add_argument(
+        "--shard-durations",
+        required=False,
+        help=(
+            "Optional previous fleet report whose durationMs values weight shard "
+            "assignment and order projects without --history-db entries."
+        ),
+    )
+    parser.add_argument(
+        "--journal",
+        required=False,
+        help=(
+            "Append each completed project's result to this JSONL journal (fsync'd "
+            "per entry) in --fleet-manifest mode; the fleet report is built from it."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        required=False,
+        help=(
+            "Resume an interrupted fleet run from a journal: projects whose input "
+            "fingerprint is unchanged since their journal entry are not re-validated. "
+            "New results are appended to --journal (default: the resumed journal)."
+        ),
+    )
+    parser.add_argument(
+        "--remote-cache",
+        required=False,
+        help=(
+            "Optional base URL of a shared result cache speaking HTTP GET/PUT (see "
+            "scripts/validator_cache_server.py). Scan check results are looked up by "
+            "check ID, validator version and input content hashes."
+        ),
+    )
+    parser.add_argument(
+        "--remote-cache-read-only",
+        action="store_true",
+        help="Read from --remote-cache without uploading new results.",
+    )
+    parser.add_argument(
+        "--history-db",
+        required=False,
+        help=(
+            "Optional SQLite database that accumulates each run's per-check result, "
+            "reason and durationMs keyed by project and input fingerprint. Query it "
+            "with the history subcommand."
+        ),
+    )
+    parser.add_argument(
+        "--events",
+        choices=("ndjson",),
+        required=False,
+        help=(
+            "Stream one JSON line per check, module check and source finding to stdout "
+            "as each is produced, then a summary line. Human-readable output moves to "
+            "stderr; --report-path is unchanged."
+        ),
+    )
+    parser.add_argument(
+        "--print-input-fingerprint",
+        action="store_true",
+        help=(
+            "Print the hash of every file this run would read (plus the validator "
+            "version) and exit without validating. Use it as a CI cache key."
+        ),
+    )
+    parser.add_argument(
+        "--skip-if-fingerprint",
+        required=False,
+        help=(
+            "Skip validation when the current input fingerprint equals this value and "
+            "the existing --report-path report was produced from the same inputs; the "
+            "previous report is reused verbatim."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if not args.fleet_manifest and (not args.project_dir or not args.prd_path):
+        parser.error("--project-dir and --prd-path are required without --fleet-manifest")
+    if (
+        not args.fleet_manifest
+        and args.report_path
+        and args.report_path.endswith(COMPACT_REPORT_SUFFIX)
+    ):
+        parser.error(f"{COMPACT_REPORT_SUFFIX} reports are only written with --fleet-manifest")
+    if args.print_input_fingerprint and not args.fleet_manifest:
+        input_fingerprint, error = project_input_fingerprint(args)
+        if error:
+            print(f"[FAIL] {error}", file=sys.stderr)
+            return 1
+        print(input_fingerprint)
+        return 0
+
+    # With --events, stdout carries only NDJSON; human-readable lines go to stderr.
+    events = EventStream(sys.stdout) if args.events else None
+    with contextlib.redirect_stdout(sys.stderr) if events else contextlib.nullcontext():
+        if args.fleet_manifest:
+            return run_fleet_validation(args, events)
+        return run_project_validation(args, events)
+
+
+def run_project_validation(args: argparse.Namespace, events: EventStream | None) -> int:
+    report: dict[str, Any] | None = None
+    reused = False
+    if args.skip_if_fingerprint:
+        input_fingerprint, _ = project_input_fingerprint(args)
+        if args.report_path and input_fingerprint == args.skip_if_fingerprint:
+            report = load_fingerprinted_report(
+                Path(args.report_path).resolve(), input_fingerprint
+            )
+        if report is not None:
+            reused = True
+            print(
+                f"[SKIP] Inputs unchanged (fingerprint {input_fingerprint[:12]}); "
+                f"reusing {Path(args.report_path).resolve()}."
+            )
+            if events is not None:
+                for check in report["checks"]:
+                    events.emit("check", check)
+                for module_check in report["moduleChecks"]:
+                    events.emit("moduleCheck", module_check)
+        args.input_fingerprint = input_fingerprint
+
+    if report is None:
+        report = validate_project(args, events=events)
+    print_report(report)
+    if args.report_path and not reused:
+        write_report_json(Path(args.report_path).resolve(), report)
+    if args.history_db and not reused:
+        record_validation_history(Path(args.history_db).resolve(), [report])
+    exit_code = compute_exit_code(report["status"], report["checks"] + report["moduleChecks"])
+    if events is not None:
+        events.emit(
+            "summary",
+            {
+                "status": report["status"],
+                "infraStatus": report["infraStatus"],
+                "featureStatus": report["featureStatus"],
+                "failedChecks": report["failedChecks"],
+                "durationMs": report.get("durationMs"),
+                "inputFingerprint": report.get("inputFingerprint"),
+                "reused": reused,
+                "exitCode": exit_code,
+            },
+        )
+    return exit_code
+
+
+def open_project_root(
+    args: argparse.Namespace,
+) -> tuple[Path | GitRevisionPath, GitRevisionTree | None, str]:
+    """Return the project root to validate: the working tree or a git revision."""
+    project_dir = Path(args.project_dir).resolve()
+    if not args.git_rev:
+        return project_dir, None, ""
+    try:
+        git_tree = GitRevisionTree.open(project_dir, args.git_rev)
+    except (OSError, ValueError) as exc:
+        return project_dir, None, str(exc)
+    return GitRevisionPath(git_tree), git_tree, ""
+
+
+def fleet_project_cache_dir(cache_dir: str | None, fleet_key: str) -> str | None:
+    """Give each fleet project its own subdirectory of a shared --cache-dir.
+
+    Every cache file is keyed by project-relative path or written back with
+    only the entries one project used, so projects must not share them.
+    """
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(fleet_key.encode("utf-8")).hexdigest()[:16]
+    return str(Path(cache_dir).resolve() / digest)
+
+
+def resolve_cache_dir(
+    args: argparse.Namespace,
+    project_dir: Path | GitRevisionPath,
+    git_tree: GitRevisionTree | None,
+) -> Path | None:
+    if args.cache_dir:
+        return Path(args.cache_dir).resolve()
+    if git_tree:
+        return None
+    return project_dir / DEFAULT_CACHE_DIR_REL_PATH
+
+
+def resolve_implementation_report_path(
+    args: argparse.Namespace, project_dir: Path | GitRevisionPath
+) -> Path:
+    if not args.implementation_report_path:
+        return (project_dir / DEFAULT_PRD_IMPLEMENTATION_REPORT_REL_PATH).resolve()
+    if Path(args.implementation_report_path).is_absolute():
+        return Path(args.implementation_report_path).resolve()
+    return (project_dir / args.implementation_report_path).resolve()
+
+
+def compute_input_fingerprint(
+    args: argparse.Namespace,
+    project_dir: Path | GitRevisionPath,
+    hash_cache: FileHashCache,
+) -> str:
+    """Hash every input the validator reads for this project and PRD.
+
+    Labels are project-relative (the PRD and implementation report by role), so
+    the same inputs give the same fingerprint in any checkout location.
+    """
+    digest = hashlib.sha256(f"validator\0{VALIDATOR_VERSION}\n".encode("utf-8"))
+    # Options that change which files are scanned, and so the results.
+    digest.update(f"scan-limits\0{source_scan_limits(args).cache_key()}\n".encode("utf-8"))
+    digest.update(f"time-budget\0{args.time_budget}\n".encode("utf-8"))
+
+    def add(label: str, path: Path | GitRevisionPath, cache_key: str = "") -> None:
+        fingerprint = (
+            hash_cache.fingerprint(cache_key or label, path) if path.is_file() else None
+        )
+        digest.update(f"{label}\0{fingerprint or 'missing'}\n".encode("utf-8"))
+
+    seen = set(INPUT_FINGERPRINT_FILES)
+    for relative_path in INPUT_FINGERPRINT_FILES:
+        add(relative_path, project_dir / relative_path)
+    for relative_path, file_path in iter_source_files(project_dir, INPUT_FINGERPRINT_ROOTS):
+        if relative_path not in seen:
+            seen.add(relative_path)
+            add(relative_path, file_path)
+    native_project = find_native_ios_project(project_dir)
+    if native_project is not None:
+        # Only the files VC-046 reads; ios/Pods and build output stay out.
+        name, pbxproj_path = native_project
+        add(f"ios/{name}.xcodeproj/project.pbxproj", pbxproj_path)
+        for relative_path in (f"ios/{name}/Info.plist", f"ios/{name}/{name}.entitlements"):
+            add(relative_path, project_dir / relative_path)
+    if not isinstance(project_dir, GitRevisionPath) and (project_dir / "node_modules").is_dir():
+        # VC-044/045 depend on installed native packages, keyed like their cache.
+        digest.update(b"node_modules\n")
+        for key, _ in iter_native_packages(project_dir / "node_modules"):
+            digest.update(f"native-package\0{key}\n".encode("utf-8"))
+    report_path = resolve_implementation_report_path(args, project_dir)
+    add("implementation-report", report_path, f"report:{report_path}")
+    prd_path = Path(args.prd_path).resolve()
+    add("prd", prd_path, f"prd:{prd_path}")
+    add("template-manifest", TEMPLATE_FINGERPRINT_MANIFEST_PATH)
+    if getattr(args, "scan_git_history", False):
+        refs_digest = git_refs_digest(Path(args.project_dir).resolve())
+        digest.update(f"git-refs\0{refs_digest}\n".encode("utf-8"))
+
+    # Evidence paths outside the walked roots are still read (existence checks).
+    try:
+        requirements = load_prd_implementation_report(report_path)["requirements"]
+    except (ValueError, OSError):
+        requirements = []
+    evidence: set[str] = set()
+    for entry in requirements:
+        if isinstance(entry, dict):
+            for raw_path in normalize_str_list(entry.get("code")) + normalize_str_list(
+                entry.get("tests")
+            ):
+                _, relative_path = resolve_project_path(project_dir, raw_path)
+                if relative_path and relative_path not in seen:
+                    evidence.add(relative_path)
+    for relative_path in sorted(evidence):
+        add(f"evidence:{relative_path}", project_dir / relative_path, relative_path)
+
+    # Placeholder rule packs and the baseline may live outside the walked roots.
+    try:
+        metadata = load_json(project_dir / "skill.modules.json")
+    except ValueError:
+        metadata = {}
+    rule_packs, baseline_path = placeholder_config_paths(metadata)
+    for raw_path in rule_packs + ([baseline_path] if baseline_path else []):
+        _, relative_path = resolve_project_path(project_dir, raw_path)
+        if relative_path and relative_path not in seen:
+            seen.add(relative_path)
+            add(f"placeholder-config:{relative_path}", project_dir / relative_path, relative_path)
+    return digest.hexdigest()
+
+
+def project_input_fingerprint(args: argparse.Namespace) -> tuple[str, str]:
+    """Return (fingerprint, error) for one project without validating it."""
+    project_dir, git_tree, git_error = open_project_root(args)
+    if git_error:
+        return "", git_error
+    hash_cache = FileHashCache(resolve_cache_dir(args, project_dir, git_tree))
+    try:
+        return compute_input_fingerprint(args, project_dir, hash_cache), ""
+    finally:
+        hash_cache.save()
+        if git_tree:
+            git_tree.close()
+
+
+def load_fingerprinted_report(
+    report_path: Path, input_fingerprint: str
+) -> dict[str, Any] | None:
+    """Return the report at ``report_path`` if it was produced from these inputs."""
+    try:
+        report = load_json(report_path)
+    except ValueError:
+        return None
+    if report.get("inputFingerprint") != input_fingerprint or report.get("kind") == "fleet":
+        return None
+    return report
+
+
+def validate_project(
+    args: argparse.Namespace,
+    memo: ContentMemo | None = None,
+    events: EventStream | None = None,
+) -> dict[str, Any]:
+    """Run every check for one project and return its schema-v4 report.
+
+    With ``events``, each check, module check and source finding is emitted as
+    it is produced.
+    """
+    run_started = time.monotonic()
+    started_at = utc_now_iso()
+    report_project_dir = str(Path(args.project_dir).resolve())
+    check_started = time.monotonic()
+    project_dir, git_tree, git_error = open_project_root(args)
+    cache_dir = resolve_cache_dir(args, project_dir, git_tree)
+    hash_cache = FileHashCache(cache_dir)
+    remote_cache = (
+        RemoteResultCache(args.remote_cache, read_only=args.remote_cache_read_only)
+        if args.remote_cache
+        else None
+    )
+    checks: list[dict[str, Any]] = CheckList("check", events)
+    module_checks: list[dict[str, Any]] = CheckList("moduleCheck", events)
+    warnings: list[str] = []
+    unresolved_human_dependencies: list[dict[str, str]] = []
+    prd_requirement_ids: list[str] = []
+    p0_requirement_ids: list[str] = []
+    missing_requirement_mappings: list[str] = []
+    p0_implementation_failures: list[str] = []
+    placeholder_findings: list[str] = []
+    untouched_template_files: list[str] = []
+    requirement_tag_findings: list[str] = []
+    placeholder_baseline: FindingBaseline | None = None
+    accepted_placeholder_findings: list[str] = []
+    secret_findings: list[str] = []
+    localization_index: dict[str, Any] | None = None
+    accessibility_lint: dict[str, Any] | None = None
+    performance_lint: dict[str, Any] | None = None
+    asset_index: dict[str, Any] | None = None
+    privacy_api_scan: dict[str, Any] | None = None
+    native_project: dict[str, Any] | None = None
+    route_manifest: dict[str, Any] | None = None
+    git_history_secret_scan: GitHistorySecretScan | None = None
+    source_scan_coverage = SourceScanCoverage()
+    prd_evidence_paths: set[str] = set()
+
+    if git_error:
+        add_check(
+            checks,
+            "VC-000",
+            "Project Directory Exists",
+            "Blocker",
+            "fail",
+            git_error,
+            started=check_started,
+        )
+    elif not project_dir.exists() or not project_dir.is_dir():
+        add_check(
+            checks,
+            "VC-000",
+            "Project Directory Exists",
+            "Blocker",
+            "fail",
+            f"Project directory does not exist: {project_dir}",
+            started=check_started,
+        )
+    else:
+        add_check(
+            checks,
+            "VC-000",
+            "Project Directory Exists",
+            "Blocker",
+            "pass",
+            started=check_started,
+        )
+
+    check_started = time.monotonic()
+    package_json_path = project_dir / "package.json"
+    pkg: dict[str, Any] | None = None
+    if checks[-1]["result"] == "pass":
+        if package_json_path.exists():
+            add_check(
+                checks,
+                "VC-001",
+                "package.json Exists",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+            try:
+                pkg = load_json(package_json_path)
+                add_check(
+                    checks,
+                    "VC-002",
+                    "package.json Parse",
+                    "Blocker",
+                    "pass",
+                    started=check_started,
+                )
+            except ValueError as exc:
+                add_check(
+                    checks,
+                    "VC-002",
+                    "package.json Parse",
+                    "Blocker",
+                    "fail",
+                    str(exc),
+                    started=check_started,
+                )
+        else:
+            add_check(
+                checks,
+                "VC-001",
+                "package.json Exists",
+                "Blocker",
+                "fail",
+                "package.json not found.",
+                started=check_started,
+            )
+
+    if isinstance(pkg, dict):
+        scripts = pkg.get("scripts", {})
+        for check_id, script_name in (
+            ("VC-003", "lint"),
+            ("VC-004", "typecheck"),
+            ("VC-005", "test"),
+        ):
+            check_started = time.monotonic()
+            if isinstance(scripts, dict) and script_name in scripts:
+                add_check(
+                    checks,
+                    check_id,
+                    f"package.json scripts.{script_name}",
+                    "Blocker",
+                    "pass",
+                    started=check_started,
+                )
+            else:
+                add_check(
+                    checks,
+                    check_id,
+                    f"package.json scripts.{script_name}",
+                    "Blocker",
+                    "fail",
+                    f"scripts.{script_name} is missing",
+                    started=check_started,
+                )
+
+        check_started = time.monotonic()
+        test_script = ""
+        if isinstance(scripts, dict):
+            raw_test = scripts.get("test")
+            if isinstance(raw_test, str):
+                test_script = raw_test
+        if test_script and not is_placeholder_test_script(test_script):
+            add_check(
+                checks,
+                "VC-014",
+                "Non-placeholder Test Script",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            reason = (
+                "scripts.test is missing or appears to be placeholder/no-op"
+                if not test_script
+                else f"scripts.test appears to be placeholder/no-op: {test_script}"
+            )
+            add_check(
+                checks,
+                "VC-014",
+                "Non-placeholder Test Script",
+                "Blocker",
+                "fail",
+                reason,
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        main_entry = pkg.get("main")
+        if main_entry == "expo-router/entry":
+            add_check(
+                checks,
+                "VC-006",
+                "package.json main Entry",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-006",
+                "package.json main Entry",
+                "Blocker",
+                "fail",
+                "package.json main must be expo-router/entry",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        deps: dict[str, Any] = {}
+        if isinstance(pkg.get("dependencies"), dict):
+            deps.update(pkg["dependencies"])
+        if isinstance(pkg.get("devDependencies"), dict):
+            deps.update(pkg["devDependencies"])
+
+        if "expo-router" in deps:
+            add_check(
+                checks,
+                "VC-007",
+                "expo-router Dependency",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-007",
+                "expo-router Dependency",
+                "Blocker",
+                "fail",
+                "expo-router dependency is missing",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        if (project_dir / "tsconfig.json").exists():
+            add_check(
+                checks,
+                "VC-008",
+                "tsconfig.json Exists",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-008",
+                "tsconfig.json Exists",
+                "Blocker",
+                "fail",
+                "tsconfig.json is missing",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        if "typescript" in deps:
+            add_check(
+                checks,
+                "VC-009",
+                "TypeScript Dependency",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-009",
+                "TypeScript Dependency",
+                "Blocker",
+                "fail",
+                "typescript dependency is missing",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        app_json_path = project_dir / "app.json"
+        app_config_ts_path = project_dir / "app.config.ts"
+        app_config_ts = load_app_config_ts(project_dir, hash_cache, cache_dir)
+        app_errors: list[str] = []
+        if app_json_path.exists():
+            try:
+                app_errors = check_app_json(app_json_path)
+            except ValueError as exc:
+                app_errors = [str(exc)]
+        elif app_config_ts_path.exists():
+            app_errors = check_app_config_ts(app_config_ts)
+        else:
+            app_errors = ["Neither app.json nor app.config.ts was found."]
+
+        if app_errors:
+            add_check(
+                checks,
+                "VC-010",
+                "App Config Contract",
+                "Blocker",
+                "fail",
+                " | ".join(app_errors),
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-010",
+                "App Config Contract",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        eas_path = project_dir / "eas.json"
+        if eas_path.exists():
+            try:
+                eas_errors = check_eas_json(eas_path)
+            except ValueError as exc:
+                eas_errors = [str(exc)]
+        else:
+            eas_errors = ["eas.json is missing."]
+
+        if eas_errors:
+            add_check(
+                checks,
+                "VC-011",
+                "EAS Profile Contract",
+                "Blocker",
+                "fail",
+                " | ".join(eas_errors),
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
                 "VC-011",
                 "EAS Profile Contract",
                 "Blocker",
                 "pass",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        gitignore_errors = check_gitignore_expo_rules(project_dir)
+        if gitignore_errors:
+            add_check(
+                checks,
+                "VC-012",
+                "Expo Ignore Policy",
+                "Blocker",
+                "fail",
+                " | ".join(gitignore_errors),
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-012",
+                "Expo Ignore Policy",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        workflow_path = project_dir / ".github" / "workflows" / "eas-ios.yml"
+        if workflow_path.exists():
+            add_check(
+                checks,
+                "VC-013",
+                "CI Workflow Presence",
+                "Conditional",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-013",
+                "CI Workflow Presence",
+                "Conditional",
+                "skipped",
+                "CI workflow not found yet (expected before setup_ci_eas.ps1).",
+                started=check_started,
+            )
+            warnings.append(
+                "CI workflow missing; run setup_ci_eas.ps1 to complete pipeline setup."
+            )
+
+        check_started = time.monotonic()
+        smoke_test_path = project_dir / "__tests__" / "app-shell.test.tsx"
+        if smoke_test_path.exists():
+            add_check(
+                checks,
+                "VC-016",
+                "Smoke Test File Presence",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-016",
+                "Smoke Test File Presence",
+                "Blocker",
+                "fail",
+                "__tests__/app-shell.test.tsx is missing.",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        theme_file_path = project_dir / "src" / "ui" / "theme.ts"
+        if theme_file_path.exists():
+            add_check(
+                checks,
+                "VC-024",
+                "Theme Token File Presence",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-024",
+                "Theme Token File Presence",
+                "Blocker",
+                "fail",
+                "src/ui/theme.ts is missing.",
+                started=check_started,
             )
 
-        gitignore_errors = check_gitignore_expo_rules(project_dir)
-        if gitignore_errors:
+        check_started = time.monotonic()
+        metadata_path = project_dir / "skill.modules.json"
+        modules: dict[str, bool] = {}
+        release_branch = "main"
+        use_app_config_ts = False
+        with_deployment_layer = False
+        placeholder_rule_packs: list[str] = []
+        placeholder_baseline_path = ""
+        performance_severities, performance_config_errors = performance_lint_severities({})
+        if metadata_path.exists():
+            try:
+                metadata = load_json(metadata_path)
+                release_branch_raw = metadata.get("releaseBranch", "main")
+                if isinstance(release_branch_raw, str) and release_branch_raw.strip():
+                    release_branch = release_branch_raw.strip()
+                raw_modules = metadata.get("modules", {})
+                if isinstance(raw_modules, dict):
+                    modules = {k: bool(v) for k, v in raw_modules.items()}
+                with_deployment_layer = bool(modules.get("withDeploymentLayer", False))
+                placeholder_rule_packs, placeholder_baseline_path = placeholder_config_paths(
+                    metadata
+                )
+                performance_severities, performance_config_errors = performance_lint_severities(
+                    metadata
+                )
+                add_check(
+                    checks,
+                    "VC-015",
+                    "skill.modules.json Parse",
+                    "Blocker",
+                    "pass",
+                    started=check_started,
+                )
+                check_started = time.monotonic()
+                use_app_config_ts = bool(modules.get("useAppConfigTs", False))
+                if use_app_config_ts:
+                    if (project_dir / "app.config.ts").exists():
+                        add_check(
+                            checks,
+                            "VC-018",
+                            "app.config.ts Mode Contract",
+                            "Blocker",
+                            "pass",
+                            started=check_started,
+                        )
+                    else:
+                        add_check(
+                            checks,
+                            "VC-018",
+                            "app.config.ts Mode Contract",
+                            "Blocker",
+                            "fail",
+                            "useAppConfigTs is enabled but app.config.ts is missing.",
+                            started=check_started,
+                        )
+                else:
+                    if (project_dir / "app.json").exists():
+                        add_check(
+                            checks,
+                            "VC-018",
+                            "app.json Mode Contract",
+                            "Blocker",
+                            "pass",
+                            started=check_started,
+                        )
+                    else:
+                        add_check(
+                            checks,
+                            "VC-018",
+                            "app.json Mode Contract",
+                            "Blocker",
+                            "fail",
+                            "useAppConfigTs is disabled but app.json is missing.",
+                            started=check_started,
+                        )
+            except ValueError as exc:
+                add_check(
+                    checks,
+                    "VC-015",
+                    "skill.modules.json Parse",
+                    "Blocker",
+                    "fail",
+                    str(exc),
+                    started=check_started,
+                )
+        else:
+                add_check(
+                    checks,
+                    "VC-015",
+                    "skill.modules.json Parse",
+                    "Blocker",
+                    "fail",
+                    "skill.modules.json is missing.",
+                    started=check_started,
+                )
+
+        check_started = time.monotonic()
+        if bool(modules.get("withPush", False)):
+            if use_app_config_ts:
+                push_config_path = project_dir / "app.config.ts"
+                if not push_config_path.exists():
+                    add_check(
+                        checks,
+                        "VC-019",
+                        "Push Plugin Contract",
+                        "Blocker",
+                        "fail",
+                        "withPush is enabled but app.config.ts is missing.",
+                        started=check_started,
+                    )
+                elif app_config_ts is None:
+                    add_check(
+                        checks,
+                        "VC-019",
+                        "Push Plugin Contract",
+                        "Blocker",
+                        "fail",
+                        APP_CONFIG_UNRESOLVED_REASON,
+                        started=check_started,
+                    )
+                else:
+                    is_set, plugins = app_config_field(app_config_ts, "plugins")
+                    if (is_set and plugins is None) or has_plugin(plugins, "expo-notifications"):
+                        add_check(
+                            checks,
+                            "VC-019",
+                            "Push Plugin Contract",
+                            "Blocker",
+                            "pass",
+                            started=check_started,
+                        )
+                    else:
+                        add_check(
+                            checks,
+                            "VC-019",
+                            "Push Plugin Contract",
+                            "Blocker",
+                            "fail",
+                            "withPush is enabled but app.config.ts is missing expo-notifications plugin.",
+                            started=check_started,
+                        )
+            else:
+                if not app_json_path.exists():
+                    add_check(
+                        checks,
+                        "VC-019",
+                        "Push Plugin Contract",
+                        "Blocker",
+                        "fail",
+                        "withPush is enabled but app.json is missing.",
+                        started=check_started,
+                    )
+                else:
+                    try:
+                        app_json = load_json(app_json_path)
+                        expo_cfg = app_json.get("expo", {})
+                        plugins = expo_cfg.get("plugins", []) if isinstance(expo_cfg, dict) else []
+                        has_push_plugin = has_plugin(plugins, "expo-notifications")
+                    except ValueError as exc:
+                        add_check(
+                            checks,
+                            "VC-019",
+                            "Push Plugin Contract",
+                            "Blocker",
+                            "fail",
+                            str(exc),
+                            started=check_started,
+                        )
+                    else:
+                        if has_push_plugin:
+                            add_check(
+                                checks,
+                                "VC-019",
+                                "Push Plugin Contract",
+                                "Blocker",
+                                "pass",
+                                started=check_started,
+                            )
+                        else:
+                            add_check(
+                                checks,
+                                "VC-019",
+                                "Push Plugin Contract",
+                                "Blocker",
+                                "fail",
+                                "withPush is enabled but app.json is missing expo-notifications plugin.",
+                                started=check_started,
+                            )
+
+        check_started = time.monotonic()
+        if workflow_path.exists():
+            workflow_content = workflow_path.read_text(encoding="utf-8-sig")
+            expected_ref = f"refs/heads/{release_branch}"
+            expected_branch_line = f"- {release_branch}"
+            if expected_ref in workflow_content and expected_branch_line in workflow_content:
+                add_check(
+                    checks,
+                    "VC-017",
+                    "Workflow Release Branch Contract",
+                    "Conditional",
+                    "pass",
+                    started=check_started,
+                )
+            else:
+                add_check(
+                    checks,
+                    "VC-017",
+                    "Workflow Release Branch Contract",
+                    "Conditional",
+                    "fail",
+                    f"Workflow does not appear to target release branch '{release_branch}'.",
+                    started=check_started,
+                )
+
+        check_started = time.monotonic()
+        if with_deployment_layer:
+            human_inputs_path = project_dir / "release" / "human-inputs.md"
+            if human_inputs_path.exists():
+                add_check(
+                    checks,
+                    "VC-020",
+                    "Deployment Human Input File Presence",
+                    "Conditional",
+                    "pass",
+                    started=check_started,
+                )
+                check_started = time.monotonic()
+                human_inputs = parse_human_inputs_markdown(human_inputs_path)
+
+                missing_required_fields: list[str] = []
+                for key, owner in REQUIRED_HUMAN_INPUT_FIELDS:
+                    if not human_inputs.get(key):
+                        missing_required_fields.append(key)
+                        unresolved_human_dependencies.append(
+                            {
+                                "field": key,
+                                "owner": owner,
+                                "nextAction": "Fill value in release/human-inputs.md",
+                            }
+                        )
+
+                if missing_required_fields:
+                    add_check(
+                        checks,
+                        "VC-021",
+                        "Deployment Human Input Required Fields",
+                        "Conditional",
+                        "fail",
+                        "Missing required values: " + ", ".join(missing_required_fields),
+                        started=check_started,
+                    )
+                else:
+                    add_check(
+                        checks,
+                        "VC-021",
+                        "Deployment Human Input Required Fields",
+                        "Conditional",
+                        "pass",
+                        started=check_started,
+                    )
+
+                check_started = time.monotonic()
+                invalid_yes_no_fields: list[str] = []
+                for field in YES_NO_HUMAN_INPUT_FIELDS:
+                    value = human_inputs.get(field, "")
+                    if value and value.strip().lower() not in {"yes", "no"}:
+                        invalid_yes_no_fields.append(field)
+                if invalid_yes_no_fields:
+                    add_check(
+                        checks,
+                        "VC-022",
+                        "Deployment Human Input Boolean Field Format",
+                        "Conditional",
+                        "fail",
+                        "Expected yes/no values for: "
+                        + ", ".join(invalid_yes_no_fields),
+                        started=check_started,
+                    )
+                else:
+                    add_check(
+                        checks,
+                        "VC-022",
+                        "Deployment Human Input Boolean Field Format",
+                        "Conditional",
+                        "pass",
+                        started=check_started,
+                    )
+
+                check_started = time.monotonic()
+                app_identity = extract_app_identity(project_dir, use_app_config_ts, app_config_ts)
+                mismatches: list[str] = []
+                file_bundle = human_inputs.get("IOS_BUNDLE_ID", "").strip()
+                file_version = human_inputs.get("APP_VERSION", "").strip()
+                file_build_number = human_inputs.get("IOS_BUILD_NUMBER", "").strip()
+                file_release_branch = human_inputs.get("RELEASE_BRANCH", "").strip()
+
+                if (
+                    file_bundle
+                    and app_identity.get("bundleIdentifier")
+                    and file_bundle != app_identity["bundleIdentifier"]
+                ):
+                    mismatches.append(
+                        "IOS_BUNDLE_ID does not match app config bundleIdentifier"
+                    )
+                if (
+                    file_version
+                    and app_identity.get("version")
+                    and file_version != app_identity["version"]
+                ):
+                    mismatches.append("APP_VERSION does not match app config version")
+                if (
+                    file_build_number
+                    and app_identity.get("buildNumber")
+                    and file_build_number != app_identity["buildNumber"]
+                ):
+                    mismatches.append(
+                        "IOS_BUILD_NUMBER does not match app config ios.buildNumber"
+                    )
+                if file_release_branch and file_release_branch != release_branch:
+                    mismatches.append(
+                        "RELEASE_BRANCH does not match skill.modules.json releaseBranch"
+                    )
+
+                if mismatches:
+                    add_check(
+                        checks,
+                        "VC-023",
+                        "Deployment Human Input Cross-File Alignment",
+                        "Conditional",
+                        "fail",
+                        " | ".join(mismatches),
+                        started=check_started,
+                    )
+                else:
+                    add_check(
+                        checks,
+                        "VC-023",
+                        "Deployment Human Input Cross-File Alignment",
+                        "Conditional",
+                        "pass",
+                        started=check_started,
+                    )
+            else:
+                add_check(
+                    checks,
+                    "VC-020",
+                    "Deployment Human Input File Presence",
+                    "Conditional",
+                    "fail",
+                    "release/human-inputs.md is missing while withDeploymentLayer is enabled.",
+                    started=check_started,
+                )
+                add_check(
+                    checks,
+                    "VC-021",
+                    "Deployment Human Input Required Fields",
+                    "Conditional",
+                    "skipped",
+                    "Skipped because release/human-inputs.md is missing.",
+                    started=check_started,
+                )
+                add_check(
+                    checks,
+                    "VC-022",
+                    "Deployment Human Input Boolean Field Format",
+                    "Conditional",
+                    "skipped",
+                    "Skipped because release/human-inputs.md is missing.",
+                    started=check_started,
+                )
+                add_check(
+                    checks,
+                    "VC-023",
+                    "Deployment Human Input Cross-File Alignment",
+                    "Conditional",
+                    "skipped",
+                    "Skipped because release/human-inputs.md is missing.",
+                    started=check_started,
+                )
+                unresolved_human_dependencies.append(
+                    {
+                        "field": "release/human-inputs.md",
+                        "owner": "release-manager",
+                        "nextAction": "Create release/human-inputs.md from skill template.",
+                    }
+                )
+        else:
             add_check(
                 checks,
-                "VC-012",
-                "Expo Ignore Policy",
-                "Blocker",
-                "fail",
-                " | ".join(gitignore_errors),
+                "VC-020",
+                "Deployment Human Input File Presence",
+                "Conditional",
+                "skipped",
+                "withDeploymentLayer is not enabled.",
+                started=check_started,
             )
-        else:
             add_check(
                 checks,
-                "VC-012",
-                "Expo Ignore Policy",
-                "Blocker",
-                "pass",
+                "VC-021",
+                "Deployment Human Input Required Fields",
+                "Conditional",
+                "skipped",
+                "withDeploymentLayer is not enabled.",
+                started=check_started,
             )
-
-        workflow_path = project_dir / ".github" / "workflows" / "eas-ios.yml"
-        if workflow_path.exists():
             add_check(
                 checks,
-                "VC-013",
-                "CI Workflow Presence",
+                "VC-022",
+                "Deployment Human Input Boolean Field Format",
                 "Conditional",
-                "pass",
+                "skipped",
+                "withDeploymentLayer is not enabled.",
+                started=check_started,
             )
-        else:
             add_check(
                 checks,
-                "VC-013",
-                "CI Workflow Presence",
+                "VC-023",
+                "Deployment Human Input Cross-File Alignment",
                 "Conditional",
                 "skipped",
-                "CI workflow not found yet (expected before setup_ci_eas.ps1).",
+                "withDeploymentLayer is not enabled.",
+                started=check_started,
             )
-            warnings.append(
-                "CI workflow missing; run setup_ci_eas.ps1 to complete pipeline setup."
+
+        module_contracts: list[tuple[str, str, list[str]]] = [
+            (
+                "withUiFoundation",
+                "MC-001 UI Foundation Contract",
+                [
+                    "app/(tabs)/_layout.tsx",
+                    "app/(tabs)/index.tsx",
+                    "app/(tabs)/explore.tsx",
+                    "app/(tabs)/profile.tsx",
+                    "src/ui/StatePanel.tsx",
+                    "src/ui/theme.ts",
+                ],
+            ),
+            (
+                "withProfile",
+                "MC-002 Profile Contract",
+                ["app/settings.tsx", "src/profile/ProfileActions.tsx"],
+            ),
+            (
+                "withAuth",
+                "MC-003 Auth Contract",
+                [
+                    "app/sign-in.tsx",
+                    "src/auth/AuthContext.tsx",
+                    "src/auth/secureSession.ts",
+                    "src/auth/oauthProviders.ts",
+                    "__tests__/auth-oauth.test.ts",
+                ],
+            ),
+            (
+                "withPush",
+                "MC-004 Push Contract",
+                [
+                    "src/notifications/registerForPushNotifications.ts",
+                    "src/notifications/NotificationProvider.tsx",
+                    "src/notifications/notificationDeepLink.ts",
+                    "__tests__/notification-deeplink.test.ts",
+                ],
+            ),
+            (
+                "withDataLayer",
+                "MC-005 Data Layer Contract",
+                [
+                    "src/data/apiClient.ts",
+                    "src/data/requestPolicy.ts",
+                    "src/data/useAsyncResource.ts",
+                    "__tests__/async-resource.test.ts",
+                ],
+            ),
+            (
+                "withAnalytics",
+                "MC-006 Analytics Contract",
+                ["src/observability/analytics.ts"],
+            ),
+            (
+                "withCrashReporting",
+                "MC-007 Crash Contract",
+                ["src/observability/crashReporter.ts"],
+            ),
+            (
+                "withLocalization",
+                "MC-008 Localization Contract",
+                ["src/localization/i18n.ts", "src/localization/messages/en.ts"],
+            ),
+            (
+                "withAccessibilityChecks",
+                "MC-009 Accessibility Checklist Contract",
+                ["docs/accessibility-checklist.md"],
+            ),
+            (
+                "withPrivacyChecklist",
+                "MC-010 Privacy Checklist Contract",
+                ["docs/privacy-checklist.md"],
+            ),
+        ]
+
+        for flag_key, contract_name, required_paths in module_contracts:
+            enabled = bool(modules.get(flag_key, False))
+            if not enabled:
+                module_checks.append(
+                    {
+                        "id": contract_name.split()[0],
+                        "name": contract_name,
+                        "result": "skipped",
+                        "reason": f"{flag_key} is not enabled.",
+                    }
+                )
+                continue
+            missing = check_required_files(project_dir, required_paths)
+            if missing:
+                module_checks.append(
+                    {
+                        "id": contract_name.split()[0],
+                        "name": contract_name,
+                        "result": "fail",
+                        "reason": "Missing required files: " + ", ".join(missing),
+                    }
+                )
+            else:
+                module_checks.append(
+                    {
+                        "id": contract_name.split()[0],
+                        "name": contract_name,
+                        "result": "pass",
+                        "reason": "",
+                    }
+                )
+
+        if bool(modules.get("withLocalization", False)) and (
+            project_dir / LOCALIZATION_MESSAGES_DIR
+        ).is_dir():
+            check_started = time.monotonic()
+            localization_index = build_localization_index(project_dir, hash_cache, cache_dir)
+            incomplete_locales = [
+                f"{locale} ({entry['missingCount']} missing)"
+                for locale, entry in localization_index["locales"].items()
+                if entry["missingCount"]
+            ]
+            problems: list[str] = []
+            if incomplete_locales:
+                problems.append("Locales missing keys: " + ", ".join(incomplete_locales))
+            if localization_index["unknownKeyCount"]:
+                problems.append(
+                    f"{localization_index['unknownKeyCount']} t() calls use keys missing "
+                    f"from the {localization_index['baseLocale'] or 'merged'} bundle: "
+                    + ", ".join(localization_index["unknownKeys"][:5])
+                )
+            summary = (
+                f"{len(localization_index['locales'])} locales, "
+                f"{localization_index['callSites']} t() call sites, "
+                f"{localization_index['unusedKeyCount']} unused keys"
+            )
+            module_checks.append(
+                {
+                    "id": "MC-011",
+                    "name": "MC-011 Localization Key Coverage",
+                    "result": "fail" if problems else "pass",
+                    "reason": "; ".join(problems) if problems else summary + ".",
+                    "durationMs": elapsed_ms(check_started),
+                }
+            )
+
+        # The JSX lint pass is shared; whichever check consumes it first is billed for it.
+        jsx_lint_results: JsxLintResults | None = None
+        if bool(modules.get("withAccessibilityChecks", False)):
+            check_started = time.monotonic()
+            jsx_lint_results = collect_jsx_lint_results(project_dir, hash_cache, cache_dir)
+            accessibility_lint = build_accessibility_lint(jsx_lint_results)
+            summary = (
+                f"{accessibility_lint['elementsChecked']} touchable, button and image elements "
+                f"in {accessibility_lint['filesScanned']} files"
+            )
+            if accessibility_lint["filesUnparsed"]:
+                summary += f" ({len(accessibility_lint['filesUnparsed'])} files could not be parsed)"
+            module_checks.append(
+                {
+                    "id": "MC-012",
+                    "name": "MC-012 Accessibility Props Lint",
+                    "result": "fail" if accessibility_lint["findingCount"] else "pass",
+                    "reason": (
+                        f"{accessibility_lint['findingCount']} elements lack accessibility props: "
+                        + "; ".join(accessibility_lint["findings"][:5])
+                        if accessibility_lint["findingCount"]
+                        else summary + "."
+                    ),
+                    "durationMs": elapsed_ms(check_started),
+                }
             )
 
-        smoke_test_path = project_dir / "__tests__" / "app-shell.test.tsx"
-        if smoke_test_path.exists():
+        check_started = time.monotonic()
+        prd_path = Path(args.prd_path).resolve()
+        if not prd_path.exists() or not prd_path.is_file():
             add_check(
                 checks,
-                "VC-016",
-                "Smoke Test File Presence",
+                "VC-025",
+                "PRD Requirement Extraction",
                 "Blocker",
-                "pass",
+                "fail",
+                f"PRD path does not exist: {prd_path}",
+                started=check_started,
             )
-        else:
             add_check(
                 checks,
-                "VC-016",
-                "Smoke Test File Presence",
+                "VC-026",
+                "PRD Implementation Report Presence",
                 "Blocker",
-                "fail",
-                "__tests__/app-shell.test.tsx is missing.",
+                "skipped",
+                "Skipped because PRD could not be loaded.",
+                started=check_started,
             )
-
-        theme_file_path = project_dir / "src" / "ui" / "theme.ts"
-        if theme_file_path.exists():
             add_check(
                 checks,
-                "VC-024",
-                "Theme Token File Presence",
+                "VC-027",
+                "PRD Mapping Completeness",
                 "Blocker",
-                "pass",
+                "skipped",
+                "Skipped because PRD could not be loaded.",
+                started=check_started,
             )
-        else:
             add_check(
                 checks,
-                "VC-024",
-                "Theme Token File Presence",
+                "VC-028",
+                "P0 Implementation Evidence",
                 "Blocker",
-                "fail",
-                "src/ui/theme.ts is missing.",
+                "skipped",
+                "Skipped because PRD could not be loaded.",
+                started=check_started,
             )
-
-        metadata_path = project_dir / "skill.modules.json"
-        modules: dict[str, bool] = {}
-        release_branch = "main"
-        use_app_config_ts = False
-        with_deployment_layer = False
-        if metadata_path.exists():
+            add_check(
+                checks,
+                "VC-029",
+                "Custom Feature Test Coverage",
+                "Blocker",
+                "skipped",
+                "Skipped because PRD could not be loaded.",
+                started=check_started,
+            )
+        else:
+            prd_requirements: list[dict[str, str]] = []
             try:
-                metadata = load_json(metadata_path)
-                release_branch_raw = metadata.get("releaseBranch", "main")
-                if isinstance(release_branch_raw, str) and release_branch_raw.strip():
-                    release_branch = release_branch_raw.strip()
-                raw_modules = metadata.get("modules", {})
-                if isinstance(raw_modules, dict):
-                    modules = {k: bool(v) for k, v in raw_modules.items()}
-                with_deployment_layer = bool(modules.get("withDeploymentLayer", False))
+                prd_requirements = extract_prd_requirements(prd_path, memo)
+            except Exception as exc:  # pragma: no cover - defensive parser guard
                 add_check(
                     checks,
-                    "VC-015",
-                    "skill.modules.json Parse",
+                    "VC-025",
+                    "PRD Requirement Extraction",
                     "Blocker",
-                    "pass",
+                    "fail",
+                    f"Failed to parse PRD requirements: {exc}",
+                    started=check_started,
                 )
-                use_app_config_ts = bool(modules.get("useAppConfigTs", False))
-                if use_app_config_ts:
-                    if (project_dir / "app.config.ts").exists():
-                        add_check(
-                            checks,
-                            "VC-018",
-                            "app.config.ts Mode Contract",
-                            "Blocker",
-                            "pass",
+            else:
+                if not prd_requirements:
+                    add_check(
+                        checks,
+                        "VC-025",
+                        "PRD Requirement Extraction",
+                        "Blocker",
+                        "fail",
+                        "No FR-* or NFR-* requirement IDs were found in the PRD.",
+                        started=check_started,
+                    )
+                else:
+                    add_check(
+                        checks,
+                        "VC-025",
+                        "PRD Requirement Extraction",
+                        "Blocker",
+                        "pass",
+                        f"Parsed {len(prd_requirements)} requirements from PRD.",
+                        started=check_started,
+                    )
+                    prd_requirement_ids = [item["id"] for item in prd_requirements]
+                    p0_requirement_ids = [
+                        item["id"] for item in prd_requirements if item["priority"] == "P0"
+                    ]
+
+            if prd_requirements:
+                check_started = time.monotonic()
+                implementation_report_path = resolve_implementation_report_path(
+                    args, project_dir
+                )
+                implementation_report: dict[str, Any] | None = None
+                if not implementation_report_path.exists():
+                    add_check(
+                        checks,
+                        "VC-026",
+                        "PRD Implementation Report Presence",
+                        "Blocker",
+                        "fail",
+                        f"Missing {implementation_report_path}. Generate it and map PRD requirements to code/tests.",
+                        started=check_started,
+                    )
+                    add_check(
+                        checks,
+                        "VC-027",
+                        "PRD Mapping Completeness",
+                        "Blocker",
+                        "skipped",
+                        "Skipped because PRD implementation report is missing.",
+                        started=check_started,
+                    )
+                    add_check(
+                        checks,
+                        "VC-028",
+                        "P0 Implementation Evidence",
+                        "Blocker",
+                        "skipped",
+                        "Skipped because PRD implementation report is missing.",
+                        started=check_started,
+                    )
+                    add_check(
+                        checks,
+                        "VC-029",
+                        "Custom Feature Test Coverage",
+                        "Blocker",
+                        "skipped",
+                        "Skipped because PRD implementation report is missing.",
+                        started=check_started,
+                    )
+                else:
+                    try:
+                        implementation_report = load_prd_implementation_report(
+                            implementation_report_path
                         )
-                    else:
+                    except ValueError as exc:
                         add_check(
                             checks,
-                            "VC-018",
-                            "app.config.ts Mode Contract",
+                            "VC-026",
+                            "PRD Implementation Report Presence",
                             "Blocker",
                             "fail",
-                            "useAppConfigTs is enabled but app.config.ts is missing.",
+                            str(exc),
+                            started=check_started,
                         )
-                else:
-                    if (project_dir / "app.json").exists():
                         add_check(
                             checks,
-                            "VC-018",
-                            "app.json Mode Contract",
+                            "VC-027",
+                            "PRD Mapping Completeness",
                             "Blocker",
-                            "pass",
+                            "skipped",
+                            "Skipped because PRD implementation report failed to parse.",
+                            started=check_started,
                         )
-                    else:
                         add_check(
                             checks,
-                            "VC-018",
-                            "app.json Mode Contract",
+                            "VC-028",
+                            "P0 Implementation Evidence",
                             "Blocker",
-                            "fail",
-                            "useAppConfigTs is disabled but app.json is missing.",
+                            "skipped",
+                            "Skipped because PRD implementation report failed to parse.",
+                            started=check_started,
                         )
-            except ValueError as exc:
-                add_check(
-                    checks,
-                    "VC-015",
-                    "skill.modules.json Parse",
-                    "Blocker",
-                    "fail",
-                    str(exc),
-                )
-        else:
-                add_check(
-                    checks,
-                    "VC-015",
-                    "skill.modules.json Parse",
-                    "Blocker",
-                    "fail",
-                    "skill.modules.json is missing.",
-                )
-
-        if bool(modules.get("withPush", False)):
-            if use_app_config_ts:
-                push_config_path = project_dir / "app.config.ts"
-                if not push_config_path.exists():
-                    add_check(
-                        checks,
-                        "VC-019",
-                        "Push Plugin Contract",
-                        "Blocker",
-                        "fail",
-                        "withPush is enabled but app.config.ts is missing.",
-                    )
-                else:
-                    config_content = push_config_path.read_text(encoding="utf-8-sig")
-                    if "expo-notifications" in config_content:
                         add_check(
                             checks,
-                            "VC-019",
-                            "Push Plugin Contract",
+                            "VC-029",
+                            "Custom Feature Test Coverage",
                             "Blocker",
-                            "pass",
+                            "skipped",
+                            "Skipped because PRD implementation report failed to parse.",
+                            started=check_started,
                         )
                     else:
                         add_check(
                             checks,
-                            "VC-019",
-                            "Push Plugin Contract",
-                            "Blocker",
-                            "fail",
-                            "withPush is enabled but app.config.ts is missing expo-notifications plugin.",
-                        )
-            else:
-                if not app_json_path.exists():
-                    add_check(
-                        checks,
-                        "VC-019",
-                        "Push Plugin Contract",
-                        "Blocker",
-                        "fail",
-                        "withPush is enabled but app.json is missing.",
-                    )
-                else:
-                    try:
-                        app_json = load_json(app_json_path)
-                        expo_cfg = app_json.get("expo", {})
-                        plugins = expo_cfg.get("plugins", []) if isinstance(expo_cfg, dict) else []
-                        has_push_plugin = has_plugin(plugins, "expo-notifications")
-                    except ValueError as exc:
-                        add_check(
-                            checks,
-                            "VC-019",
-                            "Push Plugin Contract",
+                            "VC-026",
+                            "PRD Implementation Report Presence",
                             "Blocker",
-                            "fail",
-                            str(exc),
+                            "pass",
+                            f"Loaded {implementation_report_path}.",
+                            started=check_started,
                         )
-                    else:
-                        if has_push_plugin:
+
+                        check_started = time.monotonic()
+                        requirement_entries: dict[str, dict[str, Any]] = {}
+                        for entry in implementation_report.get("requirements", []):
+                            if not isinstance(entry, dict):
+                                continue
+                            requirement_id = normalize_requirement_id(entry.get("id"))
+                            if not requirement_id:
+                                continue
+                            requirement_entries[requirement_id] = entry
+                            for raw_path in normalize_str_list(
+                                entry.get("code")
+                            ) + normalize_str_list(entry.get("tests")):
+                                _, relative_path = resolve_project_path(
+                                    project_dir, raw_path
+                                )
+                                if relative_path:
+                                    prd_evidence_paths.add(relative_path)
+
+                        missing_requirement_mappings = [
+                            req_id
+                            for req_id in prd_requirement_ids
+                            if req_id not in requirement_entries
+                        ]
+                        if missing_requirement_mappings:
                             add_check(
                                 checks,
-                                "VC-019",
-                                "Push Plugin Contract",
+                                "VC-027",
+                                "PRD Mapping Completeness",
                                 "Blocker",
-                                "pass",
+                                "fail",
+                                "Missing requirement mappings: "
+                                + ", ".join(missing_requirement_mappings),
+                                started=check_started,
                             )
                         else:
                             add_check(
                                 checks,
-                                "VC-019",
-                                "Push Plugin Contract",
+                                "VC-027",
+                                "PRD Mapping Completeness",
                                 "Blocker",
-                                "fail",
-                                "withPush is enabled but app.json is missing expo-notifications plugin.",
+                                "pass",
+                                started=check_started,
                             )
 
-        if workflow_path.exists():
-            workflow_content = workflow_path.read_text(encoding="utf-8-sig")
-            expected_ref = f"refs/heads/{release_branch}"
-            expected_branch_line = f"- {release_branch}"
-            if expected_ref in workflow_content and expected_branch_line in workflow_content:
-                add_check(
-                    checks,
-                    "VC-017",
-                    "Workflow Release Branch Contract",
-                    "Conditional",
-                    "pass",
-                )
-            else:
-                add_check(
-                    checks,
-                    "VC-017",
-                    "Workflow Release Branch Contract",
-                    "Conditional",
-                    "fail",
-                    f"Workflow does not appear to target release branch '{release_branch}'.",
-                )
+                        check_started = time.monotonic()
+                        referenced_test_paths: set[str] = set()
+                        for requirement_id in p0_requirement_ids:
+                            entry = requirement_entries.get(requirement_id)
+                            if not entry:
+                                continue
 
-        if with_deployment_layer:
-            human_inputs_path = project_dir / "release" / "human-inputs.md"
-            if human_inputs_path.exists():
-                add_check(
-                    checks,
-                    "VC-020",
-                    "Deployment Human Input File Presence",
-                    "Conditional",
-                    "pass",
-                )
-                human_inputs = parse_human_inputs_markdown(human_inputs_path)
+                            status = str(entry.get("status", "")).strip().lower()
+                            if status not in IMPLEMENTED_STATUSES:
+                                p0_implementation_failures.append(
+                                    f"{requirement_id}: status must be implemented (found '{status or 'missing'}')."
+                                )
 
-                missing_required_fields: list[str] = []
-                for key, owner in REQUIRED_HUMAN_INPUT_FIELDS:
-                    if not human_inputs.get(key):
-                        missing_required_fields.append(key)
-                        unresolved_human_dependencies.append(
-                            {
-                                "field": key,
-                                "owner": owner,
-                                "nextAction": "Fill value in release/human-inputs.md",
-                            }
-                        )
+                            code_paths = normalize_str_list(entry.get("code"))
+                            test_paths = normalize_str_list(entry.get("tests"))
+                            if not code_paths:
+                                p0_implementation_failures.append(
+                                    f"{requirement_id}: no code evidence paths listed."
+                                )
+                            if not test_paths:
+                                p0_implementation_failures.append(
+                                    f"{requirement_id}: no test evidence paths listed."
+                                )
 
-                if missing_required_fields:
-                    add_check(
-                        checks,
-                        "VC-021",
-                        "Deployment Human Input Required Fields",
-                        "Conditional",
-                        "fail",
-                        "Missing required values: " + ", ".join(missing_required_fields),
-                    )
-                else:
-                    add_check(
-                        checks,
-                        "VC-021",
-                        "Deployment Human Input Required Fields",
-                        "Conditional",
-                        "pass",
-                    )
+                            for raw_path in code_paths:
+                                resolved_path, relative_path = resolve_project_path(
+                                    project_dir, raw_path
+                                )
+                                if not resolved_path:
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: code path escapes project root: {raw_path}"
+                                    )
+                                    continue
+                                if not resolved_path.exists():
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: missing code file {relative_path}"
+                                    )
 
-                invalid_yes_no_fields: list[str] = []
-                for field in YES_NO_HUMAN_INPUT_FIELDS:
-                    value = human_inputs.get(field, "")
-                    if value and value.strip().lower() not in {"yes", "no"}:
-                        invalid_yes_no_fields.append(field)
-                if invalid_yes_no_fields:
-                    add_check(
-                        checks,
-                        "VC-022",
-                        "Deployment Human Input Boolean Field Format",
-                        "Conditional",
-                        "fail",
-                        "Expected yes/no values for: "
-                        + ", ".join(invalid_yes_no_fields),
-                    )
-                else:
-                    add_check(
-                        checks,
-                        "VC-022",
-                        "Deployment Human Input Boolean Field Format",
-                        "Conditional",
-                        "pass",
-                    )
+                            for raw_path in test_paths:
+                                resolved_path, relative_path = resolve_project_path(
+                                    project_dir, raw_path
+                                )
+                                if not resolved_path:
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: test path escapes project root: {raw_path}"
+                                    )
+                                    continue
+                                if not resolved_path.exists():
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: missing test file {relative_path}"
+                                    )
+                                    continue
 
-                app_identity = extract_app_identity(project_dir, use_app_config_ts)
-                mismatches: list[str] = []
-                file_bundle = human_inputs.get("IOS_BUNDLE_ID", "").strip()
-                file_version = human_inputs.get("APP_VERSION", "").strip()
-                file_build_number = human_inputs.get("IOS_BUILD_NUMBER", "").strip()
-                file_release_branch = human_inputs.get("RELEASE_BRANCH", "").strip()
+                                referenced_test_paths.add(relative_path)
+                                if ".test." not in relative_path:
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: test evidence must point to *.test.ts or *.test.tsx file ({relative_path})."
+                                    )
+                                    continue
 
-                if (
-                    file_bundle
-                    and app_identity.get("bundleIdentifier")
-                    and file_bundle != app_identity["bundleIdentifier"]
-                ):
-                    mismatches.append(
-                        "IOS_BUNDLE_ID does not match app config bundleIdentifier"
-                    )
-                if (
-                    file_version
-                    and app_identity.get("version")
-                    and file_version != app_identity["version"]
-                ):
-                    mismatches.append("APP_VERSION does not match app config version")
-                if (
-                    file_build_number
-                    and app_identity.get("buildNumber")
-                    and file_build_number != app_identity["buildNumber"]
-                ):
-                    mismatches.append(
-                        "IOS_BUILD_NUMBER does not match app config ios.buildNumber"
-                    )
-                if file_release_branch and file_release_branch != release_branch:
-                    mismatches.append(
-                        "RELEASE_BRANCH does not match skill.modules.json releaseBranch"
-                    )
+                                if not memoized_file_analysis(
+                                    memo,
+                                    hash_cache,
+                                    "test-assertions",
+                                    relative_path,
+                                    resolved_path,
+                                    test_content_has_assertion,
+                                ):
+                                    p0_implementation_failures.append(
+                                        f"{requirement_id}: test file has no assertion ({relative_path})."
+                                    )
+
+                        if p0_implementation_failures:
+                            add_check(
+                                checks,
+                                "VC-028",
+                                "P0 Implementation Evidence",
+                                "Blocker",
+                                "fail",
+                                " | ".join(p0_implementation_failures[:12]),
+                                started=check_started,
+                            )
+                        else:
+                            add_check(
+                                checks,
+                                "VC-028",
+                                "P0 Implementation Evidence",
+                                "Blocker",
+                                "pass",
+                                started=check_started,
+                            )
+
+                        check_started = time.monotonic()
+                        has_module_features = any(
+                            req_id.startswith("FR-") and not req_id.startswith("FR-GLOB-")
+                            for req_id in prd_requirement_ids
+                        )
+                        if has_module_features:
+                            custom_tests = sorted(
+                                path
+                                for path in referenced_test_paths
+                                if path not in BASELINE_TEST_FILES
+                            )
+                            if custom_tests:
+                                add_check(
+                                    checks,
+                                    "VC-029",
+                                    "Custom Feature Test Coverage",
+                                    "Blocker",
+                                    "pass",
+                                    f"Custom feature tests: {', '.join(custom_tests[:6])}",
+                                    started=check_started,
+                                )
+                            else:
+                                add_check(
+                                    checks,
+                                    "VC-029",
+                                    "Custom Feature Test Coverage",
+                                    "Blocker",
+                                    "fail",
+                                    "Only baseline tests are mapped. Add feature-specific tests for module requirements.",
+                                    started=check_started,
+                                )
+                        else:
+                            add_check(
+                                checks,
+                                "VC-029",
+                                "Custom Feature Test Coverage",
+                                "Blocker",
+                                "skipped",
+                                "No module-specific FR requirements were found in PRD.",
+                                started=check_started,
+                            )
+
+        check_started = time.monotonic()
+        placeholder_rules = PlaceholderRules()
+        placeholder_config_errors: list[str] = []
+        try:
+            placeholder_rules = load_placeholder_rules(project_dir, placeholder_rule_packs)
+        except ValueError as exc:
+            placeholder_config_errors.append(str(exc))
+        if placeholder_baseline_path:
+            try:
+                placeholder_baseline = load_finding_baseline(
+                    project_dir, placeholder_baseline_path
+                )
+            except ValueError as exc:
+                placeholder_config_errors.append(str(exc))
+        placeholder_scan = placeholder_detector(
+            rules=placeholder_rules, baseline=placeholder_baseline
+        )
+        secret_scan = secret_detector()
+        source_detectors = [placeholder_scan, secret_scan]
+        requirement_tag_scan: SourceDetector | None = None
+        if prd_requirement_ids:
+            requirement_tag_scan = requirement_tag_detector(set(prd_requirement_ids))
+            source_detectors.append(requirement_tag_scan)
+        for detector in source_detectors:
+            detector.events = events
+        scan_deadline = (
+            run_started + args.time_budget if args.time_budget is not None else None
+        )
+        source_scan_coverage = run_source_scan(
+            project_dir,
+            source_detectors,
+            deadline=scan_deadline,
+            resume_paths=load_scan_resume_list(cache_dir),
+            hash_cache=hash_cache,
+            memo=memo,
+            remote_cache=remote_cache,
+            limits=source_scan_limits(args),
+        )
+        if scan_deadline is not None:
+            save_scan_resume_list(cache_dir, source_scan_coverage.unscanned)
+        coverage_reason = (
+            f"Time budget expired after scanning {source_scan_coverage.files_scanned}/"
+            f"{source_scan_coverage.files_total} files "
+            f"({source_scan_coverage.bytes_scanned}/{source_scan_coverage.bytes_total} bytes); "
+            "remaining files are queued for the next run."
+        )
+        placeholder_findings = placeholder_scan.findings
+        accepted_placeholder_findings = placeholder_scan.suppressed
+        if placeholder_findings:
+            add_check(
+                checks,
+                "VC-030",
+                "Placeholder Marker Scan",
+                "Blocker",
+                "fail",
+                "Found unresolved placeholder markers in source files.",
+                started=check_started,
+            )
+        elif not source_scan_coverage.complete:
+            add_check(
+                checks,
+                "VC-030",
+                "Placeholder Marker Scan",
+                "Blocker",
+                "partial",
+                coverage_reason,
+                started=check_started,
+            )
+        elif placeholder_scan.suppressed:
+            add_check(
+                checks,
+                "VC-030",
+                "Placeholder Marker Scan",
+                "Blocker",
+                "pass",
+                f"{len(placeholder_scan.suppressed)} findings accepted by "
+                f"{placeholder_baseline.path}.",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-030",
+                "Placeholder Marker Scan",
+                "Blocker",
+                "pass",
+                started=check_started,
+            )
 
-                if mismatches:
-                    add_check(
-                        checks,
-                        "VC-023",
-                        "Deployment Human Input Cross-File Alignment",
-                        "Conditional",
-                        "fail",
-                        " | ".join(mismatches),
-                    )
-                else:
-                    add_check(
-                        checks,
-                        "VC-023",
-                        "Deployment Human Input Cross-File Alignment",
-                        "Conditional",
-                        "pass",
-                    )
-            else:
+        check_started = time.monotonic()
+        try:
+            manifest_files = load_template_manifest(TEMPLATE_FINGERPRINT_MANIFEST_PATH)
+        except ValueError as exc:
+            add_check(
+                checks,
+                "VC-031",
+                "Untouched Template File Scan",
+                "Conditional",
+                "skipped",
+                str(exc),
+                started=check_started,
+            )
+        else:
+            app_name = extract_app_identity(project_dir, use_app_config_ts, app_config_ts).get("name", "")
+            untouched_template_files = scan_untouched_template_files(
+                project_dir, manifest_files, hash_cache, app_name
+            )
+            untouched_evidence = [
+                path
+                for path in untouched_template_files
+                if path in prd_evidence_paths and path not in BASELINE_TEST_FILES
+            ]
+            if untouched_evidence:
                 add_check(
                     checks,
-                    "VC-020",
-                    "Deployment Human Input File Presence",
+                    "VC-031",
+                    "Untouched Template File Scan",
                     "Conditional",
                     "fail",
-                    "release/human-inputs.md is missing while withDeploymentLayer is enabled.",
+                    "PRD evidence files are unchanged from scaffold templates: "
+                    + ", ".join(untouched_evidence[:12]),
+                    started=check_started,
                 )
+            else:
                 add_check(
                     checks,
-                    "VC-021",
-                    "Deployment Human Input Required Fields",
+                    "VC-031",
+                    "Untouched Template File Scan",
                     "Conditional",
-                    "skipped",
-                    "Skipped because release/human-inputs.md is missing.",
+                    "pass",
+                    f"{len(untouched_template_files)} scaffold template files unchanged; "
+                    "none are mapped as PRD evidence.",
+                    started=check_started,
                 )
+
+        check_started = time.monotonic()
+        if requirement_tag_scan is None:
+            add_check(
+                checks,
+                "VC-032",
+                "Source Requirement Tag Resolution",
+                "Conditional",
+                "skipped",
+                "Skipped because no PRD requirements were parsed.",
+                started=check_started,
+            )
+        else:
+            requirement_tag_findings = requirement_tag_scan.findings
+            if requirement_tag_findings:
                 add_check(
                     checks,
-                    "VC-022",
-                    "Deployment Human Input Boolean Field Format",
+                    "VC-032",
+                    "Source Requirement Tag Resolution",
                     "Conditional",
-                    "skipped",
-                    "Skipped because release/human-inputs.md is missing.",
+                    "fail",
+                    "Source files reference requirement IDs missing from the PRD.",
+                    started=check_started,
                 )
+            elif not source_scan_coverage.complete:
                 add_check(
                     checks,
-                    "VC-023",
-                    "Deployment Human Input Cross-File Alignment",
+                    "VC-032",
+                    "Source Requirement Tag Resolution",
                     "Conditional",
-                    "skipped",
-                    "Skipped because release/human-inputs.md is missing.",
+                    "partial",
+                    coverage_reason,
+                    started=check_started,
                 )
-                unresolved_human_dependencies.append(
-                    {
-                        "field": "release/human-inputs.md",
-                        "owner": "release-manager",
-                        "nextAction": "Create release/human-inputs.md from skill template.",
-                    }
+            else:
+                add_check(
+                    checks,
+                    "VC-032",
+                    "Source Requirement Tag Resolution",
+                    "Conditional",
+                    "pass",
+                    started=check_started,
                 )
-        else:
+
+        check_started = time.monotonic()
+        if placeholder_config_errors:
             add_check(
                 checks,
-                "VC-020",
-                "Deployment Human Input File Presence",
-                "Conditional",
-                "skipped",
-                "withDeploymentLayer is not enabled.",
+                "VC-033",
+                "Placeholder Rule Packs And Baseline",
+                "Blocker",
+                "fail",
+                "; ".join(placeholder_config_errors),
+                started=check_started,
             )
+        elif placeholder_rule_packs or placeholder_baseline is not None:
+            summary = [
+                f"{len(placeholder_rules.packs)} rule packs "
+                f"({placeholder_rules.term_count} terms, "
+                f"{placeholder_rules.pattern_count} patterns)"
+            ]
+            if placeholder_baseline is not None:
+                summary.append(
+                    f"baseline {placeholder_baseline.path} with "
+                    f"{len(placeholder_baseline.entries)} accepted findings"
+                )
             add_check(
                 checks,
-                "VC-021",
-                "Deployment Human Input Required Fields",
-                "Conditional",
-                "skipped",
-                "withDeploymentLayer is not enabled.",
+                "VC-033",
+                "Placeholder Rule Packs And Baseline",
+                "Blocker",
+                "pass",
+                "; ".join(summary) + ".",
+                started=check_started,
             )
+
+        check_started = time.monotonic()
+        secret_findings = secret_scan.findings
+        if secret_findings:
             add_check(
                 checks,
-                "VC-022",
-                "Deployment Human Input Boolean Field Format",
-                "Conditional",
-                "skipped",
-                "withDeploymentLayer is not enabled.",
+                "VC-034",
+                "Secret Scan",
+                "Blocker",
+                "fail",
+                "Found likely credentials in project files. Revoke them and store them "
+                "in GitHub Secrets or EAS credentials instead.",
+                started=check_started,
             )
+        elif not source_scan_coverage.complete:
             add_check(
                 checks,
-                "VC-023",
-                "Deployment Human Input Cross-File Alignment",
-                "Conditional",
-                "skipped",
-                "withDeploymentLayer is not enabled.",
+                "VC-034",
+                "Secret Scan",
+                "Blocker",
+                "partial",
+                coverage_reason,
+                started=check_started,
             )
+        else:
+            add_check(checks, "VC-034", "Secret Scan", "Blocker", "pass", started=check_started)
 
-        module_contracts: list[tuple[str, str, list[str]]] = [
-            (
-                "withUiFoundation",
-                "MC-001 UI Foundation Contract",
-                [
-                    "app/(tabs)/_layout.tsx",
-                    "app/(tabs)/index.tsx",
-                    "app/(tabs)/explore.tsx",
-                    "app/(tabs)/profile.tsx",
-                    "src/ui/StatePanel.tsx",
-                    "src/ui/theme.ts",
-                ],
-            ),
-            (
-                "withProfile",
-                "MC-002 Profile Contract",
-                ["app/settings.tsx", "src/profile/ProfileActions.tsx"],
-            ),
-            (
-                "withAuth",
-                "MC-003 Auth Contract",
-                [
-                    "app/sign-in.tsx",
-                    "src/auth/AuthContext.tsx",
-                    "src/auth/secureSession.ts",
-                    "src/auth/oauthProviders.ts",
-                    "__tests__/auth-oauth.test.ts",
-                ],
-            ),
-            (
-                "withPush",
-                "MC-004 Push Contract",
-                [
-                    "src/notifications/registerForPushNotifications.ts",
-                    "src/notifications/NotificationProvider.tsx",
-                    "src/notifications/notificationDeepLink.ts",
-                    "__tests__/notification-deeplink.test.ts",
-                ],
-            ),
-            (
-                "withDataLayer",
-                "MC-005 Data Layer Contract",
-                [
-                    "src/data/apiClient.ts",
-                    "src/data/requestPolicy.ts",
-                    "src/data/useAsyncResource.ts",
-                    "__tests__/async-resource.test.ts",
-                ],
-            ),
-            (
-                "withAnalytics",
-                "MC-006 Analytics Contract",
-                ["src/observability/analytics.ts"],
-            ),
-            (
-                "withCrashReporting",
-                "MC-007 Crash Contract",
-                ["src/observability/crashReporter.ts"],
-            ),
-            (
-                "withLocalization",
-                "MC-008 Localization Contract",
-                ["src/localization/i18n.ts", "src/localization/messages/en.ts"],
-            ),
-            (
-                "withAccessibilityChecks",
-                "MC-009 Accessibility Checklist Contract",
-                ["docs/accessibility-checklist.md"],
-            ),
-            (
-                "withPrivacyChecklist",
-                "MC-010 Privacy Checklist Contract",
-                ["docs/privacy-checklist.md"],
-            ),
-        ]
-
-        for flag_key, contract_name, required_paths in module_contracts:
-            enabled = bool(modules.get(flag_key, False))
-            if not enabled:
-                module_checks.append(
-                    {
-                        "id": contract_name.split()[0],
-                        "name": contract_name,
-                        "result": "skipped",
-                        "reason": f"{flag_key} is not enabled.",
-                    }
+        check_started = time.monotonic()
+        if args.scan_git_history:
+            git_history_secret_scan = scan_git_history_secrets(
+                Path(args.project_dir).resolve(), cache_dir, args.scan_max_file_bytes
+            )
+            history_summary = (
+                f"{git_history_secret_scan.blobs_scanned} blobs scanned, "
+                f"{git_history_secret_scan.blobs_cached} known from cache"
+            )
+            if git_history_secret_scan.error:
+                add_check(
+                    checks,
+                    "VC-035",
+                    "Git History Secret Scan",
+                    "Conditional",
+                    "skipped",
+                    git_history_secret_scan.error,
+                    started=check_started,
                 )
-                continue
-            missing = check_required_files(project_dir, required_paths)
-            if missing:
-                module_checks.append(
-                    {
-                        "id": contract_name.split()[0],
-                        "name": contract_name,
-                        "result": "fail",
-                        "reason": "Missing required files: " + ", ".join(missing),
-                    }
+            elif git_history_secret_scan.finding_count:
+                add_check(
+                    checks,
+                    "VC-035",
+                    "Git History Secret Scan",
+                    "Conditional",
+                    "fail",
+                    f"{git_history_secret_scan.finding_count} likely credentials are reachable "
+                    f"from git refs ({history_summary}). Revoke them; rewriting history "
+                    "does not invalidate a leaked credential.",
+                    started=check_started,
                 )
             else:
-                module_checks.append(
-                    {
-                        "id": contract_name.split()[0],
-                        "name": contract_name,
-                        "result": "pass",
-                        "reason": "",
-                    }
+                add_check(
+                    checks,
+                    "VC-035",
+                    "Git History Secret Scan",
+                    "Conditional",
+                    "pass",
+                    history_summary + ".",
+                    started=check_started,
                 )
 
-        prd_path = Path(args.prd_path).resolve()
-        if not prd_path.exists() or not prd_path.is_file():
+        check_started = time.monotonic()
+        if jsx_lint_results is None:
+            jsx_lint_results = collect_jsx_lint_results(project_dir, hash_cache, cache_dir)
+        performance_lint = build_performance_lint(jsx_lint_results, performance_severities)
+        performance_summary = (
+            f"{performance_lint['errorCount']} errors, {performance_lint['warningCount']} "
+            f"warnings, {performance_lint['suppressedCount']} suppressed in "
+            f"{performance_lint['filesScanned']} files"
+        )
+        if performance_config_errors:
+            add_check(
+                checks,
+                "VC-036",
+                "Runtime Performance Lint",
+                "Conditional",
+                "fail",
+                "; ".join(performance_config_errors),
+                started=check_started,
+            )
+        elif performance_lint["errorCount"]:
+            add_check(
+                checks,
+                "VC-036",
+                "Runtime Performance Lint",
+                "Conditional",
+                "fail",
+                f"{performance_summary}: " + "; ".join(performance_lint["errors"][:5]),
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-036",
+                "Runtime Performance Lint",
+                "Conditional",
+                "pass",
+                performance_summary + ".",
+                started=check_started,
+            )
+
+        # In app.config.ts mode an unresolved default export hides every config
+        # value, so checks that read it are skipped with the reason VC-010 fails with.
+        app_config_unresolved = (
+            use_app_config_ts and app_config_ts is None and app_config_ts_path.exists()
+        )
+        check_started = time.monotonic()
+        runtime_config = read_runtime_config(project_dir, use_app_config_ts, app_config_ts)
+        if app_config_unresolved:
             add_check(
                 checks,
-                "VC-025",
-                "PRD Requirement Extraction",
+                "VC-037",
+                "Hermes JS Engine",
                 "Blocker",
-                "fail",
-                f"PRD path does not exist: {prd_path}",
+                "skipped",
+                APP_CONFIG_UNRESOLVED_REASON,
+                started=check_started,
             )
+        elif "jsc" in runtime_config["jsEngines"]:
             add_check(
                 checks,
-                "VC-026",
-                "PRD Implementation Report Presence",
+                "VC-037",
+                "Hermes JS Engine",
                 "Blocker",
-                "skipped",
-                "Skipped because PRD could not be loaded.",
+                "fail",
+                'jsEngine is set to "jsc". Remove it or set it to "hermes"; Hermes '
+                "precompiles the bundle to bytecode, which cuts startup time and memory.",
+                started=check_started,
             )
+        else:
             add_check(
                 checks,
-                "VC-027",
-                "PRD Mapping Completeness",
+                "VC-037",
+                "Hermes JS Engine",
                 "Blocker",
-                "skipped",
-                "Skipped because PRD could not be loaded.",
+                "pass",
+                started=check_started,
             )
+
+        check_started = time.monotonic()
+        sdk_major = expo_sdk_major(pkg)
+        new_arch_enabled = runtime_config["newArchEnabled"]
+        if app_config_unresolved:
             add_check(
                 checks,
-                "VC-028",
-                "P0 Implementation Evidence",
+                "VC-038",
+                "New Architecture Compatibility",
                 "Blocker",
                 "skipped",
-                "Skipped because PRD could not be loaded.",
+                APP_CONFIG_UNRESOLVED_REASON,
+                started=check_started,
             )
+        elif sdk_major is None:
             add_check(
                 checks,
-                "VC-029",
-                "Custom Feature Test Coverage",
+                "VC-038",
+                "New Architecture Compatibility",
                 "Blocker",
                 "skipped",
-                "Skipped because PRD could not be loaded.",
+                "expo is not a versioned dependency in package.json.",
+                started=check_started,
             )
         else:
-            prd_requirements: list[dict[str, str]] = []
-            try:
-                prd_requirements = extract_prd_requirements(prd_path)
-            except Exception as exc:  # pragma: no cover - defensive parser guard
+            support = new_architecture_support(sdk_major)
+            if support == "required" and new_arch_enabled is False:
                 add_check(
                     checks,
-                    "VC-025",
-                    "PRD Requirement Extraction",
+                    "VC-038",
+                    "New Architecture Compatibility",
                     "Blocker",
                     "fail",
-                    f"Failed to parse PRD requirements: {exc}",
+                    f"Expo SDK {sdk_major} supports only the new architecture; "
+                    "remove newArchEnabled: false.",
+                    started=check_started,
+                )
+            elif support == "unsupported" and new_arch_enabled:
+                add_check(
+                    checks,
+                    "VC-038",
+                    "New Architecture Compatibility",
+                    "Blocker",
+                    "fail",
+                    f"Expo SDK {sdk_major} does not support the new architecture; "
+                    "upgrade the SDK or remove newArchEnabled: true.",
+                    started=check_started,
                 )
             else:
-                if not prd_requirements:
-                    add_check(
-                        checks,
-                        "VC-025",
-                        "PRD Requirement Extraction",
-                        "Blocker",
-                        "fail",
-                        "No FR-* or NFR-* requirement IDs were found in the PRD.",
+                if support == "default" and new_arch_enabled is False:
+                    warnings.append(
+                        f"newArchEnabled is false; Expo SDK {sdk_major} enables the new "
+                        "architecture by default and later SDKs require it."
                     )
+                if new_arch_enabled is None:
+                    state = "enabled" if support in ("default", "required") else "disabled"
                 else:
-                    add_check(
-                        checks,
-                        "VC-025",
-                        "PRD Requirement Extraction",
-                        "Blocker",
-                        "pass",
-                        f"Parsed {len(prd_requirements)} requirements from PRD.",
-                    )
-                    prd_requirement_ids = [item["id"] for item in prd_requirements]
-                    p0_requirement_ids = [
-                        item["id"] for item in prd_requirements if item["priority"] == "P0"
-                    ]
-
-            if prd_requirements:
-                implementation_report_path = (
-                    (
-                        Path(args.implementation_report_path).resolve()
-                        if Path(args.implementation_report_path).is_absolute()
-                        else (project_dir / args.implementation_report_path).resolve()
-                    )
-                    if args.implementation_report_path
-                    else (
-                        project_dir / DEFAULT_PRD_IMPLEMENTATION_REPORT_REL_PATH
-                    ).resolve()
+                    state = "enabled" if new_arch_enabled else "disabled"
+                add_check(
+                    checks,
+                    "VC-038",
+                    "New Architecture Compatibility",
+                    "Blocker",
+                    "pass",
+                    f"Expo SDK {sdk_major}: new architecture {state} (support: {support}).",
+                    started=check_started,
                 )
-                implementation_report: dict[str, Any] | None = None
-                if not implementation_report_path.exists():
-                    add_check(
-                        checks,
-                        "VC-026",
-                        "PRD Implementation Report Presence",
-                        "Blocker",
-                        "fail",
-                        f"Missing {implementation_report_path}. Generate it and map PRD requirements to code/tests.",
-                    )
-                    add_check(
-                        checks,
-                        "VC-027",
-                        "PRD Mapping Completeness",
-                        "Blocker",
-                        "skipped",
-                        "Skipped because PRD implementation report is missing.",
-                    )
-                    add_check(
-                        checks,
-                        "VC-028",
-                        "P0 Implementation Evidence",
-                        "Blocker",
-                        "skipped",
-                        "Skipped because PRD implementation report is missing.",
-                    )
-                    add_check(
-                        checks,
-                        "VC-029",
-                        "Custom Feature Test Coverage",
-                        "Blocker",
-                        "skipped",
-                        "Skipped because PRD implementation report is missing.",
-                    )
-                else:
-                    try:
-                        implementation_report = load_prd_implementation_report(
-                            implementation_report_path
-                        )
-                    except ValueError as exc:
-                        add_check(
-                            checks,
-                            "VC-026",
-                            "PRD Implementation Report Presence",
-                            "Blocker",
-                            "fail",
-                            str(exc),
-                        )
-                        add_check(
-                            checks,
-                            "VC-027",
-                            "PRD Mapping Completeness",
-                            "Blocker",
-                            "skipped",
-                            "Skipped because PRD implementation report failed to parse.",
-                        )
-                        add_check(
-                            checks,
-                            "VC-028",
-                            "P0 Implementation Evidence",
-                            "Blocker",
-                            "skipped",
-                            "Skipped because PRD implementation report failed to parse.",
-                        )
-                        add_check(
-                            checks,
-                            "VC-029",
-                            "Custom Feature Test Coverage",
-                            "Blocker",
-                            "skipped",
-                            "Skipped because PRD implementation report failed to parse.",
-                        )
-                    else:
-                        add_check(
-                            checks,
-                            "VC-026",
-                            "PRD Implementation Report Presence",
-                            "Blocker",
-                            "pass",
-                            f"Loaded {implementation_report_path}.",
-                        )
-
-                        requirement_entries: dict[str, dict[str, Any]] = {}
-                        for entry in implementation_report.get("requirements", []):
-                            if not isinstance(entry, dict):
-                                continue
-                            requirement_id = normalize_requirement_id(entry.get("id"))
-                            if not requirement_id:
-                                continue
-                            requirement_entries[requirement_id] = entry
-
-                        missing_requirement_mappings = [
-                            req_id
-                            for req_id in prd_requirement_ids
-                            if req_id not in requirement_entries
-                        ]
-                        if missing_requirement_mappings:
-                            add_check(
-                                checks,
-                                "VC-027",
-                                "PRD Mapping Completeness",
-                                "Blocker",
-                                "fail",
-                                "Missing requirement mappings: "
-                                + ", ".join(missing_requirement_mappings),
-                            )
-                        else:
-                            add_check(
-                                checks,
-                                "VC-027",
-                                "PRD Mapping Completeness",
-                                "Blocker",
-                                "pass",
-                            )
-
-                        referenced_test_paths: set[str] = set()
-                        for requirement_id in p0_requirement_ids:
-                            entry = requirement_entries.get(requirement_id)
-                            if not entry:
-                                continue
-
-                            status = str(entry.get("status", "")).strip().lower()
-                            if status not in IMPLEMENTED_STATUSES:
-                                p0_implementation_failures.append(
-                                    f"{requirement_id}: status must be implemented (found '{status or 'missing'}')."
-                                )
-
-                            code_paths = normalize_str_list(entry.get("code"))
-                            test_paths = normalize_str_list(entry.get("tests"))
-                            if not code_paths:
-                                p0_implementation_failures.append(
-                                    f"{requirement_id}: no code evidence paths listed."
-                                )
-                            if not test_paths:
-                                p0_implementation_failures.append(
-                                    f"{requirement_id}: no test evidence paths listed."
-                                )
-
-                            for raw_path in code_paths:
-                                resolved_path, relative_path = resolve_project_path(
-                                    project_dir, raw_path
-                                )
-                                if not resolved_path:
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: code path escapes project root: {raw_path}"
-                                    )
-                                    continue
-                                if not resolved_path.exists():
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: missing code file {relative_path}"
-                                    )
-
-                            for raw_path in test_paths:
-                                resolved_path, relative_path = resolve_project_path(
-                                    project_dir, raw_path
-                                )
-                                if not resolved_path:
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: test path escapes project root: {raw_path}"
-                                    )
-                                    continue
-                                if not resolved_path.exists():
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: missing test file {relative_path}"
-                                    )
-                                    continue
-
-                                referenced_test_paths.add(relative_path)
-                                if ".test." not in relative_path:
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: test evidence must point to *.test.ts or *.test.tsx file ({relative_path})."
-                                    )
-                                    continue
 
-                                test_content = resolved_path.read_text(encoding="utf-8-sig")
-                                if "expect(" not in test_content:
-                                    p0_implementation_failures.append(
-                                        f"{requirement_id}: test file has no assertion ({relative_path})."
-                                    )
+        check_started = time.monotonic()
+        metro_config_path = next(
+            (project_dir / name for name in METRO_CONFIG_FILES if (project_dir / name).exists()),
+            None,
+        )
+        if metro_config_path is None:
+            add_check(
+                checks,
+                "VC-039",
+                "Metro Inline Requires",
+                "Conditional",
+                "fail",
+                "metro.config.js is missing; extend expo/metro-config and enable "
+                "transformer inlineRequires so modules load on first use.",
+                started=check_started,
+            )
+        elif re.search(
+            r"inlineRequires\s*:\s*(true|\{)",
+            metro_config_path.read_text(encoding="utf-8-sig"),
+        ):
+            add_check(
+                checks,
+                "VC-039",
+                "Metro Inline Requires",
+                "Conditional",
+                "pass",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-039",
+                "Metro Inline Requires",
+                "Conditional",
+                "fail",
+                f"{metro_config_path.name} does not enable inlineRequires in "
+                "transformer.getTransformOptions.",
+                started=check_started,
+            )
 
-                        if p0_implementation_failures:
-                            add_check(
-                                checks,
-                                "VC-028",
-                                "P0 Implementation Evidence",
-                                "Blocker",
-                                "fail",
-                                " | ".join(p0_implementation_failures[:12]),
-                            )
-                        else:
-                            add_check(
-                                checks,
-                                "VC-028",
-                                "P0 Implementation Evidence",
-                                "Blocker",
-                                "pass",
-                            )
+        check_started = time.monotonic()
+        dependencies = pkg.get("dependencies") if isinstance(pkg, dict) else None
+        dependencies = dependencies if isinstance(dependencies, dict) else {}
+        fallback_timeout = runtime_config["fallbackToCacheTimeout"]
+        check_automatically = runtime_config["checkAutomatically"] or "ON_LOAD"
+        if app_config_unresolved:
+            add_check(
+                checks,
+                "VC-040",
+                "Updates Launch Policy",
+                "Conditional",
+                "skipped",
+                APP_CONFIG_UNRESOLVED_REASON,
+                started=check_started,
+            )
+        elif "expo-updates" not in dependencies and not runtime_config["hasUpdatesConfig"]:
+            add_check(
+                checks,
+                "VC-040",
+                "Updates Launch Policy",
+                "Conditional",
+                "skipped",
+                "expo-updates is not installed.",
+                started=check_started,
+            )
+        elif runtime_config["updatesEnabled"] is False:
+            add_check(
+                checks,
+                "VC-040",
+                "Updates Launch Policy",
+                "Conditional",
+                "pass",
+                "updates.enabled is false.",
+                started=check_started,
+            )
+        elif (
+            isinstance(fallback_timeout, int)
+            and fallback_timeout > 0
+            and check_automatically not in UPDATES_NON_BLOCKING_CHECKS
+        ):
+            add_check(
+                checks,
+                "VC-040",
+                "Updates Launch Policy",
+                "Conditional",
+                "fail",
+                f"updates.fallbackToCacheTimeout is {fallback_timeout} ms with "
+                f"checkAutomatically {check_automatically}, so launch waits for the update "
+                "download. Set it to 0 and apply new updates on the next launch.",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-040",
+                "Updates Launch Policy",
+                "Conditional",
+                "pass",
+                f"checkAutomatically {check_automatically}, launch does not wait for updates.",
+                started=check_started,
+            )
 
-                        has_module_features = any(
-                            req_id.startswith("FR-") and not req_id.startswith("FR-GLOB-")
-                            for req_id in prd_requirement_ids
-                        )
-                        if has_module_features:
-                            custom_tests = sorted(
-                                path
-                                for path in referenced_test_paths
-                                if path not in BASELINE_TEST_FILES
-                            )
-                            if custom_tests:
-                                add_check(
-                                    checks,
-                                    "VC-029",
-                                    "Custom Feature Test Coverage",
-                                    "Blocker",
-                                    "pass",
-                                    f"Custom feature tests: {', '.join(custom_tests[:6])}",
-                                )
-                            else:
-                                add_check(
-                                    checks,
-                                    "VC-029",
-                                    "Custom Feature Test Coverage",
-                                    "Blocker",
-                                    "fail",
-                                    "Only baseline tests are mapped. Add feature-specific tests for module requirements.",
-                                )
-                        else:
-                            add_check(
-                                checks,
-                                "VC-029",
-                                "Custom Feature Test Coverage",
-                                "Blocker",
-                                "skipped",
-                                "No module-specific FR requirements were found in PRD.",
-                            )
+        check_started = time.monotonic()
+        image_elements = react_native_image_elements(jsx_lint_results)
+        if not image_elements:
+            add_check(
+                checks,
+                "VC-041",
+                "expo-image For Rendered Images",
+                "Conditional",
+                "skipped",
+                "No react-native Image elements are rendered in app/ or src/.",
+                started=check_started,
+            )
+        elif "expo-image" in runtime_config["plugins"] or "expo-image" in dependencies:
+            add_check(
+                checks,
+                "VC-041",
+                "expo-image For Rendered Images",
+                "Conditional",
+                "pass",
+                started=check_started,
+            )
+        elif app_config_unresolved:
+            add_check(
+                checks,
+                "VC-041",
+                "expo-image For Rendered Images",
+                "Conditional",
+                "skipped",
+                APP_CONFIG_UNRESOLVED_REASON,
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-041",
+                "expo-image For Rendered Images",
+                "Conditional",
+                "fail",
+                f"{len(image_elements)} react-native Image elements are rendered but expo-image "
+                "is neither installed nor listed in plugins; react-native Image has no disk "
+                "cache or downsampling: " + "; ".join(image_elements[:5]),
+                started=check_started,
+            )
 
-        placeholder_findings = scan_placeholder_markers(project_dir)
-        if placeholder_findings:
+        check_started = time.monotonic()
+        asset_index = build_asset_index(
+            project_dir,
+            hash_cache,
+            cache_dir,
+            configured_image_assets(project_dir, use_app_config_ts, app_config_ts),
+        )
+        icon_problems = icon_and_splash_problems(asset_index)
+        if app_config_unresolved:
             add_check(
                 checks,
-                "VC-030",
-                "Placeholder Marker Scan",
+                "VC-042",
+                "App Icon And Splash Dimensions",
+                "Blocker",
+                "skipped",
+                APP_CONFIG_UNRESOLVED_REASON,
+                started=check_started,
+            )
+        elif icon_problems:
+            add_check(
+                checks,
+                "VC-042",
+                "App Icon And Splash Dimensions",
                 "Blocker",
                 "fail",
-                "Found unresolved placeholder markers in source files.",
+                " ".join(icon_problems),
+                started=check_started,
+            )
+        elif asset_index["icon"] and asset_index["icon"].get("bundle"):
+            add_check(
+                checks,
+                "VC-042",
+                "App Icon And Splash Dimensions",
+                "Blocker",
+                "skipped",
+                f"App icon {asset_index['icon']['path']} is an Icon Composer bundle; its "
+                "layers are not measured.",
+                started=check_started,
             )
         else:
             add_check(
                 checks,
-                "VC-030",
-                "Placeholder Marker Scan",
+                "VC-042",
+                "App Icon And Splash Dimensions",
                 "Blocker",
                 "pass",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        asset_problems: list[str] = []
+        if asset_index["oversizedCount"]:
+            asset_problems.append(
+                f"{asset_index['oversizedCount']} images exceed "
+                f"{ASSET_OVERSIZED_BYTES // 1024} KiB: " + ", ".join(asset_index["oversized"][:5])
+            )
+        if asset_index["overscaledCount"]:
+            asset_problems.append(
+                f"{asset_index['overscaledCount']} images are larger than any iOS screen "
+                f"({ASSET_MAX_RENDER_DIMENSION} px): " + ", ".join(asset_index["overscaled"][:5])
+            )
+        asset_summary = (
+            f"{asset_index['images']} images, {asset_index['totalBytes'] // 1024} KiB, "
+            f"{asset_index['unreferencedCount']} not referenced from source or app config"
+        )
+        if asset_problems:
+            add_check(
+                checks,
+                "VC-043",
+                "Image Asset Optimization",
+                "Conditional",
+                "fail",
+                "; ".join(asset_problems) + f" ({asset_summary}).",
+                started=check_started,
+            )
+        else:
+            add_check(
+                checks,
+                "VC-043",
+                "Image Asset Optimization",
+                "Conditional",
+                "pass",
+                asset_summary + ".",
+                started=check_started,
+            )
+
+        check_started = time.monotonic()
+        if isinstance(project_dir, GitRevisionPath) or not (project_dir / "node_modules").is_dir():
+            for check_id, check_name, blocking in (
+                ("VC-044", "Required-Reason API Declarations", "Blocker"),
+                ("VC-045", "PRD Privacy Section Coverage", "Conditional"),
+            ):
+                add_check(
+                    checks,
+                    check_id,
+                    check_name,
+                    blocking,
+                    "skipped",
+                    "node_modules is not installed; run npm ci before validating.",
+                    started=check_started,
+                )
+        else:
+            privacy_api_scan = build_privacy_api_scan(
+                project_dir,
+                cache_dir,
+                app_declared_privacy_categories(project_dir, use_app_config_ts, app_config_ts),
+            )
+            privacy_summary = (
+                f"{privacy_api_scan['packagesScanned']} native packages "
+                f"({privacy_api_scan['packagesReused']} known from cache)"
+            )
+            if privacy_api_scan["undeclaredCount"] and app_config_unresolved:
+                add_check(
+                    checks,
+                    "VC-044",
+                    "Required-Reason API Declarations",
+                    "Blocker",
+                    "skipped",
+                    APP_CONFIG_UNRESOLVED_REASON,
+                    started=check_started,
+                )
+            elif privacy_api_scan["undeclaredCount"]:
+                add_check(
+                    checks,
+                    "VC-044",
+                    "Required-Reason API Declarations",
+                    "Blocker",
+                    "fail",
+                    f"{privacy_api_scan['undeclaredCount']} required-reason API uses are not "
+                    "covered by a package or app privacy manifest; declare them under "
+                    "expo.ios.privacyManifests.NSPrivacyAccessedAPITypes with a reason code: "
+                    + "; ".join(privacy_api_scan["undeclared"][:5]),
+                    started=check_started,
+                )
+            else:
+                add_check(
+                    checks,
+                    "VC-044",
+                    "Required-Reason API Declarations",
+                    "Blocker",
+                    "pass",
+                    privacy_summary + ".",
+                    started=check_started,
+                )
+
+            check_started = time.monotonic()
+            prd_privacy_section = (
+                extract_prd_privacy_section(prd_path.read_text(encoding="utf-8-sig"))
+                if prd_path.is_file()
+                else None
+            )
+            if not privacy_api_scan["appResponsible"]:
+                add_check(
+                    checks,
+                    "VC-045",
+                    "PRD Privacy Section Coverage",
+                    "Conditional",
+                    "pass",
+                    "No required-reason APIs need app-level declarations.",
+                    started=check_started,
+                )
+            elif prd_privacy_section is None:
+                add_check(
+                    checks,
+                    "VC-045",
+                    "PRD Privacy Section Coverage",
+                    "Conditional",
+                    "fail" if prd_path.is_file() else "skipped",
+                    "PRD has no privacy section."
+                    if prd_path.is_file()
+                    else "Skipped because PRD could not be loaded.",
+                    started=check_started,
+                )
+            else:
+                section_text = prd_privacy_section.lower()
+                undocumented = [
+                    category
+                    for category in privacy_api_scan["appResponsible"]
+                    if category.lower() not in section_text
+                    and not any(term in section_text for term in PRIVACY_API_PRD_TERMS[category])
+                ]
+                if undocumented:
+                    add_check(
+                        checks,
+                        "VC-045",
+                        "PRD Privacy Section Coverage",
+                        "Conditional",
+                        "fail",
+                        "PRD privacy section does not mention required-reason APIs the app "
+                        "must declare: " + ", ".join(undocumented),
+                        started=check_started,
+                    )
+                else:
+                    add_check(
+                        checks,
+                        "VC-045",
+                        "PRD Privacy Section Coverage",
+                        "Conditional",
+                        "pass",
+                        started=check_started,
+                    )
+
+        check_started = time.monotonic()
+        native_project = build_native_project_summary(project_dir)
+        if native_project is None:
+            add_check(
+                checks,
+                "VC-046",
+                "Prebuilt iOS Project Consistency",
+                "Blocker",
+                "skipped",
+                "No prebuilt ios/ project; EAS generates it from app config.",
+                started=check_started,
+            )
+        else:
+            human_inputs_path = project_dir / "release" / "human-inputs.md"
+            native_drift = native_project_drift(
+                native_project,
+                extract_app_identity(project_dir, use_app_config_ts, app_config_ts),
+                bool(modules.get("withPush", False)),
+                parse_human_inputs_markdown(human_inputs_path)
+                if human_inputs_path.is_file()
+                else None,
+            )
+            if native_drift:
+                add_check(
+                    checks,
+                    "VC-046",
+                    "Prebuilt iOS Project Consistency",
+                    "Blocker",
+                    "fail",
+                    " | ".join(native_drift)
+                    + ". Re-run npx expo prebuild --platform ios --clean or update ios/ by hand.",
+                    started=check_started,
+                )
+            else:
+                add_check(
+                    checks,
+                    "VC-046",
+                    "Prebuilt iOS Project Consistency",
+                    "Blocker",
+                    "pass",
+                    f"{native_project['project']} matches app config "
+                    f"({', '.join(native_project['configurations']) or 'no'} configurations).",
+                    started=check_started,
+                )
+
+        check_started = time.monotonic()
+        if not (project_dir / "app").is_dir():
+            add_check(
+                checks,
+                "VC-047",
+                "Route Target Resolution",
+                "Conditional",
+                "skipped",
+                "app/ directory is missing.",
+                started=check_started,
             )
+        else:
+            route_manifest = build_route_index(project_dir, hash_cache, cache_dir)
+            route_summary = (
+                f"{route_manifest['references']} route references "
+                f"({route_manifest['deepLinkReferences']} in {DEEP_LINK_MODULE_PATH}) against "
+                f"{route_manifest['routes']} routes"
+            )
+            if route_manifest["unresolvedCount"]:
+                add_check(
+                    checks,
+                    "VC-047",
+                    "Route Target Resolution",
+                    "Conditional",
+                    "fail",
+                    f"{route_manifest['unresolvedCount']} route references match no screen "
+                    "under app/: " + "; ".join(route_manifest["unresolved"][:5]),
+                    started=check_started,
+                )
+            else:
+                add_check(
+                    checks,
+                    "VC-047",
+                    "Route Target Resolution",
+                    "Conditional",
+                    "pass",
+                    route_summary + ".",
+                    started=check_started,
+                )
+
+    # The fingerprint walks every input, so it is only computed for the history
+    # database; --skip-if-fingerprint and --journal pass theirs in.
+    input_fingerprint = getattr(args, "input_fingerprint", None)
+    if (
+        not input_fingerprint
+        and checks[0]["result"] == "pass"
+        and getattr(args, "history_db", None)
+    ):
+        input_fingerprint = compute_input_fingerprint(args, project_dir, hash_cache)
 
     infra_status = compute_infra_status(checks)
     feature_status = compute_feature_status(module_checks)
     status = compute_status(infra_status, feature_status, checks)
     finished_at = utc_now_iso()
 
-    for check in checks:
-        print_check_result(check)
-    for module_check in module_checks:
-        print_check_result(
-            {
-                "id": module_check["id"],
-                "name": module_check["name"],
-                "blocking": "Module",
-                "result": module_check["result"],
-                "reason": module_check.get("reason", ""),
-            }
-        )
-
-    if status == "pass":
-        print("Validation passed.")
-    elif status == "partial":
-        print("Validation partial: blockers passed but conditional or feature checks need follow-up.")
-    else:
-        print("Validation failed.")
-
     report = {
         "schemaVersion": 4,
         "status": status,
@@ -1669,7 +8423,10 @@ def main() -> int:
         "featureStatus": feature_status,
         "startedAt": started_at,
         "finishedAt": finished_at,
-        "projectDir": str(project_dir),
+        "projectDir": report_project_dir,
+        "gitRevision": git_tree.commit_id if git_tree else None,
+        "inputFingerprint": input_fingerprint or None,
+        "durationMs": int((time.monotonic() - run_started) * 1000),
         "checks": checks,
         "moduleChecks": module_checks,
         "failedChecks": [
@@ -1683,18 +8440,37 @@ def main() -> int:
         "missingRequirementMappings": missing_requirement_mappings,
         "p0ImplementationFailures": p0_implementation_failures,
         "placeholderFindings": placeholder_findings,
+        "placeholderBaseline": (
+            {
+                "path": placeholder_baseline.path,
+                "entries": len(placeholder_baseline.entries),
+                "acceptedCount": len(accepted_placeholder_findings),
+                "acceptedFindings": accepted_placeholder_findings[:20],
+            }
+            if placeholder_baseline is not None
+            else None
+        ),
+        "untouchedTemplateFiles": untouched_template_files,
+        "requirementTagFindings": requirement_tag_findings,
+        "secretFindings": secret_findings,
+        "localizationIndex": localization_index,
+        "accessibilityLint": accessibility_lint,
+        "performanceLint": performance_lint,
+        "assetIndex": asset_index,
+        "privacyApiScan": privacy_api_scan,
+        "nativeProject": native_project,
+        "routeManifest": route_manifest,
+        "gitHistorySecretScan": (
+            git_history_secret_scan.to_report() if git_history_secret_scan else None
+        ),
+        "sourceScanCoverage": source_scan_coverage.to_report(),
+        "remoteCache": remote_cache.to_report() if remote_cache else None,
     }
 
-    if args.report_path:
-        report_path = Path(args.report_path).resolve()
-        report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(
-            json.dumps(report, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
-        print(f"[OK] Wrote report: {report_path}")
-
-    return 0 if status == "pass" else 1
+    hash_cache.save()
+    if git_tree:
+        git_tree.close()
+    return report
 
 
 if __name__ == "__main__":
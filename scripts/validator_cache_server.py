@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Reference HTTP result cache for validate_expo_ios_project.py --remote-cache."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+CACHE_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_ENTRY_BYTES = 16 * 1024 * 1024
+
+
+class DiskCache:
+    """Entries stored as ``<root>/<key[:2]>/<key>``, evicted least recently used.
+
+    Reads refresh an entry's mtime; once the total size exceeds ``max_bytes``
+    the oldest entries are removed until it fits again.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        root.mkdir(parents=True, exist_ok=True)
+        self.sizes: dict[str, int] = {}
+        for path in root.glob("??/*"):
+            if CACHE_KEY_PATTERN.match(path.name):
+                self.sizes[path.name] = path.stat().st_size
+        self.total_bytes = sum(self.sizes.values())
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        path = self.path_for(key)
+        try:
+            body = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(body)
+        os.replace(temp_name, path)
+        with self.lock:
+            self.total_bytes += len(body) - self.sizes.get(key, 0)
+            self.sizes[key] = len(body)
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> None:
+        def last_used(key: str) -> int:
+            try:
+                return self.path_for(key).stat().st_mtime_ns
+            except OSError:
+                return 0
+
+        for key in sorted(self.sizes, key=last_used):
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= self.sizes.pop(key)
+
+
+def make_handler(cache: DiskCache, max_entry_bytes: int) -> type[BaseHTTPRequestHandler]:
+    class CacheRequestHandler(BaseHTTPRequestHandler):
+        def cache_key(self) -> str | None:
+            key = self.path.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+            if CACHE_KEY_PATTERN.match(key):
+                return key
+            self.send_error(400, "Expected /<sha256 hex key>")
+            return None
+
+        def do_GET(self) -> None:
+            key = self.cache_key()
+            if key is None:
+                return
+            body = cache.get(key)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_PUT(self) -> None:
+            key = self.cache_key()
+            if key is None:
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0 or length > max_entry_bytes:
+                self.send_error(413 if length > 0 else 411)
+                return
+            cache.put(key, self.rfile.read(length))
+            self.send_response(201)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:
+            if self.server.verbose:
+                super().log_message(format, *args)
+
+    return CacheRequestHandler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", required=True, help="Directory that stores cache entries.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help="Total size above which least recently used entries are evicted.",
+    )
+    parser.add_argument("--max-entry-bytes", type=int, default=DEFAULT_MAX_ENTRY_BYTES)
+    parser.add_argument("--verbose", action="store_true", help="Log every request.")
+    args = parser.parse_args()
+
+    cache = DiskCache(Path(args.root).resolve(), args.max_bytes)
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(cache, args.max_entry_bytes)
+    )
+    server.verbose = args.verbose
+    print(
+        f"[OK] Serving validator cache at http://{args.host}:{server.server_port}/ "
+        f"from {cache.root} ({len(cache.sizes)} entries, {cache.total_bytes} bytes)",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())